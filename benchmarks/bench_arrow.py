@@ -0,0 +1,60 @@
+import argparse
+import os
+import sys
+import tempfile
+import numpy as np
+import pyarrow
+from benchmarks.harness import best_seconds
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+from serialization.arrow_io import (
+    read_rectangles_parquet,
+    rectangles_from_arrow,
+    rectangles_to_arrow,
+    write_rectangles_parquet,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boxes", type=int, default=200000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    generator = np.random.default_rng(0)
+    corners = generator.uniform(0, 1920, size=(args.boxes, 2))
+    sizes = generator.uniform(1, 256, size=(args.boxes, 2))
+    array = RectangleArray(np.concatenate((corners, corners + sizes), axis=1))
+    columns = pyarrow.Table.from_batches([rectangles_to_arrow(array)])
+    listed = rectangles_to_arrow(array, list_column="bbox")
+
+    def per_row() -> None:
+        [
+            Rectangle(Point(row["x1"], row["y1"]), Point(row["x2"], row["y2"]))
+            for row in columns.to_pylist()
+        ]
+
+    directory = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, "boxes.parquet")
+
+    cases = {
+        "per_row_objects": per_row,
+        "columns_to_array": lambda: rectangles_from_arrow(columns),
+        "list_column_to_array": lambda: rectangles_from_arrow(
+            listed, list_column="bbox"
+        ),
+        "write_parquet": lambda: write_rectangles_parquet(array, path),
+        "read_parquet": lambda: list(read_rectangles_parquet(path)),
+    }
+    for name, function in cases.items():
+        seconds = best_seconds(function, args.repeats)
+        print(
+            f"{name:<22} boxes={args.boxes:<8} {seconds / args.boxes * 1e9:10.1f} ns/box"
+        )
+    directory.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+from typing import Tuple
+import argparse
+import sys
+import numpy as np
+from benchmarks.harness import median_latency_ms
+from data_types.rectangle_array import RectangleArray
+from ops.association import (
+    center_distance_cost,
+    gate,
+    greedy_assignment,
+    hungarian_assignment,
+    iou_cost,
+)
+
+
+def frames(
+    generator: np.random.Generator, count: int
+) -> Tuple[RectangleArray, RectangleArray]:
+    centers = generator.uniform(0, 3840, size=(count, 2))
+    sizes = generator.uniform(16, 128, size=(count, 2))
+    tracks = np.concatenate((centers - sizes / 2, centers + sizes / 2), axis=1)
+    motion = generator.normal(0, 4, size=(count, 2))
+    detections = tracks + np.tile(motion, 2) + generator.normal(0, 2, size=(count, 4))
+    order = generator.permutation(count)
+    return RectangleArray(tracks), RectangleArray(detections[order])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boxes", type=int, default=1000)
+    parser.add_argument("--max-iou-cost", type=float, default=0.7)
+    parser.add_argument("--max-distance", type=float, default=50.0)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    generator = np.random.default_rng(0)
+    tracks, detections = frames(generator, args.boxes)
+    raw_iou = iou_cost(tracks, detections)
+    gated_iou = gate(raw_iou, args.max_iou_cost)
+    gated_distance = gate(center_distance_cost(tracks, detections), args.max_distance)
+    cases = {
+        "iou_cost": lambda: iou_cost(tracks, detections),
+        "center_distance_cost": lambda: center_distance_cost(tracks, detections),
+        "gate": lambda: gate(raw_iou, args.max_iou_cost),
+        "greedy_iou": lambda: greedy_assignment(gated_iou),
+        "hungarian_iou": lambda: hungarian_assignment(gated_iou),
+        "greedy_distance": lambda: greedy_assignment(gated_distance),
+        "hungarian_distance": lambda: hungarian_assignment(gated_distance),
+    }
+    for name, function in cases.items():
+        latency = median_latency_ms(function, args.repeats)
+        print(f"{name:<22} boxes={args.boxes}x{args.boxes} median={latency:8.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
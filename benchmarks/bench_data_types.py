@@ -0,0 +1,137 @@
+from typing import Callable, Dict, List
+import argparse
+import json
+import sys
+import numpy as np
+from benchmarks.harness import (
+    load_results,
+    nanoseconds_per_item,
+    regressions,
+    report_line,
+    save_results,
+)
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.point_array import PointArray
+from data_types.rectangle_array import RectangleArray
+from utils.dict_utils import add_prefix_to_dict_keys, add_suffix_to_dict_keys
+
+DEFAULT_SIZES = (1, 100, 10000)
+OPERATORS = {
+    "add": lambda a, b: a + b,
+    "sub": lambda a, b: a - b,
+    "mul": lambda a, b: a * b,
+    "div": lambda a, b: a / b,
+}
+
+
+def data_type_cases(size: int) -> Dict[str, Callable[[], object]]:
+    generator = np.random.default_rng(size)
+    xyxy = generator.uniform(1, 100, size=(size, 4))
+    xyxy[:, 2:] += xyxy[:, :2]
+    rows = xyxy.tolist()
+    points = [Point(x, y) for x, y, _, _ in rows]
+    others = [Point(y, x) for x, y, _, _ in rows]
+    rectangles = [Rectangle.from_xyxy(*row) for row in rows]
+    shifted = [rect + 1 for rect in rectangles]
+    point_dicts = [point.to_xy() for point in points]
+    point_array = PointArray(xyxy[:, :2])
+    rectangle_array = RectangleArray(xyxy)
+
+    cases: Dict[str, Callable[[], object]] = {
+        "point_from_xy": lambda: [Point.from_xy(x, y) for x, y, _, _ in rows],
+        "rectangle_from_xyxy": lambda: [Rectangle.from_xyxy(*row) for row in rows],
+        "rectangle_from_xywh": lambda: [Rectangle.from_xywh(*row) for row in rows],
+        "point_eq": lambda: [a == b for a, b in zip(points, others)],
+        "rectangle_eq": lambda: [a == b for a, b in zip(rectangles, shifted)],
+        "point_to_xy": lambda: [point.to_xy() for point in points],
+        "point_as_int": lambda: [point.as_int() for point in points],
+        "rectangle_to_xyxy": lambda: [rect.to_xyxy() for rect in rectangles],
+        "rectangle_to_xywh": lambda: [rect.to_xywh() for rect in rectangles],
+        "rectangle_as_int": lambda: [rect.as_int() for rect in rectangles],
+        "dict_add_suffix": lambda: [
+            add_suffix_to_dict_keys(point, "1") for point in point_dicts
+        ],
+        "dict_add_prefix": lambda: [
+            add_prefix_to_dict_keys(point, "top_") for point in point_dicts
+        ],
+        "point_array_from_points": lambda: PointArray.from_points(points),
+        "rectangle_array_from_rectangles": lambda: RectangleArray.from_rectangles(
+            rectangles
+        ),
+        "rectangle_array_to_rectangles": lambda: rectangle_array.to_rectangles(),
+    }
+    for name, action in OPERATORS.items():
+        cases[f"point_{name}_point"] = lambda action=action: [
+            action(a, b) for a, b in zip(points, others)
+        ]
+        cases[f"point_{name}_scalar"] = lambda action=action: [
+            action(a, 2) for a in points
+        ]
+        cases[f"rectangle_{name}_point"] = lambda action=action: [
+            action(a, b) for a, b in zip(rectangles, others)
+        ]
+        cases[f"rectangle_{name}_scalar"] = lambda action=action: [
+            action(a, 2) for a in rectangles
+        ]
+        cases[f"point_array_{name}_scalar"] = lambda action=action: action(
+            point_array, 2
+        )
+        cases[f"rectangle_array_{name}_point"] = lambda action=action: action(
+            rectangle_array, point_array
+        )
+    return cases
+
+
+def run(
+    sizes: List[int], min_items: int, repeat: int, pattern: str
+) -> Dict[str, float]:
+    results = {}
+    for size in sizes:
+        for name, function in data_type_cases(size).items():
+            if pattern in name:
+                results[f"{name}[{size}]"] = nanoseconds_per_item(
+                    function, size, min_items, repeat
+                )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--min-items", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", default="", help="only run cases containing this")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--save", help="write results to this JSON baseline file")
+    parser.add_argument("--baseline", help="compare against this JSON baseline file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown relative to the baseline before failing",
+    )
+    args = parser.parse_args()
+
+    baseline = load_results(args.baseline) if args.baseline else {}
+    results = run(args.sizes, args.min_items, args.repeat, args.filter)
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+    else:
+        for name, value in results.items():
+            print(report_line(name, value, baseline, args.tolerance, unit="ns/item"))
+
+    if args.save:
+        save_results(args.save, results, {"sizes": args.sizes})
+    regressed = regressions(results, baseline, args.tolerance)
+    if regressed:
+        print(
+            f"{len(regressed)} case(s) regressed: {', '.join(regressed)}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+import argparse
+import sys
+import numpy as np
+from benchmarks.harness import best_seconds
+from data_types.fixed_point import FixedPointFormat
+from data_types.rectangle_array import RectangleArray
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boxes", type=int, default=1000000)
+    parser.add_argument("--fraction-bits", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    generator = np.random.default_rng(0)
+    corners = generator.uniform(0, 1920, size=(args.boxes, 2))
+    sizes = generator.uniform(1, 256, size=(args.boxes, 2))
+    floats = RectangleArray(np.concatenate((corners, corners + sizes), axis=1))
+    fixed_format = FixedPointFormat(args.fraction_bits)
+    fixed = fixed_format.encode(floats)
+    float_window = RectangleArray(np.array([[100.0, 100.0, 1500.0, 900.0]]))
+    fixed_window = fixed_format.encode(float_window)
+    float_copy = RectangleArray(floats.xyxy.copy())
+    fixed_copy = RectangleArray(fixed.xyxy.copy())
+
+    cases = {
+        "area": (lambda: floats.clamped_area, lambda: fixed.clamped_area),
+        "intersection": (
+            lambda: floats.intersection(float_window),
+            lambda: fixed.intersection(fixed_window),
+        ),
+        "eq": (lambda: floats == float_copy, lambda: fixed == fixed_copy),
+    }
+    for name, (float_case, fixed_case) in cases.items():
+        float_seconds = best_seconds(float_case, args.repeats)
+        fixed_seconds = best_seconds(fixed_case, args.repeats)
+        print(
+            f"{name:<14} boxes={args.boxes:<8} float64={float_seconds * 1000:8.2f}ms "
+            f"fixed int64={fixed_seconds * 1000:8.2f}ms "
+            f"speedup={float_seconds / fixed_seconds:6.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+from typing import List, Tuple
+import argparse
+import json
+import subprocess
+import sys
+import numpy as np
+
+IMPORT_CASES = {
+    "baseline": "pass",
+    "data_types": "import data_types",
+    "Point": "from data_types import Point",
+    "Rectangle": "from data_types import Rectangle",
+    "RectangleArray": "from data_types import RectangleArray",
+    "ops": "import ops",
+    "nms": "from ops.nms import nms",
+    "spatial": "import spatial",
+    "serialization": "import serialization",
+}
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed * 1000, 'numpy' in sys.modules)
+"""
+
+
+def import_latency(statement: str) -> Tuple[float, bool]:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return float(output[0]), output[1] == "True"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for name, statement in IMPORT_CASES.items():
+        timings: List[float] = []
+        for _ in range(args.repeats):
+            milliseconds, loads_numpy = import_latency(statement)
+            timings.append(milliseconds)
+        results[name] = {
+            "median_ms": float(np.median(timings)),
+            "loads_numpy": loads_numpy,
+        }
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, result in results.items():
+            print(
+                f"{name:<15} median={result['median_ms']:8.2f}ms "
+                f"numpy={'yes' if result['loads_numpy'] else 'no'}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+import argparse
+import sys
+import numpy as np
+from benchmarks.harness import best_seconds
+from data_types.point import Point
+from data_types.point_array import PointArray
+from spatial.kdtree import KDTree
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=10000)
+    parser.add_argument("--k", type=int, default=8)
+    parser.add_argument("--radius", type=float, default=10.0)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    generator = np.random.default_rng(0)
+    points = PointArray(generator.uniform(0, 1920, size=(args.points, 2)))
+    queries = PointArray(generator.uniform(0, 1920, size=(args.queries, 2)))
+    tree = KDTree.from_points(points)
+    point_objects = points.to_points()
+    query_objects = queries[:20].to_points()
+
+    def relative_to_loop() -> None:
+        for query in query_objects:
+            offsets = [point.relative_to(query) for point in point_objects]
+            sorted(
+                range(len(offsets)),
+                key=lambda index: offsets[index].x ** 2 + offsets[index].y ** 2,
+            )[: args.k]
+
+    def numpy_brute_force() -> None:
+        for start in range(0, len(queries), 64):
+            chunk = queries.xy[start : start + 64]
+            distances = ((points.xy[None, :, :] - chunk[:, None, :]) ** 2).sum(axis=-1)
+            np.argpartition(distances, args.k - 1, axis=1)[:, : args.k]
+
+    def brute_single_nearest() -> None:
+        for _ in range(100):
+            distances = ((points.xy - (50, 50)) ** 2).sum(axis=1)
+            np.argpartition(distances, args.k - 1)[: args.k]
+
+    def appended() -> None:
+        appending = KDTree(points.xy[: args.points // 2])
+        for start in range(args.points // 2, args.points, 1000):
+            appending.extend(points[start : start + 1000])
+        appending.query(queries, k=args.k)
+
+    cases = {
+        "relative_to_loop": (relative_to_loop, len(query_objects), None),
+        "numpy_brute_force": (numpy_brute_force, args.queries, None),
+        "brute_single_nearest": (brute_single_nearest, 100, None),
+        "kdtree_build": (lambda: KDTree.from_points(points), args.points, None),
+        "kdtree_knn": (
+            lambda: tree.query(queries, k=args.k),
+            args.queries,
+            "numpy_brute_force",
+        ),
+        "kdtree_radius": (
+            lambda: tree.query_radius(queries, args.radius),
+            args.queries,
+            "numpy_brute_force",
+        ),
+        "kdtree_single_nearest": (
+            lambda: [tree.nearest(Point(50, 50), args.k) for _ in range(100)],
+            100,
+            "brute_single_nearest",
+        ),
+        "kdtree_append_knn": (appended, args.queries, "numpy_brute_force"),
+    }
+    per_item = {}
+    for name, (function, count, brute) in cases.items():
+        per_item[name] = best_seconds(function, args.repeats) / count
+        line = (
+            f"{name:<22} points={args.points:<8} {per_item[name] * 1e6:10.2f} us/item"
+        )
+        if brute:
+            line += f" vs_brute={per_item[brute] / per_item[name]:8.2f}x"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+from typing import Callable, List
+import argparse
+import tracemalloc
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+
+
+class DictPoint(Point):
+    pass
+
+
+class DictRectangle(Rectangle):
+    pass
+
+
+def bytes_per_object(factory: Callable[[int], object], count: int) -> float:
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objects: List[object] = [factory(index) for index in range(count)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    list_overhead = 8 * len(objects)
+    return (end - start - list_overhead) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    cases = {
+        "Point": (
+            lambda index: DictPoint(float(index), float(index)),
+            lambda index: Point(float(index), float(index)),
+        ),
+        "Rectangle": (
+            lambda index: DictRectangle(
+                DictPoint(float(index), float(index)),
+                DictPoint(float(index + 1), float(index + 1)),
+            ),
+            lambda index: Rectangle(
+                Point(float(index), float(index)),
+                Point(float(index + 1), float(index + 1)),
+            ),
+        ),
+    }
+    for name, (before, after) in cases.items():
+        dict_bytes = bytes_per_object(before, args.count)
+        slot_bytes = bytes_per_object(after, args.count)
+        print(
+            f"{name:<10} __dict__={dict_bytes:7.1f}B  __slots__={slot_bytes:7.1f}B  "
+            f"saved={100 * (1 - slot_bytes / dict_bytes):5.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
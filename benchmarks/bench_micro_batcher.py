@@ -0,0 +1,83 @@
+from typing import List, Union
+import argparse
+import asyncio
+import sys
+import time
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from ops.pipeline import RectanglePipeline
+from service.micro_batcher import LocalClient, MicroBatcher
+
+
+async def serve(
+    pipeline: RectanglePipeline,
+    requests: List[Union[Rectangle, List[Rectangle]]],
+    clients: int,
+    max_batch_size: int,
+    max_delay: float,
+) -> dict:
+    async with MicroBatcher(pipeline.apply, max_batch_size, max_delay) as batcher:
+        client = LocalClient(batcher)
+
+        async def worker(offset: int) -> None:
+            for request in requests[offset::clients]:
+                await client.process(request)
+
+        await asyncio.gather(*(worker(offset) for offset in range(clients)))
+        return batcher.metrics.snapshot()
+
+
+def percentile_ns(histogram: dict, fraction: float) -> int:
+    total = sum(histogram.values())
+    seen = 0
+    for bucket, hits in sorted(histogram.items()):
+        seen += hits
+        if seen >= fraction * total:
+            return bucket
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--boxes-per-request", type=int, default=1)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 16, 256])
+    parser.add_argument("--max-batch-size", type=int, default=1024)
+    parser.add_argument("--max-delay", type=float, default=0.002)
+    args = parser.parse_args()
+
+    generator = np.random.default_rng(0)
+    rows = generator.uniform(0, 1000, size=(args.requests, 4)).tolist()
+    rectangles = [Rectangle.from_xywh(*row) for row in rows]
+    size = args.boxes_per_request
+    requests = (
+        rectangles
+        if size == 1
+        else [rectangles[i : i + size] for i in range(0, len(rectangles), size)]
+    )
+    pipeline = RectanglePipeline().translate(Point(-8, -8)).scale(0.5).to_xyxy()
+
+    start = time.perf_counter()
+    for row in rows:
+        rect = Rectangle.from_xywh(*row)
+        ((rect + Point(-8, -8)) * 0.5).to_xyxy()
+    seconds = time.perf_counter() - start
+    print(f"per_box              boxes/s={args.requests / seconds:12.0f}")
+
+    for clients in args.clients:
+        metrics = asyncio.run(
+            serve(pipeline, requests, clients, args.max_batch_size, args.max_delay)
+        )
+        latency = metrics["latency"]["request"]["histogram_ns"]
+        print(
+            f"micro_batched c={clients:<4} boxes/s={metrics['boxes_per_second']:12.0f} "
+            f"mean_batch={metrics['mean_batch_boxes']:7.1f} "
+            f"p50<={percentile_ns(latency, 0.5) / 1e6:7.3f}ms "
+            f"p99<={percentile_ns(latency, 0.99) / 1e6:7.3f}ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+import argparse
+import sys
+import numpy as np
+from benchmarks.harness import median_latency_ms
+from data_types.rectangle_array import RectangleArray
+from ops.nms import nms, soft_nms, batched_nms
+
+
+def detections(
+    generator: np.random.Generator, count: int, per_object: int = 50
+) -> RectangleArray:
+    objects = max(1, count // per_object)
+    centers = generator.uniform(0, 1920, size=(objects, 2))
+    sizes = generator.uniform(16, 256, size=(objects, 2))
+    xyxy = np.concatenate((centers - sizes / 2, centers + sizes / 2), axis=1)
+    owners = generator.integers(0, objects, size=count)
+    jitter = generator.normal(0, 0.08, size=(count, 4)) * np.tile(sizes[owners], 2)
+    return RectangleArray(xyxy[owners] + jitter)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boxes", type=int, default=10000)
+    parser.add_argument("--classes", type=int, default=80)
+    parser.add_argument("--iou-threshold", type=float, default=0.5)
+    parser.add_argument("--target-ms", type=float, default=25.0)
+    parser.add_argument("--soft-target-ms", type=float, default=100.0)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    generator = np.random.default_rng(0)
+    boxes = detections(generator, args.boxes)
+    scores = generator.uniform(0, 1, size=args.boxes)
+    classes = generator.integers(0, args.classes, size=args.boxes)
+    cases = {
+        "nms": (lambda: nms(boxes, scores, args.iou_threshold), args.target_ms),
+        "batched_nms": (
+            lambda: batched_nms(boxes, scores, classes, args.iou_threshold),
+            args.target_ms,
+        ),
+        "soft_nms": (
+            lambda: soft_nms(boxes, scores, score_threshold=0.05),
+            args.soft_target_ms,
+        ),
+    }
+
+    failed = False
+    for name, (function, target) in cases.items():
+        latency = median_latency_ms(function, args.repeats)
+        status = "ok" if latency <= target else "SLOW"
+        failed = failed or latency > target
+        print(
+            f"{name:<12} boxes={args.boxes:<7} median={latency:8.2f}ms "
+            f"target={target:.1f}ms {status}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
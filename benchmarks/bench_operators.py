@@ -0,0 +1,71 @@
+from typing import Callable, Dict
+import argparse
+import sys
+from benchmarks.harness import (
+    load_results,
+    nanoseconds_per_item,
+    regressions,
+    report_line,
+    save_results,
+)
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+
+
+def operator_cases() -> Dict[str, Callable[[], object]]:
+    point = Point(3, 4)
+    other = Point(1.5, 2.5)
+    rect = Rectangle.from_xyxy(1, 2, 30, 40)
+    return {
+        "point_add_point": lambda: point + other,
+        "point_add_scalar": lambda: point + 2,
+        "point_sub_point": lambda: point - other,
+        "point_sub_scalar": lambda: point - 2,
+        "point_mul_point": lambda: point * other,
+        "point_mul_scalar": lambda: point * 2,
+        "point_div_point": lambda: point / other,
+        "point_div_scalar": lambda: point / 2,
+        "point_eq": lambda: point == other,
+        "rectangle_add_point": lambda: rect + other,
+        "rectangle_add_scalar": lambda: rect + 2,
+        "rectangle_sub_point": lambda: rect - other,
+        "rectangle_sub_scalar": lambda: rect - 2,
+        "rectangle_mul_point": lambda: rect * other,
+        "rectangle_mul_scalar": lambda: rect * 2,
+        "rectangle_div_point": lambda: rect / other,
+        "rectangle_div_scalar": lambda: rect / 2,
+        "rectangle_eq": lambda: rect == rect,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="write results to this JSON baseline file")
+    parser.add_argument("--baseline", help="compare against this JSON baseline file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown relative to the baseline before failing",
+    )
+    args = parser.parse_args()
+
+    baseline = load_results(args.baseline) if args.baseline else {}
+    results = {}
+    for name, function in operator_cases().items():
+        results[name] = nanoseconds_per_item(function, 1, args.number, args.repeat)
+        print(report_line(name, results[name], baseline, args.tolerance))
+
+    if args.save:
+        save_results(args.save, results)
+    regressed = regressions(results, baseline, args.tolerance)
+    if regressed:
+        print(f"{len(regressed)} operator(s) regressed: {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
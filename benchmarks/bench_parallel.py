@@ -0,0 +1,64 @@
+from typing import List
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import os
+import sys
+import numpy as np
+from benchmarks.bench_nms import detections
+from benchmarks.harness import median_latency_ms
+from ops.parallel import parallel_pairwise_iou, parallel_to_xywh
+
+
+def worker_counts(maximum: int) -> List[int]:
+    counts = [1]
+    while counts[-1] * 2 <= maximum:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != maximum:
+        counts.append(maximum)
+    return counts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boxes", type=int, default=1000000)
+    parser.add_argument("--iou-boxes", type=int, default=20000)
+    parser.add_argument("--iou-against", type=int, default=500)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    generator = np.random.default_rng(0)
+    boxes = detections(generator, args.boxes)
+    iou_boxes = boxes[: args.iou_boxes]
+    against = boxes[: args.iou_against]
+    cases = {
+        "to_xywh": (
+            lambda workers, pool: parallel_to_xywh(boxes, workers, pool),
+            len(boxes),
+        ),
+        "pairwise_iou": (
+            lambda workers, pool: parallel_pairwise_iou(
+                iou_boxes, against, workers, pool
+            ),
+            len(iou_boxes) * len(against),
+        ),
+    }
+
+    for name, (function, items) in cases.items():
+        single = None
+        for workers in worker_counts(args.max_workers):
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                function(workers, pool)
+                latency = median_latency_ms(
+                    lambda: function(workers, pool), args.repeats
+                )
+            single = single or latency
+            print(
+                f"{name:<13} workers={workers:<3} median={latency:9.2f}ms "
+                f"throughput={items / latency * 1000:14.0f}/s speedup={single / latency:5.2f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
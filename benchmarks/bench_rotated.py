@@ -0,0 +1,77 @@
+import argparse
+import math
+import sys
+import numpy as np
+from benchmarks.harness import best_seconds
+from data_types.rotated_rectangle_array import RotatedRectangleArray
+from ops.iou import pairwise_iou, pairwise_rotated_iou
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boxes", type=int, default=100000)
+    parser.add_argument("--pairwise-boxes", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    generator = np.random.default_rng(0)
+
+    def rotated(count: int, centers: np.ndarray) -> RotatedRectangleArray:
+        return RotatedRectangleArray(
+            np.concatenate(
+                (
+                    centers,
+                    generator.uniform(8, 64, size=(count, 2)),
+                    generator.uniform(-math.pi, math.pi, size=(count, 1)),
+                ),
+                axis=1,
+            )
+        )
+
+    centers = generator.uniform(0, 1920, size=(args.boxes, 2))
+    first = rotated(args.boxes, centers)
+    second = rotated(args.boxes, centers + generator.normal(0, 8, (args.boxes, 2)))
+    aligned_first = first.bounding_rectangles()
+    aligned_second = second.bounding_rectangles()
+    polygons = first.to_polygons()
+    count = args.pairwise_boxes
+    pairwise_first, pairwise_second = first[:count], second[:count]
+
+    cases = {
+        "rectangle_array_area": (lambda: aligned_first.area, args.boxes),
+        "rotated_area": (lambda: first.area, args.boxes),
+        "polygon_area": (lambda: polygons.area, args.boxes),
+        "rectangle_array_contains": (
+            lambda: aligned_first.contains(first.center),
+            args.boxes,
+        ),
+        "rotated_contains": (lambda: first.contains(second.center), args.boxes),
+        "polygon_contains": (lambda: polygons.contains(second.center), args.boxes),
+        "rotated_iou": (lambda: first.iou(second), args.boxes),
+        "pairwise_iou": (
+            lambda: pairwise_iou(aligned_first[:count], aligned_second[:count]),
+            count * count,
+        ),
+        "pairwise_rotated_iou": (
+            lambda: pairwise_rotated_iou(pairwise_first, pairwise_second),
+            count * count,
+        ),
+        "rotated_iou_scalar": (
+            lambda: [
+                a.iou(b)
+                for a, b in zip(
+                    pairwise_first.to_rotated_rectangles(),
+                    pairwise_second.to_rotated_rectangles(),
+                )
+            ],
+            count,
+        ),
+    }
+    for name, (function, items) in cases.items():
+        seconds = best_seconds(function, args.repeats)
+        print(f"{name:<26} items={items:<8} {seconds / items * 1e9:10.1f} ns/item")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
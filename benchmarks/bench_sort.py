@@ -0,0 +1,42 @@
+from operator import attrgetter
+import argparse
+import sys
+import numpy as np
+from benchmarks.harness import best_seconds
+from data_types.rectangle import FrozenRectangle, Rectangle
+from data_types.rectangle_array import RectangleArray
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boxes", type=int, default=1000000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    generator = np.random.default_rng(0)
+    corners = generator.uniform(0, 1920, size=(args.boxes, 2))
+    sizes = generator.uniform(1, 256, size=(args.boxes, 2))
+    array = RectangleArray(np.concatenate((corners, corners + sizes), axis=1))
+    rows = array.xyxy.tolist()
+    rectangles = [Rectangle.from_xyxy(*row) for row in rows]
+    frozen = [FrozenRectangle.from_xyxy(*row) for row in rows]
+    area = attrgetter("area")
+
+    cases = {
+        "Rectangle": lambda: sorted(rectangles, key=area),
+        "FrozenRectangle": lambda: sorted(frozen, key=area),
+        "RectangleArray": lambda: array[np.argsort(array.area, kind="stable")],
+    }
+    reference = None
+    for name, function in cases.items():
+        seconds = best_seconds(function, args.repeats)
+        reference = reference or seconds
+        print(
+            f"sort_by_area {name:<16} boxes={args.boxes:<8} best={seconds * 1000:9.1f}ms "
+            f"speedup={reference / seconds:6.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+from typing import List
+import argparse
+import sys
+import numpy as np
+from benchmarks.harness import best_seconds
+from data_types.rectangle_array import RectangleArray
+from ops.statistics import RectangleStatistics
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boxes", type=int, default=200000)
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    generator = np.random.default_rng(0)
+    corners = generator.uniform(0, 1920, size=(args.boxes, 2))
+    sizes = generator.uniform(1, 256, size=(args.boxes, 2))
+    array = RectangleArray(np.concatenate((corners, corners + sizes), axis=1))
+    rectangles = array.to_rectangles()
+
+    def recompute() -> None:
+        kept: List = []
+        for rect in rectangles:
+            kept.append(rect)
+            if len(kept) % args.chunk_size == 0:
+                widths = [r.width for r in kept]
+                sum(widths) / len(widths)
+                [r.area for r in kept]
+
+    def scalar() -> None:
+        statistics = RectangleStatistics()
+        for rect in rectangles:
+            statistics.update(rect)
+        statistics.snapshot()
+
+    def chunked() -> None:
+        RectangleStatistics.from_rectangles(array, args.chunk_size).snapshot()
+
+    def merged() -> None:
+        parts = [
+            RectangleStatistics.from_rectangles(part, args.chunk_size)
+            for part in np.array_split(np.arange(args.boxes), 8)
+            for part in [array[part]]
+        ]
+        total = RectangleStatistics()
+        for part in parts:
+            total.merge(part)
+
+    cases = {
+        "scalar_update": scalar,
+        "chunked_update": chunked,
+        "merged_workers": merged,
+    }
+    if args.boxes <= 20000:
+        cases["recompute_per_chunk"] = recompute
+    for name, function in cases.items():
+        seconds = best_seconds(function, args.repeats)
+        print(
+            f"{name:<22} boxes={args.boxes:<8} {seconds / args.boxes * 1e9:10.1f} ns/box"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
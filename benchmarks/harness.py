@@ -0,0 +1,70 @@
+from typing import Callable, Dict, List, Optional
+import json
+import platform
+import statistics
+import time
+import timeit
+
+Results = Dict[str, float]
+
+
+def best_seconds(function: Callable[[], object], repeats: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def median_latency_ms(function: Callable[[], object], repeats: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def nanoseconds_per_item(
+    function: Callable[[], object], items: int, min_items: int, repeat: int
+) -> float:
+    number = max(1, min_items // max(items, 1))
+    best = min(timeit.repeat(function, number=number, repeat=repeat))
+    return best / (number * max(items, 1)) * 1e9
+
+
+def load_results(path: str) -> Results:
+    with open(path) as results_file:
+        return json.load(results_file)["results"]
+
+
+def save_results(path: str, results: Results, metadata: Optional[dict] = None) -> None:
+    document = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        **(metadata or {}),
+        "results": results,
+    }
+    with open(path, "w") as results_file:
+        json.dump(document, results_file, indent=2, sort_keys=True)
+
+
+def regressions(results: Results, baseline: Results, tolerance: float) -> List[str]:
+    return [
+        name
+        for name, value in results.items()
+        if name in baseline and value > baseline[name] * (1 + tolerance)
+    ]
+
+
+def report_line(
+    name: str, value: float, baseline: Results, tolerance: float, unit: str = "ns"
+) -> str:
+    line = f"{name:<40} {value:10.1f} {unit}"
+    if name in baseline:
+        ratio = value / baseline[name]
+        line += f"  baseline={baseline[name]:10.1f} {unit}  ratio={ratio:5.2f}"
+        if ratio > 1 + tolerance:
+            line += "  REGRESSION"
+    return line
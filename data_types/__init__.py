@@ -0,0 +1,25 @@
+from utils.lazy_import import lazy_exports
+
+_EXPORTS = {
+    "Point": ".point",
+    "FrozenPoint": ".point",
+    "Rectangle": ".rectangle",
+    "FrozenRectangle": ".rectangle",
+    "PointArray": ".point_array",
+    "Points": ".point_array",
+    "as_point_array": ".point_array",
+    "RectangleArray": ".rectangle_array",
+    "Rectangles": ".rectangle_array",
+    "as_rectangle_array": ".rectangle_array",
+    "Polygon": ".polygon",
+    "PolygonArray": ".polygon_array",
+    "RotatedRectangle": ".rotated_rectangle",
+    "RotatedRectangleArray": ".rotated_rectangle_array",
+    "Affine": ".affine",
+    "FixedPointFormat": ".fixed_point",
+    "instrumented": ".instrumentation",
+    "Recorder": ".instrumentation",
+}
+
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
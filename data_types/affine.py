@@ -0,0 +1,174 @@
+from typing import Tuple, Union
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.point_array import PointArray
+from data_types.rectangle_array import RectangleArray
+
+Size = Tuple[Union[int, float], Union[int, float]]
+Transformable = Union[Point, Rectangle, PointArray, RectangleArray]
+
+
+class Affine:
+    __slots__ = ("a", "b", "c", "d", "e", "f")
+
+    def __init__(
+        self,
+        a: Union[int, float],
+        b: Union[int, float],
+        c: Union[int, float],
+        d: Union[int, float],
+        e: Union[int, float],
+        f: Union[int, float],
+    ) -> None:
+        self.a, self.b, self.c = a, b, c
+        self.d, self.e, self.f = d, e, f
+
+    @staticmethod
+    def identity() -> "Affine":
+        return Affine(1, 0, 0, 0, 1, 0)
+
+    @staticmethod
+    def translation(dx: Union[int, float], dy: Union[int, float]) -> "Affine":
+        return Affine(1, 0, dx, 0, 1, dy)
+
+    @staticmethod
+    def scaling(sx: Union[int, float], sy: Union[int, float, None] = None) -> "Affine":
+        return Affine(sx, 0, 0, 0, sx if sy is None else sy, 0)
+
+    @staticmethod
+    def crop(box: Rectangle) -> "Affine":
+        return Affine.translation(-box.left, -box.top)
+
+    @staticmethod
+    def resize(source: Size, target: Size) -> "Affine":
+        return Affine.scaling(target[0] / source[0], target[1] / source[1])
+
+    @staticmethod
+    def crop_resize(box: Rectangle, target: Size) -> "Affine":
+        return Affine.crop(box).then(Affine.resize((box.width, box.height), target))
+
+    @staticmethod
+    def letterbox(source: Size, target: Size) -> "Affine":
+        scale = min(target[0] / source[0], target[1] / source[1])
+        return Affine(
+            scale,
+            0,
+            (target[0] - source[0] * scale) / 2,
+            0,
+            scale,
+            (target[1] - source[1] * scale) / 2,
+        )
+
+    @property
+    def is_axis_aligned(self) -> bool:
+        return self.b == 0 and self.d == 0
+
+    @property
+    def determinant(self) -> Union[int, float]:
+        return self.a * self.e - self.b * self.d
+
+    def then(self, other: "Affine") -> "Affine":
+        return other @ self
+
+    def inverse(self) -> "Affine":
+        determinant = self.determinant
+        if determinant == 0:
+            raise ValueError(f"Trying to invert singular transform {str(self)}")
+        a, b, d, e = (
+            self.e / determinant,
+            -self.b / determinant,
+            -self.d / determinant,
+            self.a / determinant,
+        )
+        return Affine(
+            a, b, -(a * self.c + b * self.f), d, e, -(d * self.c + e * self.f)
+        )
+
+    def _linear(self) -> np.ndarray:
+        return np.array(((self.a, self.d), (self.b, self.e)))
+
+    def _apply_xy(self, xy: np.ndarray) -> np.ndarray:
+        return xy @ self._linear() + np.array((self.c, self.f))
+
+    def apply(self, item: Transformable) -> Transformable:
+        if isinstance(item, Point):
+            return Point(
+                self.a * item.x + self.b * item.y + self.c,
+                self.d * item.x + self.e * item.y + self.f,
+            )
+        elif isinstance(item, Rectangle):
+            if self.is_axis_aligned:
+                x1, x2 = self.a * item.left + self.c, self.a * item.right + self.c
+                y1, y2 = self.e * item.top + self.f, self.e * item.bottom + self.f
+                return Rectangle(
+                    Point(min(x1, x2), min(y1, y2)), Point(max(x1, x2), max(y1, y2))
+                )
+            corners = [
+                self.apply(Point(x, y))
+                for x in (item.left, item.right)
+                for y in (item.top, item.bottom)
+            ]
+            return Rectangle(
+                Point(min(p.x for p in corners), min(p.y for p in corners)),
+                Point(max(p.x for p in corners), max(p.y for p in corners)),
+            )
+        elif isinstance(item, PointArray):
+            return PointArray(self._apply_xy(item.xy))
+        elif isinstance(item, RectangleArray):
+            corners = np.stack(
+                (
+                    item.xyxy[:, 0:2],
+                    item.xyxy[:, 2:4],
+                    item.xyxy[:, [0, 3]],
+                    item.xyxy[:, [2, 1]],
+                ),
+                axis=1,
+            )
+            if self.is_axis_aligned:
+                corners = corners[:, :2]
+            moved = self._apply_xy(corners)
+            return RectangleArray(
+                np.concatenate((moved.min(axis=1), moved.max(axis=1)), axis=1)
+            )
+        else:
+            raise ValueError(
+                f"Trying to transform non Point or Rectangle object {str(item)}"
+            )
+
+    def __call__(self, item: Transformable) -> Transformable:
+        return self.apply(item)
+
+    def __matmul__(self, other: "Affine") -> "Affine":
+        if isinstance(other, Affine):
+            return Affine(
+                self.a * other.a + self.b * other.d,
+                self.a * other.b + self.b * other.e,
+                self.a * other.c + self.b * other.f + self.c,
+                self.d * other.a + self.e * other.d,
+                self.d * other.b + self.e * other.e,
+                self.d * other.c + self.e * other.f + self.f,
+            )
+        else:
+            raise ValueError(
+                f"Trying to compose Affine {str(self)} with non Affine object {str(other)}"
+            )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Affine):
+            return (self.a, self.b, self.c, self.d, self.e, self.f) == (
+                other.a,
+                other.b,
+                other.c,
+                other.d,
+                other.e,
+                other.f,
+            )
+        else:
+            return False
+
+    def __hash__(self) -> int:
+        return hash((self.a, self.b, self.c, self.d, self.e, self.f))
+
+    def __str__(self) -> str:
+        return f"Affine({self.a},{self.b},{self.c},{self.d},{self.e},{self.f})"
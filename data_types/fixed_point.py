@@ -0,0 +1,130 @@
+from typing import Union
+import numpy as np
+from data_types.point import Point, SCALAR_TYPES
+from data_types.rectangle import Rectangle
+from data_types.point_array import PointArray
+from data_types.rectangle_array import RectangleArray
+
+Coordinates = Union[Point, Rectangle, PointArray, RectangleArray]
+
+
+def round_divide(numerator: int, denominator: int) -> int:
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient % 2 == 1):
+        quotient += 1
+    return quotient
+
+
+def round_divide_array(
+    numerator: np.ndarray, denominator: Union[int, np.ndarray]
+) -> np.ndarray:
+    sign = np.where(np.asarray(denominator) < 0, -1, 1)
+    numerator, denominator = numerator * sign, np.asarray(denominator) * sign
+    quotient, remainder = np.divmod(numerator, denominator)
+    twice = 2 * remainder
+    return quotient + (
+        (twice > denominator) | ((twice == denominator) & (quotient % 2 == 1))
+    )
+
+
+class FixedPointFormat:
+    __slots__ = ("fraction_bits", "scale")
+
+    def __init__(self, fraction_bits: int = 8) -> None:
+        if not 0 <= fraction_bits <= 30:
+            raise ValueError(
+                f"Fixed point fraction bits must be between 0 and 30, got {fraction_bits}"
+            )
+        self.fraction_bits = fraction_bits
+        self.scale = 1 << fraction_bits
+
+    def _map_scalars(self, item: Coordinates, function) -> Coordinates:
+        if isinstance(item, Point):
+            return Point(function(item.x), function(item.y))
+        elif isinstance(item, Rectangle):
+            return Rectangle(
+                self._map_scalars(item.top_left, function),
+                self._map_scalars(item.bottom_right, function),
+            )
+        else:
+            raise ValueError(
+                f"Trying to convert non Point or Rectangle object {str(item)}"
+            )
+
+    def encode(self, item: Coordinates) -> Coordinates:
+        scale = self.scale
+        if isinstance(item, PointArray):
+            return PointArray(np.rint(item.xy * scale).astype(np.int64))
+        elif isinstance(item, RectangleArray):
+            return RectangleArray(np.rint(item.xyxy * scale).astype(np.int64))
+        return self._map_scalars(item, lambda value: round(value * scale))
+
+    def decode(self, item: Coordinates) -> Coordinates:
+        scale = self.scale
+        if isinstance(item, PointArray):
+            return PointArray(item.xy / scale)
+        elif isinstance(item, RectangleArray):
+            return RectangleArray(item.xyxy / scale)
+        return self._map_scalars(item, lambda value: value / scale)
+
+    def divide(self, item: Coordinates, divisor: Union[int, Point]) -> Coordinates:
+        if isinstance(divisor, Point):
+            divisors = (divisor.x, divisor.y)
+        else:
+            divisors = (divisor, divisor)
+        if not all(isinstance(value, int) for value in divisors):
+            raise ValueError(
+                f"Trying to divide fixed point coordinates by non integer object {str(divisor)}"
+            )
+        if 0 in divisors:
+            raise ZeroDivisionError(f"Trying to divide {str(item)} by zero")
+        if isinstance(item, PointArray):
+            return PointArray(round_divide_array(item.xy, np.array(divisors)))
+        elif isinstance(item, RectangleArray):
+            return RectangleArray(round_divide_array(item.xyxy, np.array(divisors * 2)))
+        elif isinstance(item, Point):
+            return Point(
+                round_divide(item.x, divisors[0]), round_divide(item.y, divisors[1])
+            )
+        elif isinstance(item, Rectangle):
+            return Rectangle(
+                self.divide(item.top_left, divisor),
+                self.divide(item.bottom_right, divisor),
+            )
+        else:
+            raise ValueError(
+                f"Trying to divide non Point or Rectangle object {str(item)}"
+            )
+
+    def multiply(self, item: Coordinates, factor: Union[int, float]) -> Coordinates:
+        if not isinstance(factor, SCALAR_TYPES):
+            raise ValueError(
+                f"Trying to multiply fixed point coordinates by non scalar object {str(factor)}"
+            )
+        fixed_factor = round(factor * self.scale)
+        if isinstance(item, PointArray):
+            return PointArray(round_divide_array(item.xy * fixed_factor, self.scale))
+        elif isinstance(item, RectangleArray):
+            return RectangleArray(
+                round_divide_array(item.xyxy * fixed_factor, self.scale)
+            )
+        return self._map_scalars(
+            item, lambda value: round_divide(value * fixed_factor, self.scale)
+        )
+
+    def area(self, item: Union[Rectangle, RectangleArray]) -> Union[int, np.ndarray]:
+        if isinstance(item, RectangleArray):
+            return item.clamped_area
+        elif isinstance(item, Rectangle):
+            return max(item.width, 0) * max(item.height, 0)
+        else:
+            raise ValueError(f"Trying to measure non Rectangle object {str(item)}")
+
+    def decode_area(self, area: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
+        return area / (self.scale * self.scale)
+
+    def __str__(self) -> str:
+        return f"FixedPointFormat({self.fraction_bits})"
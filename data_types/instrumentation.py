@@ -0,0 +1,102 @@
+from typing import Callable, Dict, Iterator, List, Optional
+from contextlib import contextmanager
+from time import perf_counter_ns
+import functools
+from data_types.point import FrozenPoint, Point
+from data_types.rectangle import FrozenRectangle, Rectangle
+
+OPERATOR_METHODS = ("__add__", "__sub__", "__mul__", "__truediv__", "__eq__")
+INSTRUMENTED_METHODS = {
+    Point: ("__init__",) + OPERATOR_METHODS + ("as_int", "as_float", "to_xy", "to_yx"),
+    FrozenPoint: ("__init__",),
+    Rectangle: ("__init__",)
+    + OPERATOR_METHODS
+    + ("as_int", "as_float", "to_xyxy", "to_xywh"),
+    FrozenRectangle: ("__init__", "__add__", "__sub__", "__mul__", "__truediv__"),
+}
+
+_active: Optional["Recorder"] = None
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {}
+        self.total_ns: Dict[str, int] = {}
+        self.histograms: Dict[str, List[int]] = {}
+
+    def record(self, name: str, elapsed_ns: int) -> None:
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self.total_ns[name] = self.total_ns.get(name, 0) + elapsed_ns
+        histogram = self.histograms.setdefault(name, [])
+        bucket = elapsed_ns.bit_length()
+        if bucket >= len(histogram):
+            histogram.extend([0] * (bucket + 1 - len(histogram)))
+        histogram[bucket] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        return {
+            name: {
+                "count": count,
+                "total_ns": self.total_ns[name],
+                "histogram_ns": {
+                    1 << bucket: hits
+                    for bucket, hits in enumerate(self.histograms[name])
+                    if hits
+                },
+            }
+            for name, count in sorted(self.counts.items())
+        }
+
+    def reset(self) -> None:
+        self.counts.clear()
+        self.total_ns.clear()
+        self.histograms.clear()
+
+
+def _timed(name: str, function: Callable, recorder: Recorder) -> Callable:
+    record = recorder.record
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            record(name, perf_counter_ns() - start)
+
+    return wrapper
+
+
+def enable(recorder: Recorder) -> None:
+    global _active
+    if _active is not None:
+        raise RuntimeError("data_types instrumentation is already enabled")
+    _active = recorder
+    for cls, methods in INSTRUMENTED_METHODS.items():
+        for method in methods:
+            name = f"{cls.__name__}.{method}"
+            setattr(cls, method, _timed(name, cls.__dict__[method], recorder))
+
+
+def disable() -> None:
+    global _active
+    if _active is None:
+        return
+    for cls, methods in INSTRUMENTED_METHODS.items():
+        for method in methods:
+            setattr(cls, method, cls.__dict__[method].__wrapped__)
+    _active = None
+
+
+def is_enabled() -> bool:
+    return _active is not None
+
+
+@contextmanager
+def instrumented(recorder: Optional[Recorder] = None) -> Iterator[Recorder]:
+    recorder = Recorder() if recorder is None else recorder
+    enable(recorder)
+    try:
+        yield recorder
+    finally:
+        disable()
@@ -1,8 +1,12 @@
 from typing import Tuple, List, Union
 from collections import OrderedDict
 
+SCALAR_TYPES = (int, float)
+
 
 class Point:
+    __slots__ = ("x", "y")
+
     def __init__(self, x: Union[int, float], y: Union[int, float]) -> None:
         self.x = x
         self.y = y
@@ -16,10 +20,13 @@ class Point:
         return Point(x=x, y=y)
 
     def as_int(self) -> "Point":
-        return Point.from_xy(x=int(self.x), y=int(self.y))
+        return Point(int(self.x), int(self.y))
 
     def as_float(self) -> "Point":
-        return Point.from_xy(x=float(self.x), y=float(self.y))
+        return Point(float(self.x), float(self.y))
+
+    def freeze(self) -> "FrozenPoint":
+        return FrozenPoint(self.x, self.y)
 
     def to_xy(self) -> OrderedDict[str, Union[int, float]]:
         return OrderedDict(x=self.x, y=self.y)
@@ -32,17 +39,18 @@ class Point:
 
     def __eq__(self, __value: object) -> bool:
         if isinstance(__value, Point):
-            this_point = self.as_float()
-            other_point = __value.as_float()
-            return this_point.x == other_point.x and this_point.y == other_point.y
+            return self.x == __value.x and self.y == __value.y
         else:
             return False
 
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
     def __sub__(self, other: object) -> "Point":
         if isinstance(other, Point):
-            return Point.from_xy(x=self.x - other.x, y=self.y - other.y)
-        elif isinstance(other, Union[int, float]):
-            return Point.from_xy(x=self.x - other, y=self.y - other)
+            return Point(self.x - other.x, self.y - other.y)
+        elif isinstance(other, SCALAR_TYPES):
+            return Point(self.x - other, self.y - other)
         else:
             raise ValueError(
                 f"Trying to subtruct from Point {str(self)} with non Point object {str(other)}"
@@ -50,9 +58,9 @@ class Point:
 
     def __add__(self, other: object) -> "Point":
         if isinstance(other, Point):
-            return Point.from_xy(x=self.x + other.x, y=self.y + other.y)
-        elif isinstance(other, Union[int, float]):
-            return Point.from_xy(x=self.x + other, y=self.y + other)
+            return Point(self.x + other.x, self.y + other.y)
+        elif isinstance(other, SCALAR_TYPES):
+            return Point(self.x + other, self.y + other)
         else:
             raise ValueError(
                 f"Trying to add to Point {str(self)} with non Point object {str(other)}"
@@ -60,9 +68,9 @@ class Point:
 
     def __mul__(self, other: object) -> "Point":
         if isinstance(other, Point):
-            return Point.from_xy(x=self.x * other.x, y=self.y * other.y)
-        elif isinstance(other, Union[int, float]):
-            return Point.from_xy(x=self.x * other, y=self.y * other)
+            return Point(self.x * other.x, self.y * other.y)
+        elif isinstance(other, SCALAR_TYPES):
+            return Point(self.x * other, self.y * other)
         else:
             raise ValueError(
                 f"Trying to multiply Point {str(self)} with non Point object {str(other)}"
@@ -70,9 +78,9 @@ class Point:
 
     def __truediv__(self, other: object) -> "Point":
         if isinstance(other, Point):
-            return Point.from_xy(x=self.x / other.x, y=self.y / other.y)
-        elif isinstance(other, Union[int, float]):
-            return Point.from_xy(x=self.x / other, y=self.y / other)
+            return Point(self.x / other.x, self.y / other.y)
+        elif isinstance(other, SCALAR_TYPES):
+            return Point(self.x / other, self.y / other)
         else:
             raise ValueError(
                 f"Trying to multiply Point {str(self)} with non Point object {str(other)}"
@@ -80,3 +88,26 @@ class Point:
 
     def __str__(self) -> str:
         return f"Point({str(self.x)},{str(self.y)})"
+
+
+class FrozenPoint(Point):
+    __slots__ = ()
+
+    def __init__(self, x: Union[int, float], y: Union[int, float]) -> None:
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+
+    def freeze(self) -> "FrozenPoint":
+        return self
+
+    def thaw(self) -> Point:
+        return Point(self.x, self.y)
+
+    def __reduce__(self) -> Tuple[type, Tuple[Union[int, float], Union[int, float]]]:
+        return (FrozenPoint, (self.x, self.y))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"Cannot set {name} on immutable {str(self)}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Cannot delete {name} on immutable {str(self)}")
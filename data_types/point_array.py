@@ -0,0 +1,101 @@
+from typing import Iterable, Iterator, List, Union
+from collections import OrderedDict
+import numpy as np
+from utils.array_utils import as_coordinate_array
+from data_types.point import Point, SCALAR_TYPES
+
+
+class PointArray:
+    def __init__(self, xy: np.ndarray) -> None:
+        self.xy = as_coordinate_array(xy, columns=2)
+
+    @staticmethod
+    def from_xy(x: np.ndarray, y: np.ndarray) -> "PointArray":
+        return PointArray(np.stack(np.broadcast_arrays(x, y), axis=-1))
+
+    @staticmethod
+    def from_yx(y: np.ndarray, x: np.ndarray) -> "PointArray":
+        return PointArray.from_xy(x=x, y=y)
+
+    @staticmethod
+    def from_points(points: Iterable[Point]) -> "PointArray":
+        return PointArray([(point.x, point.y) for point in points])
+
+    def to_points(self) -> List[Point]:
+        return [Point.from_xy(x, y) for x, y in self.xy.tolist()]
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.xy[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.xy[:, 1]
+
+    def as_int(self) -> "PointArray":
+        return PointArray(self.xy.astype(np.int64))
+
+    def as_float(self) -> "PointArray":
+        return PointArray(self.xy.astype(np.float64))
+
+    def to_xy(self) -> OrderedDict[str, np.ndarray]:
+        return OrderedDict(x=self.x, y=self.y)
+
+    def to_yx(self) -> OrderedDict[str, np.ndarray]:
+        return OrderedDict(y=self.y, x=self.x)
+
+    def relative_to(self, other: Union[Point, "PointArray"]) -> "PointArray":
+        return self - other
+
+    def _operand(self, other: object, action: str) -> Union[int, float, np.ndarray]:
+        if isinstance(other, PointArray):
+            return other.xy
+        elif isinstance(other, Point):
+            return np.array((other.x, other.y))
+        elif isinstance(other, SCALAR_TYPES):
+            return other
+        else:
+            raise ValueError(
+                f"Trying to {action} PointArray {str(self)} with non Point object {str(other)}"
+            )
+
+    def __len__(self) -> int:
+        return self.xy.shape[0]
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self.to_points())
+
+    def __getitem__(self, index) -> Union[Point, "PointArray"]:
+        if isinstance(index, (int, np.integer)):
+            return Point.from_xy(*self.xy[index].tolist())
+        return PointArray(self.xy[index])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PointArray):
+            return self.xy.shape == other.xy.shape and bool(np.all(self.xy == other.xy))
+        else:
+            return False
+
+    def __sub__(self, other: object) -> "PointArray":
+        return PointArray(self.xy - self._operand(other, "subtract from"))
+
+    def __add__(self, other: object) -> "PointArray":
+        return PointArray(self.xy + self._operand(other, "add to"))
+
+    def __mul__(self, other: object) -> "PointArray":
+        return PointArray(self.xy * self._operand(other, "multiply"))
+
+    def __truediv__(self, other: object) -> "PointArray":
+        return PointArray(self.xy / self._operand(other, "divide"))
+
+    def __str__(self) -> str:
+        return f"PointArray({len(self)})"
+
+
+Points = Union[PointArray, Iterable[Point]]
+
+
+def as_point_array(points: Points) -> PointArray:
+    if isinstance(points, PointArray):
+        return points
+    return PointArray.from_points(points)
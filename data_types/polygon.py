@@ -0,0 +1,238 @@
+from typing import Iterator, List, Sequence, Tuple, Union
+from collections import OrderedDict
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+
+
+def _cross(origin: Point, first: Point, second: Point) -> Union[int, float]:
+    return (first.x - origin.x) * (second.y - origin.y) - (first.y - origin.y) * (
+        second.x - origin.x
+    )
+
+
+def _crossing_point(
+    start: Point,
+    end: Point,
+    start_side: Union[int, float],
+    end_side: Union[int, float],
+) -> Point:
+    t = start_side / (start_side - end_side)
+    return Point(start.x + t * (end.x - start.x), start.y + t * (end.y - start.y))
+
+
+def _inside_triangle(
+    point: Point, first: Point, second: Point, third: Point, orientation: int
+) -> bool:
+    return (
+        orientation * _cross(first, second, point) >= 0
+        and orientation * _cross(second, third, point) >= 0
+        and orientation * _cross(third, first, point) >= 0
+    )
+
+
+def _bounds_overlap(first: Rectangle, second: Rectangle) -> bool:
+    return (
+        first.left <= second.right
+        and second.left <= first.right
+        and first.top <= second.bottom
+        and second.top <= first.bottom
+    )
+
+
+class Polygon:
+    __slots__ = ("points",)
+
+    def __init__(self, points: List[Point]) -> None:
+        self.points = points
+
+    @staticmethod
+    def from_xy(
+        coordinates: Sequence[Tuple[Union[int, float], Union[int, float]]],
+    ) -> "Polygon":
+        return Polygon([Point(x, y) for x, y in coordinates])
+
+    @staticmethod
+    def from_rectangle(rectangle: Rectangle) -> "Polygon":
+        left, top, right, bottom = (
+            rectangle.left,
+            rectangle.top,
+            rectangle.right,
+            rectangle.bottom,
+        )
+        return Polygon(
+            [
+                Point(left, top),
+                Point(right, top),
+                Point(right, bottom),
+                Point(left, bottom),
+            ]
+        )
+
+    @property
+    def signed_area(self) -> Union[int, float]:
+        points = self.points
+        if len(points) < 3:
+            return 0
+        total = 0
+        previous = points[-1]
+        for point in points:
+            total += previous.x * point.y - point.x * previous.y
+            previous = point
+        return total / 2
+
+    @property
+    def area(self) -> Union[int, float]:
+        return abs(self.signed_area)
+
+    @property
+    def is_convex(self) -> bool:
+        points = self.points
+        orientation = 1 if self.signed_area >= 0 else -1
+        return all(
+            orientation * _cross(points[index - 2], points[index - 1], point) >= 0
+            for index, point in enumerate(points)
+        )
+
+    def triangles(self) -> List["Polygon"]:
+        orientation = 1 if self.signed_area >= 0 else -1
+        remaining = list(self.points)
+        triangles = []
+        while len(remaining) > 3:
+            count = len(remaining)
+            turns = [
+                orientation
+                * _cross(remaining[index - 1], point, remaining[(index + 1) % count])
+                for index, point in enumerate(remaining)
+            ]
+            reflex = [point for point, turn in zip(remaining, turns) if turn < 0]
+            for index, turn in enumerate(turns):
+                if turn < 0:
+                    continue
+                previous, current = remaining[index - 1], remaining[index]
+                following = remaining[(index + 1) % count]
+                if turn > 0 and any(
+                    _inside_triangle(point, previous, current, following, orientation)
+                    for point in reflex
+                    if point != previous and point != following
+                ):
+                    continue
+                if turn > 0:
+                    triangles.append(Polygon([previous, current, following]))
+                del remaining[index]
+                break
+            else:
+                raise ValueError(
+                    f"Trying to triangulate self intersecting Polygon {str(self)}"
+                )
+        if len(remaining) == 3:
+            triangles.append(Polygon(remaining))
+        return triangles
+
+    def bounding_rectangle(self) -> Rectangle:
+        if not self.points:
+            raise ValueError("Trying to bound an empty Polygon")
+        xs = [point.x for point in self.points]
+        ys = [point.y for point in self.points]
+        return Rectangle(Point(min(xs), min(ys)), Point(max(xs), max(ys)))
+
+    def contains(self, point: Point) -> bool:
+        if not isinstance(point, Point):
+            raise ValueError(
+                f"Trying to test Polygon containment of non Point object {str(point)}"
+            )
+        points = self.points
+        if len(points) < 3:
+            return False
+        inside = False
+        start = points[-1]
+        for end in points:
+            if (
+                _cross(start, end, point) == 0
+                and min(start.x, end.x) <= point.x <= max(start.x, end.x)
+                and min(start.y, end.y) <= point.y <= max(start.y, end.y)
+            ):
+                return True
+            if (start.y > point.y) != (end.y > point.y):
+                crossing = start.x + (point.y - start.y) * (end.x - start.x) / (
+                    end.y - start.y
+                )
+                if point.x < crossing:
+                    inside = not inside
+            start = end
+        return inside
+
+    def intersection(self, other: "Polygon") -> "Polygon":
+        if not isinstance(other, Polygon):
+            raise ValueError(
+                f"Trying to intersect Polygon with non Polygon object {str(other)}"
+            )
+        if not other.is_convex:
+            if self.is_convex:
+                return other.intersection(self)
+            raise ValueError(
+                f"Trying to intersect concave Polygons {str(self)} and {str(other)}, use intersection_area"
+            )
+        orientation = 1 if other.signed_area >= 0 else -1
+        output = list(self.points)
+        clip_start = other.points[-1] if other.points else None
+        for clip_end in other.points:
+            if not output:
+                break
+            candidates, output = output, []
+            previous = candidates[-1]
+            previous_side = orientation * _cross(clip_start, clip_end, previous)
+            for current in candidates:
+                current_side = orientation * _cross(clip_start, clip_end, current)
+                if (current_side >= 0) != (previous_side >= 0):
+                    output.append(
+                        _crossing_point(previous, current, previous_side, current_side)
+                    )
+                if current_side >= 0:
+                    output.append(current)
+                previous, previous_side = current, current_side
+            clip_start = clip_end
+        return Polygon(output)
+
+    def intersection_area(self, other: "Polygon") -> Union[int, float]:
+        if not isinstance(other, Polygon):
+            raise ValueError(
+                f"Trying to intersect Polygon with non Polygon object {str(other)}"
+            )
+        if self.is_convex or other.is_convex:
+            return self.intersection(other).area
+        other_triangles = [
+            (triangle, triangle.bounding_rectangle()) for triangle in other.triangles()
+        ]
+        total = 0
+        for triangle in self.triangles():
+            bounds = triangle.bounding_rectangle()
+            for other_triangle, other_bounds in other_triangles:
+                if _bounds_overlap(bounds, other_bounds):
+                    total += triangle.intersection(other_triangle).area
+        return total
+
+    def iou(self, other: "Polygon") -> float:
+        intersection = self.intersection_area(other)
+        union = self.area + other.area - intersection
+        return intersection / union if union > 0 else 0.0
+
+    def to_xy(self) -> List[OrderedDict]:
+        return [point.to_xy() for point in self.points]
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self.points)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Polygon):
+            return self.points == other.points
+        else:
+            return False
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.points))
+
+    def __str__(self) -> str:
+        return f"Polygon({','.join(str(point) for point in self.points)})"
@@ -0,0 +1,152 @@
+from typing import Iterable, Iterator, List, Union
+import numpy as np
+from utils.array_utils import as_coordinate_array
+from data_types.point import Point
+from data_types.point_array import PointArray
+from data_types.polygon import Polygon
+from data_types.rectangle_array import RectangleArray, Rectangles, as_rectangle_array
+
+
+class PolygonArray:
+    def __init__(self, vertices: np.ndarray, offsets: np.ndarray) -> None:
+        self.vertices = as_coordinate_array(vertices, columns=2)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        if (
+            self.offsets.ndim != 1
+            or self.offsets.size == 0
+            or self.offsets[0] != 0
+            or self.offsets[-1] != len(self.vertices)
+        ):
+            raise ValueError(
+                f"Expected offsets from 0 to {len(self.vertices)}, got {self.offsets.tolist()}"
+            )
+        if np.any(np.diff(self.offsets) < 3):
+            raise ValueError(
+                "Every polygon in a PolygonArray needs at least 3 vertices"
+            )
+
+    @staticmethod
+    def from_polygons(polygons: Iterable[Polygon]) -> "PolygonArray":
+        vertices = []
+        offsets = [0]
+        for polygon in polygons:
+            vertices.extend((point.x, point.y) for point in polygon.points)
+            offsets.append(len(vertices))
+        return PolygonArray(vertices, offsets)
+
+    @staticmethod
+    def from_rectangles(rectangles: Rectangles) -> "PolygonArray":
+        xyxy = as_rectangle_array(rectangles).xyxy
+        vertices = xyxy[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 2)
+        return PolygonArray(vertices, np.arange(len(xyxy) + 1) * 4)
+
+    def to_polygons(self) -> List[Polygon]:
+        points = PointArray(self.vertices).to_points()
+        return [
+            Polygon(points[start:end])
+            for start, end in zip(self.offsets[:-1].tolist(), self.offsets[1:].tolist())
+        ]
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @property
+    def owners(self) -> np.ndarray:
+        return np.repeat(np.arange(len(self)), self.counts)
+
+    def _next_vertices(self) -> np.ndarray:
+        following = np.empty_like(self.vertices)
+        following[:-1] = self.vertices[1:]
+        following[self.offsets[1:] - 1] = self.vertices[self.offsets[:-1]]
+        return following
+
+    @property
+    def signed_area(self) -> np.ndarray:
+        start, end = self.vertices, self._next_vertices()
+        cross = start[:, 0] * end[:, 1] - end[:, 0] * start[:, 1]
+        if len(self) == 0:
+            return np.zeros(0)
+        return np.add.reduceat(cross, self.offsets[:-1]) / 2
+
+    @property
+    def area(self) -> np.ndarray:
+        return np.abs(self.signed_area)
+
+    def bounding_rectangles(self) -> RectangleArray:
+        if len(self) == 0:
+            return RectangleArray(np.empty((0, 4), dtype=self.vertices.dtype))
+        starts = self.offsets[:-1]
+        return RectangleArray(
+            np.concatenate(
+                (
+                    np.minimum.reduceat(self.vertices, starts, axis=0),
+                    np.maximum.reduceat(self.vertices, starts, axis=0),
+                ),
+                axis=1,
+            )
+        )
+
+    def contains(self, points: Union[Point, PointArray]) -> np.ndarray:
+        if isinstance(points, Point):
+            xy = np.array((points.x, points.y))[None, :]
+        elif isinstance(points, PointArray):
+            if len(points) != len(self):
+                raise ValueError(
+                    f"Expected {len(self)} points matching the polygons, got {len(points)}"
+                )
+            xy = points.xy[self.owners]
+        else:
+            raise ValueError(
+                f"Trying to check if PolygonArray {str(self)} contains non Point object {str(points)}"
+            )
+        start, end = self.vertices, self._next_vertices()
+        px, py = xy[:, 0], xy[:, 1]
+        dx, dy = end[:, 0] - start[:, 0], end[:, 1] - start[:, 1]
+        cross = dx * (py - start[:, 1]) - dy * (px - start[:, 0])
+        on_edge = (
+            (cross == 0)
+            & (np.minimum(start[:, 0], end[:, 0]) <= px)
+            & (px <= np.maximum(start[:, 0], end[:, 0]))
+            & (np.minimum(start[:, 1], end[:, 1]) <= py)
+            & (py <= np.maximum(start[:, 1], end[:, 1]))
+        )
+        straddles = (start[:, 1] > py) != (end[:, 1] > py)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing = start[:, 0] + (py - start[:, 1]) * dx / dy
+        crosses = straddles & (px < crossing)
+        if len(self) == 0:
+            return np.zeros(0, dtype=bool)
+        starts = self.offsets[:-1]
+        crossings = np.add.reduceat(crosses.astype(np.int64), starts)
+        return (crossings % 2 == 1) | np.logical_or.reduceat(on_edge, starts)
+
+    def __len__(self) -> int:
+        return self.offsets.size - 1
+
+    def __iter__(self) -> Iterator[Polygon]:
+        return iter(self.to_polygons())
+
+    def __getitem__(self, index) -> Union[Polygon, "PolygonArray"]:
+        if isinstance(index, (int, np.integer)):
+            index = range(len(self))[index]
+            start, end = self.offsets[index], self.offsets[index + 1]
+            return Polygon(PointArray(self.vertices[start:end]).to_points())
+        selected = np.arange(len(self))[index]
+        counts = self.counts[selected]
+        starts = np.repeat(self.offsets[selected] - np.cumsum(counts) + counts, counts)
+        positions = starts + np.arange(counts.sum())
+        return PolygonArray(self.vertices[positions], np.r_[0, np.cumsum(counts)])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PolygonArray):
+            return (
+                self.vertices.shape == other.vertices.shape
+                and np.array_equal(self.offsets, other.offsets)
+                and bool(np.all(self.vertices == other.vertices))
+            )
+        else:
+            return False
+
+    def __str__(self) -> str:
+        return f"PolygonArray({len(self)})"
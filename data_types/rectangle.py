@@ -1,10 +1,13 @@
-from typing import Union, Dict
+from typing import Dict, Tuple, Union
 from collections import OrderedDict
-from utils.dict import add_suffix_to_dict_keys
-from data_types.geometry.point import Point
+from data_types.point import FrozenPoint, Point, SCALAR_TYPES
+
+OPERAND_TYPES = SCALAR_TYPES + (Point,)
 
 
 class Rectangle:
+    __slots__ = ("top_left", "bottom_right")
+
     def __init__(self, top_left: Point, bottom_right: Point) -> None:
         self.top_left = top_left
         self.bottom_right = bottom_right
@@ -41,15 +44,23 @@ class Rectangle:
 
     @property
     def width(self) -> Union[int, float]:
-        return self.right - self.left
+        return self.bottom_right.x - self.top_left.x
 
     @property
     def height(self) -> Union[int, float]:
-        return self.bottom - self.top
+        return self.bottom_right.y - self.top_left.y
 
     @property
     def area(self) -> Union[int, float]:
-        return self.height * self.width
+        top_left, bottom_right = self.top_left, self.bottom_right
+        return (bottom_right.y - top_left.y) * (bottom_right.x - top_left.x)
+
+    @property
+    def center(self) -> Point:
+        top_left, bottom_right = self.top_left, self.bottom_right
+        return Point(
+            (top_left.x + bottom_right.x) / 2, (top_left.y + bottom_right.y) / 2
+        )
 
     @property
     def top(self) -> Union[int, float]:
@@ -67,6 +78,82 @@ class Rectangle:
     def right(self) -> Union[int, float]:
         return self.bottom_right.x
 
+    @property
+    def is_empty(self) -> bool:
+        return self.right < self.left or self.bottom < self.top
+
+    def intersection(self, other: "Rectangle") -> "Rectangle":
+        if isinstance(other, Rectangle):
+            return Rectangle(
+                Point(max(self.left, other.left), max(self.top, other.top)),
+                Point(min(self.right, other.right), min(self.bottom, other.bottom)),
+            )
+        else:
+            raise ValueError(
+                f"Trying to intersect Rectangle {str(self)} with non Rectangle object {str(other)}"
+            )
+
+    def union_bounds(self, other: "Rectangle") -> "Rectangle":
+        if not isinstance(other, Rectangle):
+            raise ValueError(
+                f"Trying to bound Rectangle {str(self)} with non Rectangle object {str(other)}"
+            )
+        elif other.is_empty:
+            return self
+        elif self.is_empty:
+            return other
+        else:
+            return Rectangle(
+                Point(min(self.left, other.left), min(self.top, other.top)),
+                Point(max(self.right, other.right), max(self.bottom, other.bottom)),
+            )
+
+    def clip_to(self, bounds: "Rectangle") -> "Rectangle":
+        return self.intersection(bounds)
+
+    def contains(self, other: Union[Point, "Rectangle"]) -> bool:
+        if isinstance(other, Point):
+            return (
+                not self.is_empty
+                and self.left <= other.x <= self.right
+                and self.top <= other.y <= self.bottom
+            )
+        elif isinstance(other, Rectangle):
+            return (
+                not self.is_empty
+                and not other.is_empty
+                and self.left <= other.left
+                and other.right <= self.right
+                and self.top <= other.top
+                and other.bottom <= self.bottom
+            )
+        else:
+            raise ValueError(
+                f"Trying to check if Rectangle {str(self)} contains non Point or Rectangle object {str(other)}"
+            )
+
+    def intersection_area(self, other: "Rectangle") -> Union[int, float]:
+        if isinstance(other, Rectangle):
+            width = min(self.right, other.right) - max(self.left, other.left)
+            height = min(self.bottom, other.bottom) - max(self.top, other.top)
+            return max(width, 0) * max(height, 0)
+        else:
+            raise ValueError(
+                f"Trying to intersect Rectangle {str(self)} with non Rectangle object {str(other)}"
+            )
+
+    def union_area(self, other: "Rectangle") -> Union[int, float]:
+        self_area = max(self.width, 0) * max(self.height, 0)
+        other_area = max(other.width, 0) * max(other.height, 0)
+        return self_area + other_area - self.intersection_area(other)
+
+    def iou(self, other: "Rectangle") -> float:
+        union = self.union_area(other)
+        if union > 0:
+            return self.intersection_area(other) / union
+        else:
+            return 0.0
+
     def as_float(self) -> "Rectangle":
         return Rectangle.from_corners(
             top_left_corner=self.top_left.as_float(),
@@ -79,15 +166,24 @@ class Rectangle:
             bottom_right_corner=self.bottom_right.as_int(),
         )
 
+    def freeze(self) -> "FrozenRectangle":
+        return FrozenRectangle(self.top_left, self.bottom_right)
+
     def to_xyxy(self) -> OrderedDict[str, Union[int, float]]:
-        point1_kwargs = add_suffix_to_dict_keys(self.top_left.to_xy(), "1")
-        point2_kwargs = add_suffix_to_dict_keys(self.bottom_right.to_xy(), "2")
-        return OrderedDict(**point1_kwargs, **point2_kwargs)
+        return OrderedDict(
+            x1=self.top_left.x,
+            y1=self.top_left.y,
+            x2=self.bottom_right.x,
+            y2=self.bottom_right.y,
+        )
 
     def to_xywh(self) -> OrderedDict[str, Union[int, float]]:
-        point_kwargs = self.top_left.to_xy()
-        wh_kwargs = OrderedDict(w=self.bottom - self.top, h=self.right - self.left)
-        return OrderedDict(**point_kwargs, **wh_kwargs)
+        return OrderedDict(
+            x=self.top_left.x,
+            y=self.top_left.y,
+            w=self.right - self.left,
+            h=self.bottom - self.top,
+        )
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Rectangle):
@@ -97,45 +193,37 @@ class Rectangle:
         else:
             return False
 
+    def __hash__(self) -> int:
+        top_left, bottom_right = self.top_left, self.bottom_right
+        return hash((top_left.x, top_left.y, bottom_right.x, bottom_right.y))
+
     def __sub__(self, other: object) -> "Rectangle":
-        if isinstance(other, Union[int, float, Point]):
-            return Rectangle.from_corners(
-                top_left_corner=self.top_left - other,
-                bottom_right_corner=self.bottom_right - other,
-            )
+        if isinstance(other, OPERAND_TYPES):
+            return Rectangle(self.top_left - other, self.bottom_right - other)
         else:
             raise ValueError(
                 f"Trying to subtract from Rectangle {str(self)} with non Point object {str(other)}"
             )
 
     def __add__(self, other: object) -> "Rectangle":
-        if isinstance(other, Union[int, float, Point]):
-            return Rectangle.from_corners(
-                top_left_corner=self.top_left + other,
-                bottom_right_corner=self.bottom_right + other,
-            )
+        if isinstance(other, OPERAND_TYPES):
+            return Rectangle(self.top_left + other, self.bottom_right + other)
         else:
             raise ValueError(
                 f"Trying to add to Rectangle {str(self)} with non Point object {str(other)}"
             )
 
     def __mul__(self, other: object):
-        if isinstance(other, Union[int, float, Point]):
-            return Rectangle.from_corners(
-                top_left_corner=self.top_left * other,
-                bottom_right_corner=self.bottom_right * other,
-            )
+        if isinstance(other, OPERAND_TYPES):
+            return Rectangle(self.top_left * other, self.bottom_right * other)
         else:
             raise ValueError(
                 f"Trying to multiply Rectangle {str(self)} with non Point object {str(other)}"
             )
 
     def __truediv__(self, other: object):
-        if isinstance(other, Union[int, float, Point]):
-            return Rectangle.from_corners(
-                top_left_corner=self.top_left / other,
-                bottom_right_corner=self.bottom_right / other,
-            )
+        if isinstance(other, OPERAND_TYPES):
+            return Rectangle(self.top_left / other, self.bottom_right / other)
         else:
             raise ValueError(
                 f"Trying to multiply Rectangle {str(self)} with non Point object {str(other)}"
@@ -143,3 +231,84 @@ class Rectangle:
 
     def __str__(self) -> str:
         return f"Rectangle({str(self.top_left)},{str(self.bottom_right)})"
+
+
+class FrozenRectangle(Rectangle):
+    __slots__ = ("left", "top", "right", "bottom", "width", "height", "area", "center")
+
+    def __init__(self, top_left: Point, bottom_right: Point) -> None:
+        left, top = top_left.x, top_left.y
+        right, bottom = bottom_right.x, bottom_right.y
+        width, height = right - left, bottom - top
+        for name, value in (
+            ("top_left", top_left.freeze()),
+            ("bottom_right", bottom_right.freeze()),
+            ("left", left),
+            ("top", top),
+            ("right", right),
+            ("bottom", bottom),
+            ("width", width),
+            ("height", height),
+            ("area", height * width),
+            ("center", FrozenPoint((left + right) / 2, (top + bottom) / 2)),
+        ):
+            object.__setattr__(self, name, value)
+
+    @staticmethod
+    def from_corners(
+        top_left_corner: Point, bottom_right_corner: Point
+    ) -> "FrozenRectangle":
+        return FrozenRectangle(
+            top_left=top_left_corner, bottom_right=bottom_right_corner
+        )
+
+    @staticmethod
+    def from_xywh(
+        x: Union[int, float],
+        y: Union[int, float],
+        w: Union[int, float],
+        h: Union[int, float],
+    ) -> "FrozenRectangle":
+        return Rectangle.from_xywh(x, y, w, h).freeze()
+
+    @staticmethod
+    def from_xyxy(
+        x1: Union[int, float],
+        y1: Union[int, float],
+        x2: Union[int, float],
+        y2: Union[int, float],
+    ) -> "FrozenRectangle":
+        return FrozenRectangle(FrozenPoint(x1, y1), FrozenPoint(x2, y2))
+
+    def freeze(self) -> "FrozenRectangle":
+        return self
+
+    def thaw(self) -> Rectangle:
+        return Rectangle(self.top_left.thaw(), self.bottom_right.thaw())
+
+    def __reduce__(self) -> Tuple[type, Tuple[Point, Point]]:
+        return (FrozenRectangle, (self.top_left, self.bottom_right))
+
+    def as_float(self) -> "FrozenRectangle":
+        return super().as_float().freeze()
+
+    def as_int(self) -> "FrozenRectangle":
+        return super().as_int().freeze()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"Cannot set {name} on immutable {str(self)}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Cannot delete {name} on immutable {str(self)}")
+
+    def __sub__(self, other: object) -> "FrozenRectangle":
+        return super().__sub__(other).freeze()
+
+    def __add__(self, other: object) -> "FrozenRectangle":
+        return super().__add__(other).freeze()
+
+    def __mul__(self, other: object) -> "FrozenRectangle":
+        return super().__mul__(other).freeze()
+
+    def __truediv__(self, other: object) -> "FrozenRectangle":
+        return super().__truediv__(other).freeze()
@@ -0,0 +1,257 @@
+from typing import Iterable, Iterator, List, Tuple, Union
+from collections import OrderedDict
+import numpy as np
+from utils.array_utils import as_coordinate_array
+from data_types.point import Point, SCALAR_TYPES
+from data_types.point_array import PointArray
+from data_types.rectangle import Rectangle
+
+
+class RectangleArray:
+    def __init__(self, xyxy: np.ndarray) -> None:
+        self.xyxy = as_coordinate_array(xyxy, columns=4)
+
+    @staticmethod
+    def from_xyxy(
+        x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray
+    ) -> "RectangleArray":
+        return RectangleArray(np.stack(np.broadcast_arrays(x1, y1, x2, y2), axis=-1))
+
+    @staticmethod
+    def from_xywh(
+        x: np.ndarray, y: np.ndarray, w: np.ndarray, h: np.ndarray
+    ) -> "RectangleArray":
+        x, y, w, h = np.broadcast_arrays(x, y, w, h)
+        return RectangleArray(np.stack((x, y, x + w, y + h), axis=-1))
+
+    @staticmethod
+    def from_rectangles(rectangles: Iterable[Rectangle]) -> "RectangleArray":
+        return RectangleArray(
+            [
+                (
+                    rect.top_left.x,
+                    rect.top_left.y,
+                    rect.bottom_right.x,
+                    rect.bottom_right.y,
+                )
+                for rect in rectangles
+            ]
+        )
+
+    def to_rectangles(self) -> List[Rectangle]:
+        return [
+            Rectangle.from_xyxy(x1, y1, x2, y2) for x1, y1, x2, y2 in self.xyxy.tolist()
+        ]
+
+    @property
+    def top_left(self) -> PointArray:
+        return PointArray(self.xyxy[:, 0:2])
+
+    @property
+    def bottom_right(self) -> PointArray:
+        return PointArray(self.xyxy[:, 2:4])
+
+    @property
+    def clamped_area(self) -> np.ndarray:
+        return np.maximum(self.width, 0) * np.maximum(self.height, 0)
+
+    @property
+    def width(self) -> np.ndarray:
+        return self.right - self.left
+
+    @property
+    def height(self) -> np.ndarray:
+        return self.bottom - self.top
+
+    @property
+    def area(self) -> np.ndarray:
+        return self.height * self.width
+
+    @property
+    def top(self) -> np.ndarray:
+        return self.xyxy[:, 1]
+
+    @property
+    def bottom(self) -> np.ndarray:
+        return self.xyxy[:, 3]
+
+    @property
+    def left(self) -> np.ndarray:
+        return self.xyxy[:, 0]
+
+    @property
+    def right(self) -> np.ndarray:
+        return self.xyxy[:, 2]
+
+    @property
+    def is_empty(self) -> np.ndarray:
+        return (self.right < self.left) | (self.bottom < self.top)
+
+    def _bounds_operand(self, other: object, action: str) -> np.ndarray:
+        if isinstance(other, RectangleArray):
+            return other.xyxy
+        elif isinstance(other, Rectangle):
+            return np.array((other.left, other.top, other.right, other.bottom))
+        else:
+            raise ValueError(
+                f"Trying to {action} RectangleArray {str(self)} with non Rectangle object {str(other)}"
+            )
+
+    def intersection(
+        self, other: Union[Rectangle, "RectangleArray"]
+    ) -> "RectangleArray":
+        bounds = self._bounds_operand(other, "intersect")
+        return RectangleArray(
+            np.concatenate(
+                (
+                    np.maximum(self.xyxy[:, :2], bounds[..., :2]),
+                    np.minimum(self.xyxy[:, 2:], bounds[..., 2:]),
+                ),
+                axis=-1,
+            )
+        )
+
+    def union_bounds(
+        self, other: Union[Rectangle, "RectangleArray"]
+    ) -> "RectangleArray":
+        bounds = self._bounds_operand(other, "bound")
+        other_empty = (bounds[..., 2] < bounds[..., 0]) | (
+            bounds[..., 3] < bounds[..., 1]
+        )
+        merged = np.concatenate(
+            (
+                np.minimum(self.xyxy[:, :2], bounds[..., :2]),
+                np.maximum(self.xyxy[:, 2:], bounds[..., 2:]),
+            ),
+            axis=-1,
+        )
+        merged = np.where(self.is_empty[:, None], bounds, merged)
+        return RectangleArray(np.where(other_empty[..., None], self.xyxy, merged))
+
+    def clip_to(self, bounds: Rectangle) -> "RectangleArray":
+        return self.intersection(bounds)
+
+    def contains(
+        self, other: Union[Point, Rectangle, PointArray, "RectangleArray"]
+    ) -> np.ndarray:
+        if isinstance(other, (Point, PointArray)):
+            xy = (
+                other.xy
+                if isinstance(other, PointArray)
+                else np.array((other.x, other.y))
+            )
+            inside = (self.xyxy[:, :2] <= xy) & (xy <= self.xyxy[:, 2:])
+            return inside.all(axis=-1)
+        elif isinstance(other, (Rectangle, RectangleArray)):
+            bounds = self._bounds_operand(other, "check containment of")
+            inside = (self.xyxy[:, :2] <= bounds[..., :2]) & (
+                bounds[..., 2:] <= self.xyxy[:, 2:]
+            )
+            other_empty = (bounds[..., 2] < bounds[..., 0]) | (
+                bounds[..., 3] < bounds[..., 1]
+            )
+            return inside.all(axis=-1) & ~self.is_empty & ~other_empty
+        else:
+            raise ValueError(
+                f"Trying to check if RectangleArray {str(self)} contains non Point or Rectangle object {str(other)}"
+            )
+
+    def bounds(self) -> Rectangle:
+        xyxy = self.xyxy[~self.is_empty]
+        if len(xyxy) == 0:
+            raise ValueError(
+                f"Trying to bound RectangleArray {str(self)} without non empty rectangles"
+            )
+        return Rectangle.from_xyxy(
+            *xyxy[:, :2].min(axis=0).tolist(), *xyxy[:, 2:].max(axis=0).tolist()
+        )
+
+    def group_bounds(self, groups: np.ndarray) -> Tuple[np.ndarray, "RectangleArray"]:
+        groups = np.asarray(groups)
+        if groups.shape != (len(self),):
+            raise ValueError(
+                f"Expected one group per rectangle, got shape {groups.shape} for {len(self)} rectangles"
+            )
+        keep = ~self.is_empty
+        labels, inverse = np.unique(groups[keep], return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        xyxy = self.xyxy[keep][order]
+        starts = np.flatnonzero(np.r_[True, np.diff(inverse[order]) != 0])
+        if len(xyxy) == 0:
+            return labels, RectangleArray(xyxy)
+        return labels, RectangleArray(
+            np.concatenate(
+                (
+                    np.minimum.reduceat(xyxy[:, :2], starts, axis=0),
+                    np.maximum.reduceat(xyxy[:, 2:], starts, axis=0),
+                ),
+                axis=1,
+            )
+        )
+
+    def as_float(self) -> "RectangleArray":
+        return RectangleArray(self.xyxy.astype(np.float64))
+
+    def as_int(self) -> "RectangleArray":
+        return RectangleArray(self.xyxy.astype(np.int64))
+
+    def to_xyxy(self) -> OrderedDict[str, np.ndarray]:
+        return OrderedDict(x1=self.left, y1=self.top, x2=self.right, y2=self.bottom)
+
+    def to_xywh(self) -> OrderedDict[str, np.ndarray]:
+        return OrderedDict(x=self.left, y=self.top, w=self.width, h=self.height)
+
+    def _operand(self, other: object, action: str) -> Union[int, float, np.ndarray]:
+        if isinstance(other, PointArray):
+            return np.tile(other.xy, 2)
+        elif isinstance(other, Point):
+            return np.array((other.x, other.y, other.x, other.y))
+        elif isinstance(other, SCALAR_TYPES):
+            return other
+        else:
+            raise ValueError(
+                f"Trying to {action} RectangleArray {str(self)} with non Point object {str(other)}"
+            )
+
+    def __len__(self) -> int:
+        return self.xyxy.shape[0]
+
+    def __iter__(self) -> Iterator[Rectangle]:
+        return iter(self.to_rectangles())
+
+    def __getitem__(self, index) -> Union[Rectangle, "RectangleArray"]:
+        if isinstance(index, (int, np.integer)):
+            return Rectangle.from_xyxy(*self.xyxy[index].tolist())
+        return RectangleArray(self.xyxy[index])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RectangleArray):
+            return self.xyxy.shape == other.xyxy.shape and bool(
+                np.all(self.xyxy == other.xyxy)
+            )
+        else:
+            return False
+
+    def __sub__(self, other: object) -> "RectangleArray":
+        return RectangleArray(self.xyxy - self._operand(other, "subtract from"))
+
+    def __add__(self, other: object) -> "RectangleArray":
+        return RectangleArray(self.xyxy + self._operand(other, "add to"))
+
+    def __mul__(self, other: object) -> "RectangleArray":
+        return RectangleArray(self.xyxy * self._operand(other, "multiply"))
+
+    def __truediv__(self, other: object) -> "RectangleArray":
+        return RectangleArray(self.xyxy / self._operand(other, "divide"))
+
+    def __str__(self) -> str:
+        return f"RectangleArray({len(self)})"
+
+
+Rectangles = Union[RectangleArray, Iterable[Rectangle]]
+
+
+def as_rectangle_array(rectangles: Rectangles) -> RectangleArray:
+    if isinstance(rectangles, RectangleArray):
+        return rectangles
+    return RectangleArray.from_rectangles(rectangles)
@@ -0,0 +1,105 @@
+from typing import List, Union
+from collections import OrderedDict
+import math
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.polygon import Polygon
+
+
+class RotatedRectangle:
+    __slots__ = ("center", "width", "height", "angle")
+
+    def __init__(
+        self,
+        center: Point,
+        width: Union[int, float],
+        height: Union[int, float],
+        angle: Union[int, float] = 0.0,
+    ) -> None:
+        self.center = center
+        self.width = width
+        self.height = height
+        self.angle = angle
+
+    @staticmethod
+    def from_cxcywha(
+        cx: Union[int, float],
+        cy: Union[int, float],
+        w: Union[int, float],
+        h: Union[int, float],
+        angle: Union[int, float],
+    ) -> "RotatedRectangle":
+        return RotatedRectangle(Point(cx, cy), w, h, angle)
+
+    @staticmethod
+    def from_rectangle(rectangle: Rectangle) -> "RotatedRectangle":
+        return RotatedRectangle(rectangle.center, rectangle.width, rectangle.height)
+
+    @property
+    def area(self) -> Union[int, float]:
+        return self.width * self.height
+
+    def corners(self) -> List[Point]:
+        cos, sin = math.cos(self.angle), math.sin(self.angle)
+        cx, cy = self.center.x, self.center.y
+        half_width, half_height = self.width / 2, self.height / 2
+        return [
+            Point(cx + u * cos - v * sin, cy + u * sin + v * cos)
+            for u, v in (
+                (-half_width, -half_height),
+                (half_width, -half_height),
+                (half_width, half_height),
+                (-half_width, half_height),
+            )
+        ]
+
+    def to_polygon(self) -> Polygon:
+        return Polygon(self.corners())
+
+    def bounding_rectangle(self) -> Rectangle:
+        return self.to_polygon().bounding_rectangle()
+
+    def contains(self, point: Point) -> bool:
+        if not isinstance(point, Point):
+            raise ValueError(
+                f"Trying to test RotatedRectangle containment of non Point object {str(point)}"
+            )
+        cos, sin = math.cos(self.angle), math.sin(self.angle)
+        dx, dy = point.x - self.center.x, point.y - self.center.y
+        return (
+            abs(dx * cos + dy * sin) <= self.width / 2
+            and abs(dy * cos - dx * sin) <= self.height / 2
+        )
+
+    def iou(self, other: "RotatedRectangle") -> float:
+        if not isinstance(other, RotatedRectangle):
+            raise ValueError(
+                f"Trying to compare RotatedRectangle with non RotatedRectangle object {str(other)}"
+            )
+        return self.to_polygon().iou(other.to_polygon())
+
+    def to_cxcywha(self) -> OrderedDict[str, Union[int, float]]:
+        return OrderedDict(
+            cx=self.center.x,
+            cy=self.center.y,
+            w=self.width,
+            h=self.height,
+            a=self.angle,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RotatedRectangle):
+            return (self.center, self.width, self.height, self.angle) == (
+                other.center,
+                other.width,
+                other.height,
+                other.angle,
+            )
+        else:
+            return False
+
+    def __hash__(self) -> int:
+        return hash((self.center, self.width, self.height, self.angle))
+
+    def __str__(self) -> str:
+        return f"RotatedRectangle({str(self.center)},{self.width},{self.height},{self.angle})"
@@ -0,0 +1,248 @@
+from typing import Iterable, Iterator, List, Tuple, Union
+import numpy as np
+from utils.array_utils import as_coordinate_array
+from data_types.point import Point
+from data_types.point_array import PointArray
+from data_types.polygon_array import PolygonArray
+from data_types.rectangle_array import RectangleArray, Rectangles, as_rectangle_array
+from data_types.rotated_rectangle import RotatedRectangle
+
+_UNIT_CORNERS = np.array(((-0.5, -0.5), (0.5, -0.5), (0.5, 0.5), (-0.5, 0.5)))
+INSIDE_TOLERANCE = 1e-9
+DEFAULT_CHUNK_SIZE = 2048
+
+
+def _edges(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    return np.roll(x, -1, axis=1) - x, np.roll(y, -1, axis=1) - y
+
+
+def _inside_convex(
+    x: np.ndarray,
+    y: np.ndarray,
+    polygon_x: np.ndarray,
+    polygon_y: np.ndarray,
+    tolerance: np.ndarray,
+) -> np.ndarray:
+    edge_x, edge_y = _edges(polygon_x, polygon_y)
+    cross = edge_x[:, None, :] * (y[:, :, None] - polygon_y[:, None, :]) - edge_y[
+        :, None, :
+    ] * (x[:, :, None] - polygon_x[:, None, :])
+    return (cross >= -tolerance).all(axis=-1) | (cross <= tolerance).all(axis=-1)
+
+
+def convex_intersection_area(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    count = first.shape[0]
+    first_x, first_y = first[..., 0], first[..., 1]
+    second_x, second_y = second[..., 0], second[..., 1]
+    first_dx, first_dy = _edges(first_x, first_y)
+    second_dx, second_dy = _edges(second_x, second_y)
+    scale = np.maximum(np.abs(first).max(axis=(1, 2)), np.abs(second).max(axis=(1, 2)))
+    tolerance = (INSIDE_TOLERANCE * (scale + 1) ** 2)[:, None, None]
+
+    offset_x = second_x[:, None, :] - first_x[:, :, None]
+    offset_y = second_y[:, None, :] - first_y[:, :, None]
+    denominator = (
+        first_dx[:, :, None] * second_dy[:, None, :]
+        - first_dy[:, :, None] * second_dx[:, None, :]
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (
+            offset_x * second_dy[:, None, :] - offset_y * second_dx[:, None, :]
+        ) / denominator
+        u = (
+            offset_x * first_dy[:, :, None] - offset_y * first_dx[:, :, None]
+        ) / denominator
+    crossing = (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+    t = np.where(crossing, t, 0)
+
+    x = np.concatenate(
+        (
+            first_x,
+            second_x,
+            (first_x[:, :, None] + t * first_dx[:, :, None]).reshape(count, -1),
+        ),
+        axis=1,
+    )
+    y = np.concatenate(
+        (
+            first_y,
+            second_y,
+            (first_y[:, :, None] + t * first_dy[:, :, None]).reshape(count, -1),
+        ),
+        axis=1,
+    )
+    valid = np.concatenate(
+        (
+            _inside_convex(first_x, first_y, second_x, second_y, tolerance),
+            _inside_convex(second_x, second_y, first_x, first_y, tolerance),
+            crossing.reshape(count, -1),
+        ),
+        axis=1,
+    )
+    counts = valid.sum(axis=1)
+    divisor = np.maximum(counts, 1)
+    x = x - np.where(valid, x, 0).sum(axis=1, keepdims=True) / divisor[:, None]
+    y = y - np.where(valid, y, 0).sum(axis=1, keepdims=True) / divisor[:, None]
+    order = np.argsort(np.where(valid, np.arctan2(y, x), np.inf), axis=1)
+    x = np.take_along_axis(x, order, axis=1)
+    y = np.take_along_axis(y, order, axis=1)
+    ordered_valid = np.take_along_axis(valid, order, axis=1)
+    x = np.where(ordered_valid, x, x[:, :1])
+    y = np.where(ordered_valid, y, y[:, :1])
+    area = np.abs((x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y).sum(axis=1))
+    return np.where(counts >= 3, area / 2, 0.0)
+
+
+class RotatedRectangleArray:
+    def __init__(self, cxcywha: np.ndarray) -> None:
+        self.cxcywha = as_coordinate_array(cxcywha, columns=5).astype(
+            np.float64, copy=False
+        )
+
+    @staticmethod
+    def from_cxcywha(
+        cx: np.ndarray, cy: np.ndarray, w: np.ndarray, h: np.ndarray, a: np.ndarray
+    ) -> "RotatedRectangleArray":
+        return RotatedRectangleArray(
+            np.stack(np.broadcast_arrays(cx, cy, w, h, a), axis=-1)
+        )
+
+    @staticmethod
+    def from_rotated_rectangles(
+        rectangles: Iterable[RotatedRectangle],
+    ) -> "RotatedRectangleArray":
+        return RotatedRectangleArray(
+            [
+                (rect.center.x, rect.center.y, rect.width, rect.height, rect.angle)
+                for rect in rectangles
+            ]
+        )
+
+    @staticmethod
+    def from_rectangles(rectangles: Rectangles) -> "RotatedRectangleArray":
+        xyxy = as_rectangle_array(rectangles).xyxy
+        return RotatedRectangleArray(
+            np.concatenate(
+                (
+                    (xyxy[:, :2] + xyxy[:, 2:]) / 2,
+                    xyxy[:, 2:] - xyxy[:, :2],
+                    np.zeros((len(xyxy), 1)),
+                ),
+                axis=1,
+            )
+        )
+
+    def to_rotated_rectangles(self) -> List[RotatedRectangle]:
+        return [
+            RotatedRectangle(Point(cx, cy), w, h, a)
+            for cx, cy, w, h, a in self.cxcywha.tolist()
+        ]
+
+    @property
+    def center(self) -> PointArray:
+        return PointArray(self.cxcywha[:, 0:2])
+
+    @property
+    def width(self) -> np.ndarray:
+        return self.cxcywha[:, 2]
+
+    @property
+    def height(self) -> np.ndarray:
+        return self.cxcywha[:, 3]
+
+    @property
+    def angle(self) -> np.ndarray:
+        return self.cxcywha[:, 4]
+
+    @property
+    def area(self) -> np.ndarray:
+        return self.width * self.height
+
+    def corners(self) -> np.ndarray:
+        cos, sin = np.cos(self.angle)[:, None], np.sin(self.angle)[:, None]
+        u = _UNIT_CORNERS[None, :, 0] * self.width[:, None]
+        v = _UNIT_CORNERS[None, :, 1] * self.height[:, None]
+        return np.stack(
+            (
+                self.cxcywha[:, 0:1] + u * cos - v * sin,
+                self.cxcywha[:, 1:2] + u * sin + v * cos,
+            ),
+            axis=-1,
+        )
+
+    def to_polygons(self) -> PolygonArray:
+        return PolygonArray(self.corners().reshape(-1, 2), np.arange(len(self) + 1) * 4)
+
+    def bounding_rectangles(self) -> RectangleArray:
+        corners = self.corners()
+        return RectangleArray(
+            np.concatenate((corners.min(axis=1), corners.max(axis=1)), axis=1)
+        )
+
+    def contains(self, points: Union[Point, PointArray]) -> np.ndarray:
+        if isinstance(points, Point):
+            xy = np.array((points.x, points.y))
+        elif isinstance(points, PointArray):
+            xy = points.xy
+        else:
+            raise ValueError(
+                f"Trying to check if RotatedRectangleArray {str(self)} contains non Point object {str(points)}"
+            )
+        cos, sin = np.cos(self.angle), np.sin(self.angle)
+        dx, dy = (xy - self.cxcywha[:, 0:2]).T
+        return (np.abs(dx * cos + dy * sin) <= self.width / 2) & (
+            np.abs(dy * cos - dx * sin) <= self.height / 2
+        )
+
+    def intersection_area(
+        self, other: "RotatedRectangleArray", chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> np.ndarray:
+        if not isinstance(other, RotatedRectangleArray) or len(other) != len(self):
+            raise ValueError(
+                f"Trying to intersect RotatedRectangleArray {str(self)} with non matching object {str(other)}"
+            )
+        first, second = self.corners(), other.corners()
+        overlapping = np.flatnonzero(
+            (
+                (first.min(axis=1) <= second.max(axis=1))
+                & (second.min(axis=1) <= first.max(axis=1))
+            ).all(axis=1)
+        )
+        area = np.zeros(len(self))
+        for start in range(0, overlapping.size, chunk_size):
+            rows = overlapping[start : start + chunk_size]
+            area[rows] = convex_intersection_area(first[rows], second[rows])
+        return area
+
+    def iou(self, other: "RotatedRectangleArray") -> np.ndarray:
+        intersection = self.intersection_area(other)
+        union = self.area + other.area - intersection
+        return np.divide(
+            intersection,
+            union,
+            out=np.zeros(union.shape, dtype=np.float64),
+            where=union > 0,
+        )
+
+    def __len__(self) -> int:
+        return self.cxcywha.shape[0]
+
+    def __iter__(self) -> Iterator[RotatedRectangle]:
+        return iter(self.to_rotated_rectangles())
+
+    def __getitem__(self, index) -> Union[RotatedRectangle, "RotatedRectangleArray"]:
+        if isinstance(index, (int, np.integer)):
+            cx, cy, w, h, a = self.cxcywha[index].tolist()
+            return RotatedRectangle(Point(cx, cy), w, h, a)
+        return RotatedRectangleArray(self.cxcywha[index])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RotatedRectangleArray):
+            return self.cxcywha.shape == other.cxcywha.shape and bool(
+                np.all(self.cxcywha == other.cxcywha)
+            )
+        else:
+            return False
+
+    def __str__(self) -> str:
+        return f"RotatedRectangleArray({len(self)})"
@@ -0,0 +1,25 @@
+from utils.lazy_import import lazy_exports
+
+_EXPORTS = {
+    "associate": ".association",
+    "greedy_assignment": ".association",
+    "hungarian_assignment": ".association",
+    "deduplicate_points": ".dedup",
+    "deduplicate_rectangles": ".dedup",
+    "unique_points": ".dedup",
+    "unique_rectangles": ".dedup",
+    "pairwise_intersection_area": ".iou",
+    "pairwise_iou": ".iou",
+    "pairwise_rotated_iou": ".iou",
+    "pairwise_union_area": ".iou",
+    "batched_nms": ".nms",
+    "soft_nms": ".nms",
+    "parallel_map": ".parallel",
+    "parallel_pairwise_iou": ".parallel",
+    "parallel_to_xywh": ".parallel",
+    "RectanglePipeline": ".pipeline",
+    "RectangleStatistics": ".statistics",
+}
+
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
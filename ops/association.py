@@ -0,0 +1,207 @@
+from typing import Optional, Tuple
+import numpy as np
+from data_types.rectangle_array import Rectangles, as_rectangle_array
+from ops.iou import pairwise_iou
+
+COST_METRICS = ("iou", "center_distance")
+SOLVERS = ("greedy", "hungarian")
+
+Assignment = Tuple[np.ndarray, np.ndarray]
+
+
+def iou_cost(first: Rectangles, second: Rectangles) -> np.ndarray:
+    cost = pairwise_iou(first, second)
+    return np.subtract(1.0, cost, out=cost)
+
+
+def center_distance_cost(first: Rectangles, second: Rectangles) -> np.ndarray:
+    first = as_rectangle_array(first)
+    second = as_rectangle_array(second)
+    first_center = (first.xyxy[:, :2] + first.xyxy[:, 2:]) / 2
+    second_center = (second.xyxy[:, :2] + second.xyxy[:, 2:]) / 2
+    return np.hypot(
+        first_center[:, None, 0] - second_center[None, :, 0],
+        first_center[:, None, 1] - second_center[None, :, 1],
+    )
+
+
+def cost_matrix(
+    first: Rectangles, second: Rectangles, metric: str = "iou"
+) -> np.ndarray:
+    if metric == "iou":
+        return iou_cost(first, second)
+    elif metric == "center_distance":
+        return center_distance_cost(first, second)
+    else:
+        raise ValueError(
+            f"Unknown association metric {metric}, expected one of {COST_METRICS}"
+        )
+
+
+def gate(cost: np.ndarray, max_cost: float) -> np.ndarray:
+    return np.where(cost <= max_cost, cost, np.inf)
+
+
+def _as_cost(cost: np.ndarray) -> np.ndarray:
+    cost = np.asarray(cost, dtype=np.float64)
+    if cost.ndim != 2:
+        raise ValueError(f"Expected a 2D cost matrix, got shape {cost.shape}")
+    if np.isnan(cost).any():
+        raise ValueError("Cost matrix contains NaN entries")
+    return cost
+
+
+def _empty_assignment() -> Assignment:
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+
+def greedy_assignment(cost: np.ndarray) -> Assignment:
+    cost = _as_cost(cost)
+    rows, columns = np.nonzero(np.isfinite(cost))
+    if rows.size == 0:
+        return _empty_assignment()
+    order = np.argsort(cost[rows, columns], kind="stable")
+    limit = min(cost.shape)
+    row_used = np.zeros(cost.shape[0], dtype=bool)
+    column_used = np.zeros(cost.shape[1], dtype=bool)
+    matched_rows = []
+    matched_columns = []
+    for row, column in zip(rows[order].tolist(), columns[order].tolist()):
+        if row_used[row] or column_used[column]:
+            continue
+        row_used[row] = column_used[column] = True
+        matched_rows.append(row)
+        matched_columns.append(column)
+        if len(matched_rows) == limit:
+            break
+    matched_rows = np.array(matched_rows, dtype=np.int64)
+    matched_columns = np.array(matched_columns, dtype=np.int64)
+    order = np.argsort(matched_rows)
+    return matched_rows[order], matched_columns[order]
+
+
+def _shortest_augmenting_paths(cost: np.ndarray) -> np.ndarray:
+    rows, columns = cost.shape
+    padded = np.zeros((rows + 1, columns + 1))
+    padded[1:, 1:] = cost
+    row_potential = np.zeros(rows + 1)
+    column_potential = np.zeros(columns + 1)
+    owner = np.zeros(columns + 1, dtype=np.int64)
+    way = np.zeros(columns + 1, dtype=np.int64)
+    for row in range(1, rows + 1):
+        owner[0] = row
+        column = 0
+        slack = np.full(columns + 1, np.inf)
+        used = np.zeros(columns + 1, dtype=bool)
+        while True:
+            used[column] = True
+            current = owner[column]
+            reduced = padded[current] - row_potential[current] - column_potential
+            free = ~used
+            better = free & (reduced < slack)
+            slack[better] = reduced[better]
+            way[better] = column
+            candidates = np.where(free, slack, np.inf)
+            column = int(np.argmin(candidates))
+            delta = candidates[column]
+            row_potential[owner[used]] += delta
+            column_potential[used] -= delta
+            slack[free] -= delta
+            if owner[column] == 0:
+                break
+        while column:
+            previous = way[column]
+            owner[column] = owner[previous]
+            column = previous
+    return owner[1:] - 1
+
+
+def _solve_dense(cost: np.ndarray) -> Assignment:
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    finite = np.isfinite(cost)
+    values = cost[finite]
+    low, high = values.min(), values.max()
+    penalty = (high - low + 1) * min(cost.shape) + 1
+    shifted = np.where(finite, cost - low, penalty)
+    owner = _shortest_augmenting_paths(shifted)
+    columns = np.flatnonzero(owner >= 0)
+    rows = owner[columns]
+    keep = finite[rows, columns]
+    rows, columns = rows[keep], columns[keep]
+    if transposed:
+        rows, columns = columns, rows
+    order = np.argsort(rows)
+    return rows[order], columns[order]
+
+
+def _components(
+    rows: np.ndarray, columns: np.ndarray, shape: Tuple[int, int]
+) -> np.ndarray:
+    columns = columns + shape[0]
+    labels = np.arange(shape[0] + shape[1])
+    while True:
+        edge_labels = np.minimum(labels[rows], labels[columns])
+        updated = labels.copy()
+        np.minimum.at(updated, rows, edge_labels)
+        np.minimum.at(updated, columns, edge_labels)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            return labels[rows]
+        labels = updated
+
+
+def hungarian_assignment(cost: np.ndarray) -> Assignment:
+    cost = _as_cost(cost)
+    rows, columns = np.nonzero(np.isfinite(cost))
+    if rows.size == 0:
+        return _empty_assignment()
+    components = _components(rows, columns, cost.shape)
+    order = np.argsort(components, kind="stable")
+    rows, columns, components = rows[order], columns[order], components[order]
+    starts = np.flatnonzero(np.r_[True, components[1:] != components[:-1]])
+    ends = np.r_[starts[1:], components.size]
+    matched_rows = []
+    matched_columns = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if end - start == 1:
+            matched_rows.append(rows[start : start + 1])
+            matched_columns.append(columns[start : start + 1])
+            continue
+        component_rows = np.unique(rows[start:end])
+        component_columns = np.unique(columns[start:end])
+        local_rows, local_columns = _solve_dense(
+            cost[np.ix_(component_rows, component_columns)]
+        )
+        matched_rows.append(component_rows[local_rows])
+        matched_columns.append(component_columns[local_columns])
+    matched_rows = np.concatenate(matched_rows)
+    matched_columns = np.concatenate(matched_columns)
+    order = np.argsort(matched_rows)
+    return matched_rows[order], matched_columns[order]
+
+
+def associate(
+    first: Rectangles,
+    second: Rectangles,
+    metric: str = "iou",
+    max_cost: Optional[float] = None,
+    solver: str = "hungarian",
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if solver not in SOLVERS:
+        raise ValueError(
+            f"Unknown assignment solver {solver}, expected one of {SOLVERS}"
+        )
+    first = as_rectangle_array(first)
+    second = as_rectangle_array(second)
+    cost = cost_matrix(first, second, metric)
+    if max_cost is not None:
+        cost = gate(cost, max_cost)
+    if solver == "greedy":
+        rows, columns = greedy_assignment(cost)
+    else:
+        rows, columns = hungarian_assignment(cost)
+    unmatched_first = np.setdiff1d(np.arange(len(first)), rows)
+    unmatched_second = np.setdiff1d(np.arange(len(second)), columns)
+    return np.stack((rows, columns), axis=1), unmatched_first, unmatched_second
@@ -0,0 +1,56 @@
+from typing import Tuple
+import numpy as np
+from data_types.point_array import PointArray, Points, as_point_array
+from data_types.rectangle_array import RectangleArray, Rectangles, as_rectangle_array
+
+
+def snap_to_grid(values: np.ndarray, tolerance: float) -> np.ndarray:
+    if tolerance < 0:
+        raise ValueError(
+            f"Deduplication tolerance must be non negative, got {tolerance}"
+        )
+    if tolerance == 0:
+        return values
+    return np.floor(values / tolerance + 0.5)
+
+
+def unique_rows(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    if len(values) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    order = np.lexsort(values.T[::-1])
+    ordered = values[order]
+    starts = np.r_[True, np.any(ordered[1:] != ordered[:-1], axis=1)]
+    group_of_sorted = np.cumsum(starts) - 1
+    labels = np.empty(len(values), dtype=np.int64)
+    labels[order] = group_of_sorted
+    first = order[starts]
+    by_position = np.argsort(first, kind="stable")
+    rank = np.empty_like(by_position)
+    rank[by_position] = np.arange(len(by_position))
+    return first[by_position], rank[labels]
+
+
+def unique_points(
+    points: Points, tolerance: float = 0.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    return unique_rows(snap_to_grid(as_point_array(points).xy, tolerance))
+
+
+def unique_rectangles(
+    rectangles: Rectangles, tolerance: float = 0.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    return unique_rows(snap_to_grid(as_rectangle_array(rectangles).xyxy, tolerance))
+
+
+def deduplicate_points(points: Points, tolerance: float = 0.0) -> PointArray:
+    points = as_point_array(points)
+    indices, _ = unique_points(points, tolerance)
+    return points[indices]
+
+
+def deduplicate_rectangles(
+    rectangles: Rectangles, tolerance: float = 0.0
+) -> RectangleArray:
+    rectangles = as_rectangle_array(rectangles)
+    indices, _ = unique_rectangles(rectangles, tolerance)
+    return rectangles[indices]
@@ -0,0 +1,140 @@
+from typing import TYPE_CHECKING, Callable
+import numpy as np
+from data_types.rectangle_array import RectangleArray, Rectangles, as_rectangle_array
+
+if TYPE_CHECKING:
+    from data_types.rotated_rectangle_array import RotatedRectangleArray
+
+DEFAULT_MAX_TILE_ELEMENTS = 1 << 22
+
+
+def intersection_tile(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    width = np.minimum(first[:, None, 2], second[None, :, 2]) - np.maximum(
+        first[:, None, 0], second[None, :, 0]
+    )
+    height = np.minimum(first[:, None, 3], second[None, :, 3]) - np.maximum(
+        first[:, None, 1], second[None, :, 1]
+    )
+    np.maximum(width, 0, out=width)
+    np.maximum(height, 0, out=height)
+    return np.multiply(width, height, out=width)
+
+
+def _union_tile(
+    intersection: np.ndarray, first_area: np.ndarray, second_area: np.ndarray
+) -> np.ndarray:
+    return first_area[:, None] + second_area[None, :] - intersection
+
+
+def _tiled(
+    first: RectangleArray,
+    second: RectangleArray,
+    tile: Callable[[slice], np.ndarray],
+    dtype: np.dtype,
+    max_tile_elements: int,
+) -> np.ndarray:
+    rows, columns = len(first), len(second)
+    result = np.empty((rows, columns), dtype=dtype)
+    step = max(1, max_tile_elements // max(columns, 1))
+    for start in range(0, rows, step):
+        rows_slice = slice(start, min(start + step, rows))
+        result[rows_slice] = tile(rows_slice)
+    return result
+
+
+def _area_dtype(first: RectangleArray, second: RectangleArray) -> np.dtype:
+    return np.result_type(first.xyxy, second.xyxy)
+
+
+def pairwise_intersection_area(
+    first: Rectangles,
+    second: Rectangles,
+    max_tile_elements: int = DEFAULT_MAX_TILE_ELEMENTS,
+) -> np.ndarray:
+    first = as_rectangle_array(first)
+    second = as_rectangle_array(second)
+    return _tiled(
+        first,
+        second,
+        lambda rows: intersection_tile(first.xyxy[rows], second.xyxy),
+        _area_dtype(first, second),
+        max_tile_elements,
+    )
+
+
+def pairwise_union_area(
+    first: Rectangles,
+    second: Rectangles,
+    max_tile_elements: int = DEFAULT_MAX_TILE_ELEMENTS,
+) -> np.ndarray:
+    first = as_rectangle_array(first)
+    second = as_rectangle_array(second)
+    first_area = first.clamped_area
+    second_area = second.clamped_area
+    return _tiled(
+        first,
+        second,
+        lambda rows: _union_tile(
+            intersection_tile(first.xyxy[rows], second.xyxy),
+            first_area[rows],
+            second_area,
+        ),
+        _area_dtype(first, second),
+        max_tile_elements,
+    )
+
+
+def iou_tile(
+    first: np.ndarray,
+    second: np.ndarray,
+    first_area: np.ndarray,
+    second_area: np.ndarray,
+) -> np.ndarray:
+    intersection = intersection_tile(first, second)
+    union = _union_tile(intersection, first_area, second_area)
+    return np.divide(
+        intersection,
+        union,
+        out=np.zeros(union.shape, dtype=np.float64),
+        where=union > 0,
+    )
+
+
+def pairwise_iou(
+    first: Rectangles,
+    second: Rectangles,
+    max_tile_elements: int = DEFAULT_MAX_TILE_ELEMENTS,
+) -> np.ndarray:
+    first = as_rectangle_array(first)
+    second = as_rectangle_array(second)
+    first_area = first.clamped_area
+    second_area = second.clamped_area
+    return _tiled(
+        first,
+        second,
+        lambda rows: iou_tile(
+            first.xyxy[rows], second.xyxy, first_area[rows], second_area
+        ),
+        np.dtype(np.float64),
+        max_tile_elements,
+    )
+
+
+def pairwise_rotated_iou(
+    first: "RotatedRectangleArray",
+    second: "RotatedRectangleArray",
+    max_tile_elements: int = DEFAULT_MAX_TILE_ELEMENTS,
+) -> np.ndarray:
+    first_bounds = first.bounding_rectangles()
+    second_bounds = second.bounding_rectangles()
+
+    def tile(rows: slice) -> np.ndarray:
+        overlapping = intersection_tile(first_bounds.xyxy[rows], second_bounds.xyxy)
+        pair_rows, columns = np.nonzero(overlapping > 0)
+        result = np.zeros(overlapping.shape, dtype=np.float64)
+        result[pair_rows, columns] = first[pair_rows + rows.start].iou(second[columns])
+        return result
+
+    return _tiled(
+        first_bounds, second_bounds, tile, np.dtype(np.float64), max_tile_elements
+    )
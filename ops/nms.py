@@ -0,0 +1,342 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from data_types.rectangle_array import RectangleArray, Rectangles, as_rectangle_array
+
+SOFT_NMS_METHODS = ("gaussian", "linear", "hard")
+PAIR_CHUNK_ELEMENTS = 1 << 20
+DENSE_CANDIDATES_PER_BOX = 64
+SCAN_COMPACT_EVERY = 32
+MAX_STRIPS_PER_BOX = 64
+
+
+def _as_scores(scores: np.ndarray, count: int) -> np.ndarray:
+    scores = np.asarray(scores, dtype=np.float64)
+    if scores.shape != (count,):
+        raise ValueError(
+            f"Expected {count} scores matching the rectangles, got shape {scores.shape}"
+        )
+    return scores
+
+
+def _as_groups(classes: np.ndarray, count: int) -> np.ndarray:
+    classes = np.asarray(classes)
+    if classes.shape != (count,):
+        raise ValueError(
+            f"Expected {count} classes matching the rectangles, got shape {classes.shape}"
+        )
+    return np.unique(classes, return_inverse=True)[1].reshape(count)
+
+
+def _ranges(counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    owners = np.repeat(np.arange(counts.size), counts)
+    offsets = np.arange(owners.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owners, offsets
+
+
+def _sweep(xyxy: np.ndarray, groups: np.ndarray) -> Tuple[np.ndarray, ...]:
+    heights = xyxy[:, 3] - xyxy[:, 1]
+    boxes = np.flatnonzero((xyxy[:, 2] > xyxy[:, 0]) & (heights > 0))
+    first_strip = np.zeros(len(xyxy), dtype=np.int64)
+    empty = np.empty(0, dtype=np.int64)
+    if boxes.size < 2:
+        return empty, empty, empty, first_strip, empty, empty, empty
+
+    strip_height = float(np.median(heights[boxes]))
+    origin = xyxy[boxes, 1].min()
+    first = (xyxy[boxes, 1] - origin) // strip_height
+    last = (xyxy[boxes, 3] - origin) // strip_height
+    tall = last - first >= MAX_STRIPS_PER_BOX
+    overflow = boxes[tall]
+    boxes, first, last = boxes[~tall], first[~tall], last[~tall]
+    if boxes.size == 0:
+        return empty, empty, empty, first_strip, empty, empty, overflow
+    first_strip[boxes] = first
+    last_strip = last.astype(np.int64)
+    owners, offsets = _ranges(last_strip - first_strip[boxes] + 1)
+    members = boxes[owners]
+    strips = first_strip[members] + offsets
+
+    keys = groups[members] * (int(strips.max()) + 1) + strips
+    left, right = xyxy[members, 0], xyxy[members, 2]
+    span = float(right.max() - left.min()) + 1.0
+    starts = keys * span + (left - left.min())
+    order = np.argsort(starts, kind="stable")
+    ends = np.searchsorted(
+        starts[order], (keys * span + (right - left.min()))[order], side="right"
+    )
+    counts = np.maximum(ends - np.arange(order.size) - 1, 0)
+    return members, keys, strips, first_strip, order, counts, overflow
+
+
+def _candidate_pairs(
+    members: np.ndarray,
+    keys: np.ndarray,
+    strips: np.ndarray,
+    first_strip: np.ndarray,
+    order: np.ndarray,
+    counts: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    firsts = [np.empty(0, dtype=np.int64)]
+    seconds = [np.empty(0, dtype=np.int64)]
+    boundaries = np.cumsum(counts)
+    start = 0
+    while start < order.size:
+        budget = (boundaries[start - 1] if start else 0) + PAIR_CHUNK_ELEMENTS
+        stop = max(start + 1, int(np.searchsorted(boundaries, budget, side="right")))
+        owners, offsets = _ranges(counts[start:stop])
+        first = order[start + owners]
+        second = order[start + owners + 1 + offsets]
+        first_boxes, second_boxes = members[first], members[second]
+        owned = (keys[first] == keys[second]) & (
+            strips[first]
+            == np.maximum(first_strip[first_boxes], first_strip[second_boxes])
+        )
+        firsts.append(first_boxes[owned])
+        seconds.append(second_boxes[owned])
+        start = stop
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+def _overflow_pairs(
+    columns: List[np.ndarray], groups: np.ndarray, overflow: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    firsts = [np.empty(0, dtype=np.int64)]
+    seconds = [np.empty(0, dtype=np.int64)]
+    tall = np.zeros(len(groups), dtype=np.bool_)
+    tall[overflow] = True
+    for index in overflow.tolist():
+        others = _overlapping(columns, index, 0)
+        others = others[
+            (groups[others] == groups[index]) & (~tall[others] | (others > index))
+        ]
+        firsts.append(np.full(others.size, index, dtype=np.int64))
+        seconds.append(others)
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+def _pair_iou(
+    xyxy: np.ndarray, areas: np.ndarray, first: np.ndarray, second: np.ndarray
+) -> np.ndarray:
+    width = np.minimum(xyxy[first, 2], xyxy[second, 2]) - np.maximum(
+        xyxy[first, 0], xyxy[second, 0]
+    )
+    height = np.minimum(xyxy[first, 3], xyxy[second, 3]) - np.maximum(
+        xyxy[first, 1], xyxy[second, 1]
+    )
+    np.maximum(width, 0, out=width)
+    np.maximum(height, 0, out=height)
+    intersection = np.multiply(width, height, out=width)
+    union = areas[first] + areas[second] - intersection
+    return np.divide(
+        intersection,
+        union,
+        out=np.zeros(union.shape, dtype=np.float64),
+        where=union > 0,
+    )
+
+
+def _columns(xyxy: np.ndarray, areas: np.ndarray) -> List[np.ndarray]:
+    return [np.ascontiguousarray(column) for column in xyxy.T] + [areas]
+
+
+def _iou_against(
+    columns: List[np.ndarray], index: int, others: np.ndarray
+) -> np.ndarray:
+    x1, y1, x2, y2, areas = columns
+    width = np.minimum(x2[others], x2[index]) - np.maximum(x1[others], x1[index])
+    height = np.minimum(y2[others], y2[index]) - np.maximum(y1[others], y1[index])
+    np.maximum(width, 0, out=width)
+    np.maximum(height, 0, out=height)
+    intersection = np.multiply(width, height, out=width)
+    union = areas[others] + areas[index] - intersection
+    return np.divide(
+        intersection,
+        union,
+        out=np.zeros(union.shape, dtype=np.float64),
+        where=union > 0,
+    )
+
+
+def _overlapping(columns: List[np.ndarray], index: int, start: int) -> np.ndarray:
+    x1, y1, x2, y2, _ = columns
+    tail = slice(start, None)
+    return (
+        np.flatnonzero(
+            (x1[tail] < x2[index])
+            & (x2[tail] > x1[index])
+            & (y1[tail] < y2[index])
+            & (y2[tail] > y1[index])
+        )
+        + start
+    )
+
+
+def _x_density(xyxy: np.ndarray, groups: np.ndarray) -> float:
+    span = float(np.ptp(xyxy[:, [0, 2]])) + 1.0 if len(xyxy) else 1.0
+    starts = groups * span + xyxy[:, 0]
+    order = np.argsort(starts)
+    ends = np.searchsorted(starts[order], (groups * span + xyxy[:, 2])[order])
+    return float(np.maximum(ends - np.arange(len(xyxy)) - 1, 0).sum()) / max(
+        len(xyxy), 1
+    )
+
+
+def _scan_greedy(
+    xyxy: np.ndarray,
+    areas: np.ndarray,
+    groups: np.ndarray,
+    iou_threshold: float,
+    limit: int,
+) -> List[int]:
+    positions = np.arange(len(xyxy))
+    columns = _columns(xyxy, areas)
+    alive = np.ones(len(xyxy), dtype=np.bool_)
+    keep = []
+    index = -1
+    while len(keep) < limit and index + 1 < len(positions):
+        remaining = alive[index + 1 :]
+        step = int(np.argmax(remaining))
+        if not remaining[step]:
+            break
+        index += 1 + step
+        keep.append(int(positions[index]))
+        candidates = _overlapping(columns, index, index + 1)
+        candidates = candidates[groups[candidates] == groups[index]]
+        if candidates.size > 0:
+            iou = _iou_against(columns, index, candidates)
+            alive[candidates[iou > iou_threshold]] = False
+        if len(keep) % SCAN_COMPACT_EVERY == 0:
+            survivors = alive[index + 1 :]
+            positions = positions[index + 1 :][survivors]
+            columns = [column[index + 1 :][survivors] for column in columns]
+            groups = groups[index + 1 :][survivors]
+            alive = np.ones(len(positions), dtype=np.bool_)
+            index = -1
+    return keep
+
+
+def _sparse_greedy(
+    xyxy: np.ndarray,
+    areas: np.ndarray,
+    groups: np.ndarray,
+    iou_threshold: float,
+    limit: int,
+) -> List[int]:
+    *sweep, overflow = _sweep(xyxy, groups)
+    first, second = _candidate_pairs(*sweep)
+    if overflow.size:
+        tall_first, tall_second = _overflow_pairs(
+            _columns(xyxy, areas), groups, overflow
+        )
+        first = np.concatenate((first, tall_first))
+        second = np.concatenate((second, tall_second))
+    overlapping = _pair_iou(xyxy, areas, first, second) > iou_threshold
+    first, second = first[overlapping], second[overlapping]
+    sources, targets = np.minimum(first, second), np.maximum(first, second)
+    undecided, kept, suppressed = 0, 1, 2
+    state = np.zeros(len(xyxy), dtype=np.int8)
+    while True:
+        blockers = np.bincount(
+            targets[state[sources] != suppressed], minlength=len(xyxy)
+        )
+        state[(state == undecided) & (blockers == 0)] = kept
+        state[targets[state[sources] == kept]] = suppressed
+        if not np.any(state == undecided):
+            break
+    return np.flatnonzero(state == kept)[:limit].tolist()
+
+
+def _greedy_nms(
+    boxes: RectangleArray,
+    scores: np.ndarray,
+    groups: np.ndarray,
+    iou_threshold: float,
+    max_output: Optional[int],
+) -> np.ndarray:
+    limit = len(boxes) if max_output is None else max_output
+    order = np.argsort(-scores, kind="stable")
+    groups = groups[order]
+    if iou_threshold < 0:
+        firsts = np.unique(groups, return_index=True)[1]
+        return order[np.sort(firsts)][:limit]
+
+    xyxy = boxes.xyxy[order]
+    areas = boxes.clamped_area[order]
+    if _x_density(xyxy, groups) > DENSE_CANDIDATES_PER_BOX:
+        keep = _scan_greedy(xyxy, areas, groups, iou_threshold, limit)
+    else:
+        keep = _sparse_greedy(xyxy, areas, groups, iou_threshold, limit)
+    return order[np.array(keep, dtype=np.int64)]
+
+
+def nms(
+    rectangles: Rectangles,
+    scores: np.ndarray,
+    iou_threshold: float,
+    max_output: Optional[int] = None,
+) -> np.ndarray:
+    boxes = as_rectangle_array(rectangles)
+    scores = _as_scores(scores, len(boxes))
+    groups = np.zeros(len(boxes), dtype=np.int64)
+    return _greedy_nms(boxes, scores, groups, iou_threshold, max_output)
+
+
+def batched_nms(
+    rectangles: Rectangles,
+    scores: np.ndarray,
+    classes: np.ndarray,
+    iou_threshold: float,
+    max_output: Optional[int] = None,
+) -> np.ndarray:
+    boxes = as_rectangle_array(rectangles)
+    scores = _as_scores(scores, len(boxes))
+    groups = _as_groups(classes, len(boxes))
+    return _greedy_nms(boxes, scores, groups, iou_threshold, max_output)
+
+
+def soft_nms(
+    rectangles: Rectangles,
+    scores: np.ndarray,
+    iou_threshold: float = 0.3,
+    sigma: float = 0.5,
+    score_threshold: float = 0.001,
+    method: str = "gaussian",
+    max_output: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    if method not in SOFT_NMS_METHODS:
+        raise ValueError(
+            f"Unknown soft-NMS method {method}, expected one of {SOFT_NMS_METHODS}"
+        )
+    boxes = as_rectangle_array(rectangles)
+    scores = _as_scores(scores, len(boxes))
+    limit = len(boxes) if max_output is None else max_output
+    positions = np.flatnonzero(scores > score_threshold)
+    columns = _columns(boxes.xyxy[positions], boxes.clamped_area[positions])
+    current = scores[positions]
+    keep = []
+    kept_scores = []
+    while len(keep) < limit and current.size > 0:
+        top = int(np.argmax(current))
+        score = current[top]
+        if not score > score_threshold:
+            break
+        keep.append(positions[top])
+        kept_scores.append(score)
+        current[top] = -np.inf
+        candidates = _overlapping(columns, top, 0)
+        candidates = candidates[current[candidates] > score_threshold]
+        if candidates.size > 0:
+            iou = _iou_against(columns, top, candidates)
+            if method == "gaussian":
+                decay = np.exp(-(iou * iou) / sigma)
+            elif method == "linear":
+                decay = np.where(iou > iou_threshold, 1.0 - iou, 1.0)
+            else:
+                decay = np.where(iou > iou_threshold, 0.0, 1.0)
+            current[candidates] *= decay
+        if len(keep) % SCAN_COMPACT_EVERY == 0:
+            survivors = current > score_threshold
+            positions = positions[survivors]
+            columns = [column[survivors] for column in columns]
+            current = current[survivors]
+    return np.array(keep, dtype=np.int64), np.array(kept_scores, dtype=np.float64)
@@ -0,0 +1,144 @@
+from typing import Callable, List, Optional, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import os
+import numpy as np
+from data_types.rectangle_array import RectangleArray, Rectangles, as_rectangle_array
+from ops.iou import pairwise_iou
+from serialization.box_formats import rectangles_to_array
+
+SHARDS_PER_WORKER = 4
+
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+
+def _share(array: np.ndarray) -> Tuple[SharedMemory, ArraySpec]:
+    block = SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _run_shard(
+    function: Callable[..., np.ndarray],
+    inputs: List[ArraySpec],
+    output: ArraySpec,
+    start: int,
+    stop: int,
+) -> None:
+    blocks = [SharedMemory(name=name) for name, _, _ in inputs + [output]]
+    try:
+        arrays = [
+            np.ndarray(shape, dtype=dtype, buffer=block.buf)
+            for (_, shape, dtype), block in zip(inputs + [output], blocks)
+        ]
+        arrays[-1][start:stop] = function(arrays[0][start:stop], *arrays[1:-1])
+        del arrays
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def _shards(count: int, workers: int) -> List[Tuple[int, int]]:
+    bounds = np.linspace(0, count, min(count, workers * SHARDS_PER_WORKER) + 1)
+    bounds = bounds.astype(np.int64).tolist()
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _run_shards(
+    executor: Executor,
+    function: Callable[..., np.ndarray],
+    specs: List[ArraySpec],
+    output: ArraySpec,
+    count: int,
+    workers: int,
+) -> None:
+    futures = [
+        executor.submit(_run_shard, function, specs, output, start, stop)
+        for start, stop in _shards(count, workers)
+    ]
+    for future in futures:
+        future.result()
+
+
+def parallel_map(
+    function: Callable[..., np.ndarray],
+    rows: np.ndarray,
+    *arguments: np.ndarray,
+    row_shape: Tuple[int, ...] = (),
+    dtype: np.dtype = np.float64,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> np.ndarray:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Parallel execution needs at least one worker, got {workers}")
+    rows = np.ascontiguousarray(rows)
+    if workers == 1 or len(rows) < 2:
+        return np.asarray(function(rows, *arguments), dtype=dtype).reshape(
+            (len(rows),) + tuple(row_shape)
+        )
+
+    blocks: List[SharedMemory] = []
+    try:
+        specs = []
+        for array in (rows,) + arguments:
+            block, spec = _share(np.ascontiguousarray(array))
+            blocks.append(block)
+            specs.append(spec)
+        output = np.empty((len(rows),) + tuple(row_shape), dtype=dtype)
+        block, output_spec = _share(output)
+        blocks.append(block)
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                _run_shards(pool, function, specs, output_spec, len(rows), workers)
+        else:
+            _run_shards(executor, function, specs, output_spec, len(rows), workers)
+        output[...] = np.ndarray(output.shape, dtype=output.dtype, buffer=block.buf)
+        return output
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _iou_rows(rows: np.ndarray, second: np.ndarray) -> np.ndarray:
+    return pairwise_iou(RectangleArray(rows), RectangleArray(second))
+
+
+def _xywh_rows(rows: np.ndarray) -> np.ndarray:
+    return rectangles_to_array(RectangleArray(rows), layout="xywh")
+
+
+def parallel_pairwise_iou(
+    first: Rectangles,
+    second: Rectangles,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> np.ndarray:
+    second = as_rectangle_array(second)
+    return parallel_map(
+        _iou_rows,
+        as_rectangle_array(first).xyxy,
+        second.xyxy,
+        row_shape=(len(second),),
+        dtype=np.float64,
+        workers=workers,
+        executor=executor,
+    )
+
+
+def parallel_to_xywh(
+    rectangles: Rectangles,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> np.ndarray:
+    xyxy = as_rectangle_array(rectangles).xyxy
+    return parallel_map(
+        _xywh_rows,
+        xyxy,
+        row_shape=(4,),
+        dtype=xyxy.dtype,
+        workers=workers,
+        executor=executor,
+    )
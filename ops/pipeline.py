@@ -0,0 +1,128 @@
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+from itertools import islice
+import operator
+import numpy as np
+from data_types.point import Point, SCALAR_TYPES
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray, Rectangles
+
+PIPELINE_OUTPUTS = ("rectangles", "xyxy", "xywh")
+DEFAULT_PIPELINE_CHUNK_SIZE = 1 << 14
+
+Stage = Tuple[Callable, Optional[Union[int, float]], Optional[Union[int, float]]]
+
+_ARRAY_ACTIONS = {
+    operator.add: np.add,
+    operator.sub: np.subtract,
+    operator.mul: np.multiply,
+    operator.truediv: np.true_divide,
+}
+_ARRAY_CASTS = {int: np.int64, float: np.float64}
+
+
+class RectanglePipeline:
+    def __init__(
+        self, stages: Tuple[Stage, ...] = (), output: str = "rectangles"
+    ) -> None:
+        if output not in PIPELINE_OUTPUTS:
+            raise ValueError(
+                f"Unknown pipeline output {output}, expected one of {', '.join(PIPELINE_OUTPUTS)}"
+            )
+        self.stages = stages
+        self.output = output
+
+    def _then(self, action: Callable, other: object, name: str) -> "RectanglePipeline":
+        if isinstance(other, Point):
+            stage = (action, other.x, other.y)
+        elif isinstance(other, SCALAR_TYPES):
+            stage = (action, other, other)
+        else:
+            raise ValueError(
+                f"Trying to {name} RectanglePipeline with non Point object {str(other)}"
+            )
+        return RectanglePipeline(self.stages + (stage,), self.output)
+
+    def add(self, other: Union[Point, int, float]) -> "RectanglePipeline":
+        return self._then(operator.add, other, "add to")
+
+    def subtract(self, other: Union[Point, int, float]) -> "RectanglePipeline":
+        return self._then(operator.sub, other, "subtract from")
+
+    def multiply(self, other: Union[Point, int, float]) -> "RectanglePipeline":
+        return self._then(operator.mul, other, "multiply")
+
+    def divide(self, other: Union[Point, int, float]) -> "RectanglePipeline":
+        return self._then(operator.truediv, other, "divide")
+
+    def translate(self, offset: Union[Point, int, float]) -> "RectanglePipeline":
+        return self.add(offset)
+
+    def scale(self, factor: Union[Point, int, float]) -> "RectanglePipeline":
+        return self.multiply(factor)
+
+    def as_int(self) -> "RectanglePipeline":
+        return RectanglePipeline(self.stages + ((int, None, None),), self.output)
+
+    def as_float(self) -> "RectanglePipeline":
+        return RectanglePipeline(self.stages + ((float, None, None),), self.output)
+
+    def to_rectangles(self) -> "RectanglePipeline":
+        return RectanglePipeline(self.stages, "rectangles")
+
+    def to_xyxy(self) -> "RectanglePipeline":
+        return RectanglePipeline(self.stages, "xyxy")
+
+    def to_xywh(self) -> "RectanglePipeline":
+        return RectanglePipeline(self.stages, "xywh")
+
+    def run(self, rectangles: Iterable[Rectangle]) -> Iterator:
+        stages = self.stages
+        output = self.output
+        for rect in rectangles:
+            x1, y1 = rect.top_left.x, rect.top_left.y
+            x2, y2 = rect.bottom_right.x, rect.bottom_right.y
+            for action, dx, dy in stages:
+                if dx is None:
+                    x1, y1, x2, y2 = action(x1), action(y1), action(x2), action(y2)
+                else:
+                    x1, y1 = action(x1, dx), action(y1, dy)
+                    x2, y2 = action(x2, dx), action(y2, dy)
+            if output == "rectangles":
+                yield Rectangle(Point(x1, y1), Point(x2, y2))
+            elif output == "xyxy":
+                yield (x1, y1, x2, y2)
+            else:
+                yield (x1, y1, x2 - x1, y2 - y1)
+
+    def apply(self, rectangles: RectangleArray) -> Union[RectangleArray, np.ndarray]:
+        values = rectangles.xyxy
+        for action, dx, dy in self.stages:
+            if dx is None:
+                values = values.astype(_ARRAY_CASTS[action])
+            else:
+                values = _ARRAY_ACTIONS[action](values, np.array((dx, dy, dx, dy)))
+        if self.output == "rectangles":
+            return RectangleArray(values)
+        elif self.output == "xyxy":
+            return values
+        else:
+            return np.concatenate(
+                (values[:, :2], values[:, 2:] - values[:, :2]), axis=1
+            )
+
+    def run_chunked(
+        self, rectangles: Rectangles, chunk_size: int = DEFAULT_PIPELINE_CHUNK_SIZE
+    ) -> Iterator[Union[RectangleArray, np.ndarray]]:
+        if isinstance(rectangles, RectangleArray):
+            for start in range(0, len(rectangles), chunk_size):
+                yield self.apply(rectangles[start : start + chunk_size])
+            return
+        iterator = iter(rectangles)
+        while True:
+            chunk: List[Rectangle] = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield self.apply(RectangleArray.from_rectangles(chunk))
+
+    def __str__(self) -> str:
+        return f"RectanglePipeline({len(self.stages)},{self.output})"
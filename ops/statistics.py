@@ -0,0 +1,230 @@
+from typing import Dict, List, Optional, Sequence, Union
+from bisect import bisect_right
+from itertools import islice
+import math
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray, Rectangles
+
+DEFAULT_AREA_EDGES = tuple(float(4**exponent) for exponent in range(13))
+DEFAULT_ASPECT_EDGES = tuple(2.0 ** (exponent / 2) for exponent in range(-8, 9))
+DEFAULT_STATISTICS_CHUNK_SIZE = 1 << 14
+
+
+class RunningMoments:
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0) -> None:
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def update(self, value: Union[int, float]) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def update_array(self, values: np.ndarray) -> None:
+        if values.size:
+            mean = float(values.mean())
+            m2 = float(((values - mean) ** 2).sum())
+            self.merge(RunningMoments(int(values.size), mean, m2))
+
+    def merge(self, other: "RunningMoments") -> None:
+        count = self.count + other.count
+        if count == 0:
+            return
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class RectangleStatistics:
+    def __init__(
+        self,
+        area_edges: Sequence[float] = DEFAULT_AREA_EDGES,
+        aspect_edges: Sequence[float] = DEFAULT_ASPECT_EDGES,
+    ) -> None:
+        self.area_edges = tuple(float(edge) for edge in area_edges)
+        self.aspect_edges = tuple(float(edge) for edge in aspect_edges)
+        if list(self.area_edges) != sorted(self.area_edges) or list(
+            self.aspect_edges
+        ) != sorted(self.aspect_edges):
+            raise ValueError("Histogram edges must be sorted in increasing order")
+        self.width = RunningMoments()
+        self.height = RunningMoments()
+        self.area = RunningMoments()
+        self.area_counts = [0] * (len(self.area_edges) + 1)
+        self.aspect_counts = [0] * (len(self.aspect_edges) + 1)
+        self.empty = 0
+        self.extent: Optional[List[Union[int, float]]] = None
+
+    @staticmethod
+    def from_rectangles(
+        rectangles: Rectangles,
+        chunk_size: int = DEFAULT_STATISTICS_CHUNK_SIZE,
+        area_edges: Sequence[float] = DEFAULT_AREA_EDGES,
+        aspect_edges: Sequence[float] = DEFAULT_ASPECT_EDGES,
+    ) -> "RectangleStatistics":
+        statistics = RectangleStatistics(area_edges, aspect_edges)
+        statistics.update_many(rectangles, chunk_size)
+        return statistics
+
+    @property
+    def count(self) -> int:
+        return self.width.count
+
+    def update(self, rectangle: Rectangle) -> None:
+        if not isinstance(rectangle, Rectangle):
+            raise ValueError(
+                f"Trying to aggregate non Rectangle object {str(rectangle)}"
+            )
+        left, top = rectangle.top_left.x, rectangle.top_left.y
+        right, bottom = rectangle.bottom_right.x, rectangle.bottom_right.y
+        width, height = right - left, bottom - top
+        if width < 0 or height < 0:
+            self.empty += 1
+            return
+        area = width * height
+        self.width.update(width)
+        self.height.update(height)
+        self.area.update(area)
+        self.area_counts[bisect_right(self.area_edges, area)] += 1
+        aspect = width / height if height > 0 else math.inf
+        self.aspect_counts[bisect_right(self.aspect_edges, aspect)] += 1
+        extent = self.extent
+        if extent is None:
+            self.extent = [left, top, right, bottom]
+            return
+        if left < extent[0]:
+            extent[0] = left
+        if top < extent[1]:
+            extent[1] = top
+        if right > extent[2]:
+            extent[2] = right
+        if bottom > extent[3]:
+            extent[3] = bottom
+
+    def update_array(self, rectangles: RectangleArray) -> None:
+        empty = rectangles.is_empty
+        xyxy = rectangles.xyxy[~empty]
+        self.empty += int(empty.sum())
+        if len(xyxy) == 0:
+            return
+        width = xyxy[:, 2] - xyxy[:, 0]
+        height = xyxy[:, 3] - xyxy[:, 1]
+        area = width * height
+        self.width.update_array(width)
+        self.height.update_array(height)
+        self.area.update_array(area)
+        aspect = np.divide(
+            width,
+            height,
+            out=np.full(width.shape, np.inf),
+            where=height > 0,
+        )
+        self._add_counts(self.area_counts, self.area_edges, area)
+        self._add_counts(self.aspect_counts, self.aspect_edges, aspect)
+        self._merge_extent(
+            [
+                xyxy[:, 0].min().item(),
+                xyxy[:, 1].min().item(),
+                xyxy[:, 2].max().item(),
+                xyxy[:, 3].max().item(),
+            ]
+        )
+
+    def update_many(
+        self,
+        rectangles: Rectangles,
+        chunk_size: int = DEFAULT_STATISTICS_CHUNK_SIZE,
+    ) -> None:
+        if isinstance(rectangles, RectangleArray):
+            for start in range(0, len(rectangles), chunk_size):
+                self.update_array(rectangles[start : start + chunk_size])
+            return
+        iterator = iter(rectangles)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            self.update_array(RectangleArray.from_rectangles(chunk))
+
+    @staticmethod
+    def _add_counts(
+        counts: List[int], edges: Sequence[float], values: np.ndarray
+    ) -> None:
+        bins = np.searchsorted(np.array(edges), values, side="right")
+        for index, hits in enumerate(np.bincount(bins, minlength=len(counts)).tolist()):
+            counts[index] += hits
+
+    def _merge_extent(self, extent: Optional[List[Union[int, float]]]) -> None:
+        if extent is None:
+            return
+        if self.extent is None:
+            self.extent = list(extent)
+        else:
+            self.extent = [
+                min(self.extent[0], extent[0]),
+                min(self.extent[1], extent[1]),
+                max(self.extent[2], extent[2]),
+                max(self.extent[3], extent[3]),
+            ]
+
+    def merge(self, other: "RectangleStatistics") -> "RectangleStatistics":
+        if not isinstance(other, RectangleStatistics):
+            raise ValueError(
+                f"Trying to merge RectangleStatistics with non RectangleStatistics object {str(other)}"
+            )
+        if (self.area_edges, self.aspect_edges) != (
+            other.area_edges,
+            other.aspect_edges,
+        ):
+            raise ValueError(
+                "Trying to merge RectangleStatistics with different histogram edges"
+            )
+        self.width.merge(other.width)
+        self.height.merge(other.height)
+        self.area.merge(other.area)
+        self.area_counts = [a + b for a, b in zip(self.area_counts, other.area_counts)]
+        self.aspect_counts = [
+            a + b for a, b in zip(self.aspect_counts, other.aspect_counts)
+        ]
+        self.empty += other.empty
+        self._merge_extent(other.extent)
+        return self
+
+    def snapshot(self) -> Dict[str, object]:
+        extent = self.extent
+        return {
+            "count": self.count,
+            "empty": self.empty,
+            "mean_width": self.width.mean,
+            "std_width": self.width.std,
+            "mean_height": self.height.mean,
+            "std_height": self.height.std,
+            "mean_area": self.area.mean,
+            "area_edges": self.area_edges,
+            "area_counts": tuple(self.area_counts),
+            "aspect_edges": self.aspect_edges,
+            "aspect_counts": tuple(self.aspect_counts),
+            "extent": (
+                None
+                if extent is None
+                else Rectangle(Point(extent[0], extent[1]), Point(extent[2], extent[3]))
+            ),
+        }
+
+    def __str__(self) -> str:
+        return f"RectangleStatistics({self.count})"
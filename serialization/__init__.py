@@ -0,0 +1,30 @@
+from utils.lazy_import import lazy_exports
+
+_EXPORTS = {
+    "pack_points": ".box_formats",
+    "pack_rectangles": ".box_formats",
+    "points_from_array": ".box_formats",
+    "points_to_array": ".box_formats",
+    "read_points_jsonl": ".box_formats",
+    "read_rectangles_jsonl": ".box_formats",
+    "rectangles_from_array": ".box_formats",
+    "rectangles_to_array": ".box_formats",
+    "unpack_points": ".box_formats",
+    "unpack_rectangles": ".box_formats",
+    "write_points_jsonl": ".box_formats",
+    "write_rectangles_jsonl": ".box_formats",
+    "BoxStore": ".box_store",
+    "points_from_arrow": ".arrow_io",
+    "points_to_arrow": ".arrow_io",
+    "read_points_parquet": ".arrow_io",
+    "read_rectangles_parquet": ".arrow_io",
+    "rectangles_from_arrow": ".arrow_io",
+    "rectangles_to_arrow": ".arrow_io",
+    "write_point_batches_parquet": ".arrow_io",
+    "write_points_parquet": ".arrow_io",
+    "write_rectangle_batches_parquet": ".arrow_io",
+    "write_rectangles_parquet": ".arrow_io",
+}
+
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
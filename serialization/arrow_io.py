@@ -0,0 +1,274 @@
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+import numpy as np
+from data_types.point_array import PointArray, Points
+from data_types.rectangle_array import RectangleArray, Rectangles
+from serialization.box_formats import (
+    DEFAULT_CHUNK_SIZE,
+    POINT_LAYOUTS,
+    RECTANGLE_LAYOUTS,
+    _layout_keys,
+    points_from_array,
+    points_to_array,
+    rectangles_from_array,
+    rectangles_to_array,
+)
+
+ColumnMapping = Optional[Dict[str, str]]
+ArrowData = Union["pyarrow.Table", "pyarrow.RecordBatch"]
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(
+            "Arrow interop requires the optional pyarrow package, install it with pip install pyarrow"
+        ) from error
+    return pyarrow
+
+
+def _parquet():
+    _pyarrow()
+    import pyarrow.parquet
+
+    return pyarrow.parquet
+
+
+def _column_names(
+    layouts: dict, layout: str, columns: ColumnMapping
+) -> Tuple[str, ...]:
+    keys = _layout_keys(layouts, layout)
+    columns = columns or {}
+    unknown = sorted(set(columns) - set(keys))
+    if unknown:
+        raise ValueError(
+            f"Unknown {layout} column mapping keys {', '.join(unknown)}, expected {', '.join(keys)}"
+        )
+    return tuple(columns.get(key, key) for key in keys)
+
+
+def _single_array(data: ArrowData, name: str) -> "pyarrow.Array":
+    pyarrow = _pyarrow()
+    if name not in data.schema.names:
+        raise ValueError(
+            f"Missing column {name}, available columns are {', '.join(data.schema.names)}"
+        )
+    column = data.column(name)
+    if isinstance(column, pyarrow.ChunkedArray):
+        column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+    if column.null_count:
+        raise ValueError(f"Column {name} contains {column.null_count} null values")
+    return column
+
+
+def _columns_to_array(data: ArrowData, names: Sequence[str]) -> np.ndarray:
+    return np.stack(
+        [_single_array(data, name).to_numpy(zero_copy_only=False) for name in names],
+        axis=-1,
+    )
+
+
+def _list_column_to_array(data: ArrowData, name: str, width: int) -> np.ndarray:
+    pyarrow = _pyarrow()
+    column = _single_array(data, name)
+    if (
+        not pyarrow.types.is_fixed_size_list(column.type)
+        or column.type.list_size != width
+    ):
+        raise ValueError(
+            f"Expected column {name} to be a fixed size list of {width} values, got {column.type}"
+        )
+    values = column.flatten()
+    if values.null_count:
+        raise ValueError(f"Column {name} contains {values.null_count} null values")
+    return values.to_numpy(zero_copy_only=False).reshape(-1, width)
+
+
+def _array_to_batch(
+    values: np.ndarray, names: Sequence[str], list_column: Optional[str]
+) -> "pyarrow.RecordBatch":
+    pyarrow = _pyarrow()
+    if list_column is not None:
+        flat = pyarrow.array(np.ascontiguousarray(values).reshape(-1))
+        return pyarrow.RecordBatch.from_arrays(
+            [pyarrow.FixedSizeListArray.from_arrays(flat, values.shape[1])],
+            [list_column],
+        )
+    columns = np.ascontiguousarray(values.T)
+    return pyarrow.RecordBatch.from_arrays(
+        [pyarrow.array(column) for column in columns], list(names)
+    )
+
+
+def rectangles_from_arrow(
+    data: ArrowData,
+    layout: str = "xyxy",
+    columns: ColumnMapping = None,
+    list_column: Optional[str] = None,
+) -> RectangleArray:
+    if list_column is not None:
+        _layout_keys(RECTANGLE_LAYOUTS, layout)
+        return rectangles_from_array(
+            _list_column_to_array(data, list_column, 4), layout
+        )
+    names = _column_names(RECTANGLE_LAYOUTS, layout, columns)
+    return rectangles_from_array(_columns_to_array(data, names), layout)
+
+
+def rectangles_to_arrow(
+    rectangles: Rectangles,
+    layout: str = "xyxy",
+    columns: ColumnMapping = None,
+    list_column: Optional[str] = None,
+) -> "pyarrow.RecordBatch":
+    names = _column_names(RECTANGLE_LAYOUTS, layout, columns)
+    return _array_to_batch(rectangles_to_array(rectangles, layout), names, list_column)
+
+
+def points_from_arrow(
+    data: ArrowData,
+    layout: str = "xy",
+    columns: ColumnMapping = None,
+    list_column: Optional[str] = None,
+) -> PointArray:
+    if list_column is not None:
+        _layout_keys(POINT_LAYOUTS, layout)
+        return points_from_array(_list_column_to_array(data, list_column, 2), layout)
+    names = _column_names(POINT_LAYOUTS, layout, columns)
+    return points_from_array(_columns_to_array(data, names), layout)
+
+
+def points_to_arrow(
+    points: Points,
+    layout: str = "xy",
+    columns: ColumnMapping = None,
+    list_column: Optional[str] = None,
+) -> "pyarrow.RecordBatch":
+    names = _column_names(POINT_LAYOUTS, layout, columns)
+    return _array_to_batch(points_to_array(points, layout), names, list_column)
+
+
+def _read_parquet(
+    path: str,
+    names: Sequence[str],
+    batch_size: int,
+) -> Iterator["pyarrow.RecordBatch"]:
+    parquet_file = _parquet().ParquetFile(path)
+    yield from parquet_file.iter_batches(batch_size=batch_size, columns=list(names))
+
+
+def _write_parquet(batches: Iterator["pyarrow.RecordBatch"], path: str) -> int:
+    writer = None
+    count = 0
+    try:
+        for batch in batches:
+            if writer is None:
+                writer = _parquet().ParquetWriter(path, batch.schema)
+            writer.write_batch(batch)
+            count += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+def _write_array_parquet(
+    values: np.ndarray,
+    names: Sequence[str],
+    list_column: Optional[str],
+    path: str,
+    chunk_size: int,
+) -> int:
+    return _write_parquet(
+        (
+            _array_to_batch(values[start : start + chunk_size], names, list_column)
+            for start in range(0, max(len(values), 1), chunk_size)
+        ),
+        path,
+    )
+
+
+def read_rectangles_parquet(
+    path: str,
+    layout: str = "xyxy",
+    columns: ColumnMapping = None,
+    list_column: Optional[str] = None,
+    batch_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[RectangleArray]:
+    names = (
+        (list_column,)
+        if list_column is not None
+        else _column_names(RECTANGLE_LAYOUTS, layout, columns)
+    )
+    for batch in _read_parquet(path, names, batch_size):
+        yield rectangles_from_arrow(batch, layout, columns, list_column)
+
+
+def write_rectangle_batches_parquet(
+    batches: Iterable[Rectangles],
+    path: str,
+    layout: str = "xyxy",
+    columns: ColumnMapping = None,
+    list_column: Optional[str] = None,
+) -> int:
+    return _write_parquet(
+        (rectangles_to_arrow(batch, layout, columns, list_column) for batch in batches),
+        path,
+    )
+
+
+def write_rectangles_parquet(
+    rectangles: Rectangles,
+    path: str,
+    layout: str = "xyxy",
+    columns: ColumnMapping = None,
+    list_column: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    names = _column_names(RECTANGLE_LAYOUTS, layout, columns)
+    return _write_array_parquet(
+        rectangles_to_array(rectangles, layout), names, list_column, path, chunk_size
+    )
+
+
+def read_points_parquet(
+    path: str,
+    layout: str = "xy",
+    columns: ColumnMapping = None,
+    list_column: Optional[str] = None,
+    batch_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[PointArray]:
+    names = (
+        (list_column,)
+        if list_column is not None
+        else _column_names(POINT_LAYOUTS, layout, columns)
+    )
+    for batch in _read_parquet(path, names, batch_size):
+        yield points_from_arrow(batch, layout, columns, list_column)
+
+
+def write_point_batches_parquet(
+    batches: Iterable[Points],
+    path: str,
+    layout: str = "xy",
+    columns: ColumnMapping = None,
+    list_column: Optional[str] = None,
+) -> int:
+    return _write_parquet(
+        (points_to_arrow(batch, layout, columns, list_column) for batch in batches),
+        path,
+    )
+
+
+def write_points_parquet(
+    points: Points,
+    path: str,
+    layout: str = "xy",
+    columns: ColumnMapping = None,
+    list_column: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    names = _column_names(POINT_LAYOUTS, layout, columns)
+    return _write_array_parquet(
+        points_to_array(points, layout), names, list_column, path, chunk_size
+    )
@@ -0,0 +1,246 @@
+from typing import Iterator, List, Sequence, TextIO, Tuple
+import json
+import re
+import numpy as np
+from utils.array_utils import as_coordinate_array, is_int_array
+from data_types.point_array import PointArray, Points, as_point_array
+from data_types.rectangle_array import RectangleArray, Rectangles, as_rectangle_array
+
+RECTANGLE_LAYOUTS = {"xyxy": ("x1", "y1", "x2", "y2"), "xywh": ("x", "y", "w", "h")}
+POINT_LAYOUTS = {"xy": ("x", "y"), "yx": ("y", "x")}
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_JSON_NAME = re.compile(r'"([^"]+)"\s*:')
+_JSON_VALUE = re.compile(r":\s*([^,}\s]+)")
+_FLOAT_MARKERS = re.compile(r"[.eEnN]")
+
+
+def _layout_keys(layouts: dict, layout: str) -> Tuple[str, ...]:
+    if layout not in layouts:
+        raise ValueError(
+            f"Unknown layout {layout}, expected one of {', '.join(layouts)}"
+        )
+    return layouts[layout]
+
+
+def rectangles_to_array(rectangles: Rectangles, layout: str = "xyxy") -> np.ndarray:
+    _layout_keys(RECTANGLE_LAYOUTS, layout)
+    array = as_rectangle_array(rectangles)
+    if layout == "xyxy":
+        return array.xyxy
+    return np.stack((array.left, array.top, array.width, array.height), axis=-1)
+
+
+def rectangles_from_array(values: np.ndarray, layout: str = "xyxy") -> RectangleArray:
+    _layout_keys(RECTANGLE_LAYOUTS, layout)
+    values = as_coordinate_array(values, columns=4)
+    if layout == "xyxy":
+        return RectangleArray(values)
+    return RectangleArray.from_xywh(*values.T)
+
+
+def points_to_array(points: Points, layout: str = "xy") -> np.ndarray:
+    _layout_keys(POINT_LAYOUTS, layout)
+    array = as_point_array(points)
+    if layout == "xy":
+        return array.xy
+    return array.xy[:, ::-1]
+
+
+def points_from_array(values: np.ndarray, layout: str = "xy") -> PointArray:
+    _layout_keys(POINT_LAYOUTS, layout)
+    values = as_coordinate_array(values, columns=2)
+    if layout == "xy":
+        return PointArray(values)
+    return PointArray(values[:, ::-1])
+
+
+def _pack(values: np.ndarray, dtype: np.dtype) -> bytes:
+    dtype = np.dtype(dtype).newbyteorder("<")
+    if dtype.kind in "biu" and not is_int_array(values):
+        raise ValueError(
+            f"Cannot pack {values.dtype} coordinates as {dtype} without changing their values"
+        )
+    if dtype.kind in "iu" and values.size:
+        limits = np.iinfo(dtype)
+        if values.min() < limits.min or values.max() > limits.max:
+            raise ValueError(
+                f"Cannot pack coordinates outside [{limits.min}, {limits.max}] as {dtype} without changing their values"
+            )
+    return np.ascontiguousarray(values, dtype=dtype).tobytes()
+
+
+def _unpack(buffer: bytes, dtype: np.dtype, columns: int) -> np.ndarray:
+    dtype = np.dtype(dtype).newbyteorder("<")
+    record_size = dtype.itemsize * columns
+    if len(buffer) % record_size:
+        raise ValueError(
+            f"Buffer of {len(buffer)} bytes is not a whole number of {record_size} byte records"
+        )
+    return np.frombuffer(buffer, dtype=dtype).reshape(-1, columns)
+
+
+def pack_rectangles(
+    rectangles: Rectangles, layout: str = "xyxy", dtype: np.dtype = np.float64
+) -> bytes:
+    return _pack(rectangles_to_array(rectangles, layout), dtype)
+
+
+def unpack_rectangles(
+    buffer: bytes, layout: str = "xyxy", dtype: np.dtype = np.float64
+) -> RectangleArray:
+    return rectangles_from_array(_unpack(buffer, dtype, columns=4), layout)
+
+
+def pack_points(
+    points: Points, layout: str = "xy", dtype: np.dtype = np.float64
+) -> bytes:
+    return _pack(points_to_array(points, layout), dtype)
+
+
+def unpack_points(
+    buffer: bytes, layout: str = "xy", dtype: np.dtype = np.float64
+) -> PointArray:
+    return points_from_array(_unpack(buffer, dtype, columns=2), layout)
+
+
+def _write_jsonl(
+    values: np.ndarray, keys: Sequence[str], stream: TextIO, chunk_size: int
+) -> int:
+    if values.dtype.kind == "f" and not np.isfinite(values).all():
+        raise ValueError("Cannot write non finite coordinates as JSON")
+    template = "{" + ", ".join(f'"{key}": %r' for key in keys) + "}\n"
+    for start in range(0, len(values), chunk_size):
+        rows = values[start : start + chunk_size].tolist()
+        stream.write("".join([template % tuple(row) for row in rows]))
+    return len(values)
+
+
+def _unique_fields(pairs: List[Tuple[str, object]]) -> dict:
+    record = dict(pairs)
+    if len(record) != len(pairs):
+        raise ValueError(f"Duplicate JSON fields in {json.dumps(pairs)}")
+    return record
+
+
+def _decode_json_line(line: str, keys: Sequence[str]) -> List[object]:
+    try:
+        record = json.loads(line, object_pairs_hook=_unique_fields)
+    except json.JSONDecodeError as error:
+        raise ValueError(f"Invalid JSON line {line.strip()!r}: {error}") from None
+    if not isinstance(record, dict):
+        raise ValueError(f"Expected a JSON object, got {line.strip()!r}")
+    row = []
+    for key in keys:
+        if key not in record:
+            raise ValueError(f"Missing JSON field {key} in {line.strip()!r}")
+        value = record[key]
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(
+                f"Expected a number for JSON field {key}, got {json.dumps(value)} in {line.strip()!r}"
+            )
+        row.append(value)
+    return row
+
+
+def _decode_json_lines(lines: List[str], keys: Sequence[str]) -> np.ndarray:
+    rows = [_decode_json_line(line, keys) for line in lines]
+    is_float = any(isinstance(value, float) for row in rows for value in row)
+    return np.array(rows, dtype=np.float64 if is_float else np.int64).reshape(
+        len(lines), len(keys)
+    )
+
+
+def _decode_jsonl(lines: List[str], keys: Sequence[str]) -> np.ndarray:
+    try:
+        try:
+            values = _decode_flat_jsonl(lines, keys)
+        except ValueError:
+            values = _decode_json_lines(lines, keys)
+    except OverflowError:
+        raise ValueError("Cannot read integer coordinates outside int64 from JSON")
+    if values.dtype.kind == "f" and not np.isfinite(values).all():
+        raise ValueError("Cannot read non finite coordinates from JSON")
+    return values
+
+
+def _decode_flat_jsonl(lines: List[str], keys: Sequence[str]) -> np.ndarray:
+    text = "".join(lines)
+    if text.count("{") != len(lines) or text.count("}") != len(lines):
+        raise ValueError("Expected one flat JSON object per line")
+    names = _JSON_NAME.findall(text)
+    values = _JSON_VALUE.findall(text)
+    shape = (len(lines), len(keys))
+    if len(names) != shape[0] * shape[1] or len(values) != len(names):
+        raise ValueError(
+            f"Expected exactly the fields {', '.join(keys)} on every JSON line"
+        )
+    if _FLOAT_MARKERS.search(" ".join(values)):
+        array = np.fromiter(map(float, values), dtype=np.float64, count=len(values))
+    else:
+        array = np.fromiter(map(int, values), dtype=np.int64, count=len(values))
+    array = array.reshape(shape)
+    if names == list(keys) * shape[0]:
+        return array
+    positions = {key: position for position, key in enumerate(keys)}
+    try:
+        columns = np.array([positions[name] for name in names], dtype=np.int64)
+    except KeyError as error:
+        raise ValueError(f"Unexpected JSON field {error.args[0]}") from None
+    columns = columns.reshape(shape)
+    order = np.argsort(columns, axis=1)
+    if np.any(np.take_along_axis(columns, order, axis=1) != np.arange(shape[1])):
+        raise ValueError(f"Expected each of the fields {', '.join(keys)} exactly once")
+    return np.take_along_axis(array, order, axis=1)
+
+
+def _read_jsonl(
+    stream: TextIO, keys: Sequence[str], chunk_size: int
+) -> Iterator[np.ndarray]:
+    lines: List[str] = []
+    for line in stream:
+        if line.strip():
+            lines.append(line)
+        if len(lines) == chunk_size:
+            yield _decode_jsonl(lines, keys)
+            lines = []
+    if lines:
+        yield _decode_jsonl(lines, keys)
+
+
+def write_rectangles_jsonl(
+    rectangles: Rectangles,
+    stream: TextIO,
+    layout: str = "xyxy",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    keys = _layout_keys(RECTANGLE_LAYOUTS, layout)
+    return _write_jsonl(
+        rectangles_to_array(rectangles, layout), keys, stream, chunk_size
+    )
+
+
+def read_rectangles_jsonl(
+    stream: TextIO, layout: str = "xyxy", chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[RectangleArray]:
+    keys = _layout_keys(RECTANGLE_LAYOUTS, layout)
+    for values in _read_jsonl(stream, keys, chunk_size):
+        yield rectangles_from_array(values, layout)
+
+
+def write_points_jsonl(
+    points: Points,
+    stream: TextIO,
+    layout: str = "xy",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    keys = _layout_keys(POINT_LAYOUTS, layout)
+    return _write_jsonl(points_to_array(points, layout), keys, stream, chunk_size)
+
+
+def read_points_jsonl(
+    stream: TextIO, layout: str = "xy", chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[PointArray]:
+    keys = _layout_keys(POINT_LAYOUTS, layout)
+    for values in _read_jsonl(stream, keys, chunk_size):
+        yield points_from_array(values, layout)
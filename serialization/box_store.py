@@ -0,0 +1,140 @@
+from typing import Iterator, Union
+import os
+import struct
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.point_array import PointArray, Points
+from data_types.rectangle_array import RectangleArray, Rectangles
+from serialization.box_formats import (
+    DEFAULT_CHUNK_SIZE,
+    POINT_LAYOUTS,
+    RECTANGLE_LAYOUTS,
+    pack_points,
+    pack_rectangles,
+)
+
+STORE_MAGIC = b"GEOBOXES"
+STORE_HEADER = struct.Struct("<8s4sI")
+STORE_KINDS = {"rectangles": 4, "points": 2}
+
+
+class BoxStore:
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as file:
+            header = file.read(STORE_HEADER.size)
+        if len(header) != STORE_HEADER.size:
+            raise ValueError(f"{self.path} is too short to be a box store")
+        magic, dtype, columns = STORE_HEADER.unpack(header)
+        if magic != STORE_MAGIC or columns not in STORE_KINDS.values():
+            raise ValueError(f"{self.path} is not a box store")
+        self.dtype = np.dtype(dtype.rstrip(b"\0").decode())
+        self.columns = columns
+        self.kind = "rectangles" if columns == 4 else "points"
+        self._map()
+
+    @staticmethod
+    def create(
+        path: Union[str, os.PathLike],
+        kind: str = "rectangles",
+        dtype: np.dtype = np.float64,
+    ) -> "BoxStore":
+        if kind not in STORE_KINDS:
+            raise ValueError(
+                f"Unknown box store kind {kind}, expected one of {', '.join(STORE_KINDS)}"
+            )
+        dtype = np.dtype(dtype).newbyteorder("<")
+        with open(path, "wb") as file:
+            file.write(
+                STORE_HEADER.pack(STORE_MAGIC, dtype.str.encode(), STORE_KINDS[kind])
+            )
+        return BoxStore(path)
+
+    @staticmethod
+    def from_rectangles(
+        path: Union[str, os.PathLike],
+        rectangles: Rectangles,
+        dtype: np.dtype = np.float64,
+    ) -> "BoxStore":
+        store = BoxStore.create(path, kind="rectangles", dtype=dtype)
+        store.append(rectangles)
+        return store
+
+    @staticmethod
+    def from_points(
+        path: Union[str, os.PathLike], points: Points, dtype: np.dtype = np.float64
+    ) -> "BoxStore":
+        store = BoxStore.create(path, kind="points", dtype=dtype)
+        store.append(points)
+        return store
+
+    def _map(self) -> None:
+        record_size = self.dtype.itemsize * self.columns
+        payload = os.path.getsize(self.path) - STORE_HEADER.size
+        if payload % record_size:
+            raise ValueError(
+                f"{self.path} ends with a partial record of {payload % record_size} bytes"
+            )
+        count = payload // record_size
+        if count == 0:
+            self.records = np.empty((0, self.columns), dtype=self.dtype)
+        else:
+            self.records = np.memmap(
+                self.path,
+                dtype=self.dtype,
+                mode="r",
+                offset=STORE_HEADER.size,
+                shape=(count, self.columns),
+            )
+
+    def append(self, items: Union[Rectangles, Points]) -> int:
+        if self.kind == "rectangles":
+            buffer = pack_rectangles(items, dtype=self.dtype)
+        else:
+            buffer = pack_points(items, dtype=self.dtype)
+        start = len(self)
+        with open(self.path, "ab") as file:
+            file.write(buffer)
+        self._map()
+        return start
+
+    def column(self, name: str) -> np.ndarray:
+        if self.kind == "rectangles":
+            layouts = RECTANGLE_LAYOUTS["xyxy"]
+        else:
+            layouts = POINT_LAYOUTS["xy"]
+        if name not in layouts:
+            raise ValueError(
+                f"Unknown {self.kind} column {name}, expected one of {', '.join(layouts)}"
+            )
+        return self.records[:, layouts.index(name)]
+
+    def _wrap(self, records: np.ndarray) -> Union[RectangleArray, PointArray]:
+        if self.kind == "rectangles":
+            return RectangleArray(records)
+        return PointArray(records)
+
+    def chunks(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Union[RectangleArray, PointArray]]:
+        for start in range(0, len(self), chunk_size):
+            yield self._wrap(self.records[start : start + chunk_size])
+
+    def __len__(self) -> int:
+        return self.records.shape[0]
+
+    def __iter__(self) -> Iterator[Union[Rectangle, Point]]:
+        for chunk in self.chunks():
+            yield from chunk
+
+    def __getitem__(self, index) -> Union[Rectangle, Point, RectangleArray, PointArray]:
+        if isinstance(index, (int, np.integer)):
+            values = self.records[index].tolist()
+            if self.kind == "rectangles":
+                return Rectangle.from_xyxy(*values)
+            return Point.from_xy(*values)
+        return self._wrap(self.records[index])
+
+    def __str__(self) -> str:
+        return f"BoxStore({self.path},{self.kind},{len(self)})"
@@ -0,0 +1,10 @@
+from utils.lazy_import import lazy_exports
+
+_EXPORTS = {
+    "BatchMetrics": ".micro_batcher",
+    "LocalClient": ".micro_batcher",
+    "MicroBatcher": ".micro_batcher",
+}
+
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,214 @@
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from concurrent.futures import Executor
+import asyncio
+import time
+import numpy as np
+from data_types.instrumentation import Recorder
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray, Rectangles, as_rectangle_array
+
+DEFAULT_MAX_BATCH_SIZE = 1024
+DEFAULT_MAX_DELAY = 0.002
+DEFAULT_MAX_PENDING = 4096
+
+Result = Union[Rectangle, RectangleArray, np.ndarray]
+Process = Callable[[RectangleArray], Union[RectangleArray, np.ndarray]]
+Request = Tuple[RectangleArray, bool, "asyncio.Future[Result]", int]
+
+
+class BatchMetrics:
+    def __init__(self) -> None:
+        self.recorder = Recorder()
+        self.reset()
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.boxes = 0
+        self.batches = 0
+        self.rejected = 0
+        self.failed = 0
+        self.started_ns = time.perf_counter_ns()
+        self.recorder.reset()
+
+    def snapshot(self) -> Dict[str, object]:
+        elapsed = max(time.perf_counter_ns() - self.started_ns, 1) / 1e9
+        return {
+            "requests": self.requests,
+            "boxes": self.boxes,
+            "batches": self.batches,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "mean_batch_boxes": self.boxes / self.batches if self.batches else 0.0,
+            "requests_per_second": self.requests / elapsed,
+            "boxes_per_second": self.boxes / elapsed,
+            "latency": self.recorder.snapshot(),
+        }
+
+
+class MicroBatcher:
+    def __init__(
+        self,
+        process: Process,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError(f"Batch size must be positive, got {max_batch_size}")
+        self.process = process
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.executor = executor
+        self.metrics = BatchMetrics()
+        self._queue: Optional["asyncio.Queue[Request]"] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def pending(self) -> int:
+        return 0 if self._queue is None else self._queue.qsize()
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self) -> None:
+        if self.running:
+            raise RuntimeError("MicroBatcher is already running")
+        self._queue = asyncio.Queue(self.max_pending)
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def __aenter__(self) -> "MicroBatcher":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def _request(self, rectangles: Union[Rectangle, Rectangles]) -> Request:
+        if not self.running:
+            raise RuntimeError("MicroBatcher is not running, call start() first")
+        single = isinstance(rectangles, Rectangle)
+        boxes = as_rectangle_array([rectangles] if single else rectangles)
+        future = asyncio.get_running_loop().create_future()
+        return boxes, single, future, time.perf_counter_ns()
+
+    async def submit(self, rectangles: Union[Rectangle, Rectangles]) -> Result:
+        request = self._request(rectangles)
+        await self._queue.put(request)
+        return await request[2]
+
+    async def submit_nowait(self, rectangles: Union[Rectangle, Rectangles]) -> Result:
+        request = self._request(rectangles)
+        try:
+            self._queue.put_nowait(request)
+        except asyncio.QueueFull:
+            self.metrics.rejected += 1
+            raise
+        return await request[2]
+
+    async def _collect(self) -> List[Request]:
+        queue = self._queue
+        batch = [await queue.get()]
+        boxes = len(batch[0][0])
+        deadline = asyncio.get_running_loop().time() + self.max_delay
+        while boxes < self.max_batch_size:
+            if queue.empty():
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    request = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                request = queue.get_nowait()
+            batch.append(request)
+            boxes += len(request[0])
+        return batch
+
+    async def _dispatch(self, batch: List[Request]) -> None:
+        groups: Dict[np.dtype, List[Request]] = {}
+        for request in batch:
+            groups.setdefault(request[0].xyxy.dtype, []).append(request)
+        for group in groups.values():
+            await self._dispatch_group(group)
+
+    async def _dispatch_group(self, batch: List[Request]) -> None:
+        metrics = self.metrics
+        start = time.perf_counter_ns()
+        try:
+            if len(batch) == 1:
+                merged = batch[0][0]
+            else:
+                merged = RectangleArray(
+                    np.concatenate([request[0].xyxy for request in batch])
+                )
+            output = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.process, merged
+            )
+            if len(output) != len(merged):
+                raise ValueError(
+                    f"Batch process returned {len(output)} rows for {len(merged)} boxes"
+                )
+        except Exception as error:
+            metrics.failed += len(batch)
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        end = time.perf_counter_ns()
+        metrics.batches += 1
+        metrics.recorder.record("batch", end - start)
+        offset = 0
+        for boxes, single, future, submitted in batch:
+            count = len(boxes)
+            if single:
+                result = output[offset]
+            else:
+                result = output[offset : offset + count]
+            offset += count
+            metrics.requests += 1
+            metrics.boxes += count
+            metrics.recorder.record("request", end - submitted)
+            if not future.done():
+                future.set_result(result)
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            batch = await self._collect()
+            try:
+                await self._dispatch(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+
+class LocalClient:
+    def __init__(self, batcher: MicroBatcher) -> None:
+        self.batcher = batcher
+
+    async def process(self, rectangles: Union[Rectangle, Rectangles]) -> Result:
+        return await self.batcher.submit(rectangles)
+
+    async def process_many(
+        self, requests: Iterable[Union[Rectangle, Rectangles]]
+    ) -> List[Result]:
+        return list(
+            await asyncio.gather(
+                *(self.batcher.submit(request) for request in requests)
+            )
+        )
@@ -0,0 +1,11 @@
+from utils.lazy_import import lazy_exports
+
+_EXPORTS = {
+    "SpatialEntries": ".entries",
+    "UniformGrid": ".grid",
+    "KDTree": ".kdtree",
+    "RTree": ".rtree",
+}
+
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,78 @@
+from typing import Union
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+
+
+def entry_box(item: Union[Rectangle, Point]) -> np.ndarray:
+    if isinstance(item, Rectangle):
+        return np.array(
+            (item.left, item.top, item.right, item.bottom), dtype=np.float64
+        )
+    elif isinstance(item, Point):
+        return np.array((item.x, item.y, item.x, item.y), dtype=np.float64)
+    else:
+        raise ValueError(f"Trying to index non Rectangle or Point object {str(item)}")
+
+
+def box_distances(xyxy: np.ndarray, point: Point) -> np.ndarray:
+    dx = np.maximum(np.maximum(xyxy[:, 0] - point.x, point.x - xyxy[:, 2]), 0)
+    dy = np.maximum(np.maximum(xyxy[:, 1] - point.y, point.y - xyxy[:, 3]), 0)
+    return np.hypot(dx, dy)
+
+
+def overlaps(xyxy: np.ndarray, window: np.ndarray) -> np.ndarray:
+    return (
+        (xyxy[:, 0] <= window[2])
+        & (xyxy[:, 2] >= window[0])
+        & (xyxy[:, 1] <= window[3])
+        & (xyxy[:, 3] >= window[1])
+    )
+
+
+class SpatialEntries:
+    def __init__(self, xyxy: np.ndarray) -> None:
+        xyxy = np.asarray(xyxy, dtype=np.float64).reshape(-1, 4)
+        self._xyxy = xyxy.copy()
+        self._alive = np.ones(len(xyxy), dtype=np.bool_)
+        self.size = len(xyxy)
+        self.live_count = len(xyxy)
+
+    @property
+    def xyxy(self) -> np.ndarray:
+        return self._xyxy[: self.size]
+
+    @property
+    def alive(self) -> np.ndarray:
+        return self._alive[: self.size]
+
+    def append(self, box: np.ndarray) -> int:
+        if self.size == len(self._xyxy):
+            capacity = max(16, 2 * len(self._xyxy))
+            self._xyxy = np.resize(self._xyxy, (capacity, 4))
+            self._alive = np.resize(self._alive, capacity)
+        self._xyxy[self.size] = box
+        self._alive[self.size] = True
+        self.size += 1
+        self.live_count += 1
+        return self.size - 1
+
+    def extend(self, boxes: np.ndarray) -> np.ndarray:
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        required = self.size + len(boxes)
+        if required > len(self._xyxy):
+            capacity = max(16, 2 * len(self._xyxy), required)
+            self._xyxy = np.resize(self._xyxy, (capacity, 4))
+            self._alive = np.resize(self._alive, capacity)
+        self._xyxy[self.size : required] = boxes
+        self._alive[self.size : required] = True
+        entry_ids = np.arange(self.size, required)
+        self.size = required
+        self.live_count += len(boxes)
+        return entry_ids
+
+    def remove(self, entry_id: int) -> None:
+        if not 0 <= entry_id < self.size or not self._alive[entry_id]:
+            raise KeyError(f"No indexed entry with id {entry_id}")
+        self._alive[entry_id] = False
+        self.live_count -= 1
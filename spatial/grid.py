@@ -0,0 +1,201 @@
+from typing import Dict, List, Optional, Set, Tuple, Union
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.point_array import Points, as_point_array
+from data_types.rectangle_array import Rectangles, as_rectangle_array
+from spatial.entries import SpatialEntries, box_distances, entry_box, overlaps
+
+Cell = Tuple[int, int]
+DEFAULT_MAX_CELLS = 256
+
+
+def default_cell_size(xyxy: np.ndarray) -> float:
+    if len(xyxy) == 0:
+        return 1.0
+    sizes = np.concatenate((xyxy[:, 2] - xyxy[:, 0], xyxy[:, 3] - xyxy[:, 1]))
+    size = float(np.median(sizes))
+    if size > 0:
+        return size
+    extent = float(max(np.ptp(xyxy[:, [0, 2]]), np.ptp(xyxy[:, [1, 3]])))
+    return max(extent / max(np.sqrt(len(xyxy)), 1.0), 1.0)
+
+
+def _ring_cells(column: int, row: int, ring: int, bounds: List[int]) -> List[Cell]:
+    column_start, row_start, column_stop, row_stop = bounds
+    left, right = max(column - ring, column_start), min(column + ring, column_stop)
+    top, bottom = max(row - ring + 1, row_start), min(row + ring - 1, row_stop)
+    cells = []
+    for edge_row in sorted({row - ring, row + ring}):
+        if row_start <= edge_row <= row_stop:
+            cells.extend(
+                (edge_column, edge_row) for edge_column in range(left, right + 1)
+            )
+    for edge_column in sorted({column - ring, column + ring}):
+        if column_start <= edge_column <= column_stop:
+            cells.extend((edge_column, edge_row) for edge_row in range(top, bottom + 1))
+    return cells
+
+
+class UniformGrid:
+    def __init__(
+        self,
+        xyxy: np.ndarray,
+        cell_size: Optional[float] = None,
+        max_cells: int = DEFAULT_MAX_CELLS,
+    ) -> None:
+        xyxy = np.asarray(xyxy, dtype=np.float64).reshape(-1, 4)
+        self.cell_size = default_cell_size(xyxy) if cell_size is None else cell_size
+        if not self.cell_size > 0:
+            raise ValueError(f"Grid cell size must be positive, got {self.cell_size}")
+        self.max_cells = max_cells
+        self.entries = SpatialEntries(xyxy)
+        self.cells: Dict[Cell, Set[int]] = {}
+        self.overflow: Set[int] = set()
+        self._bounds = [np.inf, np.inf, -np.inf, -np.inf]
+        spans = self._cell_spans(xyxy)
+        for entry_id, span in enumerate(spans.tolist()):
+            self._register(entry_id, span)
+
+    @staticmethod
+    def from_rectangles(
+        rectangles: Rectangles,
+        cell_size: Optional[float] = None,
+        max_cells: int = DEFAULT_MAX_CELLS,
+    ) -> "UniformGrid":
+        return UniformGrid(
+            as_rectangle_array(rectangles).xyxy,
+            cell_size=cell_size,
+            max_cells=max_cells,
+        )
+
+    @staticmethod
+    def from_points(points: Points, cell_size: Optional[float] = None) -> "UniformGrid":
+        return UniformGrid(np.tile(as_point_array(points).xy, 2), cell_size=cell_size)
+
+    def _cell_spans(self, xyxy: np.ndarray) -> np.ndarray:
+        return np.floor(xyxy / self.cell_size).astype(np.int64)
+
+    def _register(self, entry_id: int, span: List[int]) -> None:
+        column_start, row_start, column_stop, row_stop = span
+        if (column_stop - column_start + 1) * (
+            row_stop - row_start + 1
+        ) > self.max_cells:
+            self.overflow.add(entry_id)
+            return
+        for column in range(column_start, column_stop + 1):
+            for row in range(row_start, row_stop + 1):
+                self.cells.setdefault((column, row), set()).add(entry_id)
+        self._bounds = [
+            min(self._bounds[0], column_start),
+            min(self._bounds[1], row_start),
+            max(self._bounds[2], column_stop),
+            max(self._bounds[3], row_stop),
+        ]
+
+    def _collect(self, span: List[int]) -> np.ndarray:
+        if not self.cells:
+            return np.empty(0, dtype=np.int64)
+        column_start, row_start, column_stop, row_stop = span
+        column_start = max(column_start, self._bounds[0])
+        row_start = max(row_start, self._bounds[1])
+        column_stop = min(column_stop, self._bounds[2])
+        row_stop = min(row_stop, self._bounds[3])
+        found: Set[int] = set()
+        for column in range(int(column_start), int(column_stop) + 1):
+            for row in range(int(row_start), int(row_stop) + 1):
+                members = self.cells.get((column, row))
+                if members:
+                    found.update(members)
+        return np.fromiter(found, dtype=np.int64, count=len(found))
+
+    def insert(self, item: Union[Rectangle, Point]) -> int:
+        box = entry_box(item)
+        entry_id = self.entries.append(box)
+        self._register(entry_id, self._cell_spans(box[None, :])[0].tolist())
+        return entry_id
+
+    def delete(self, entry_id: int) -> None:
+        self.entries.remove(entry_id)
+        if entry_id in self.overflow:
+            self.overflow.remove(entry_id)
+            return
+        column_start, row_start, column_stop, row_stop = self._cell_spans(
+            self.entries.xyxy[entry_id][None, :]
+        )[0].tolist()
+        for column in range(column_start, column_stop + 1):
+            for row in range(row_start, row_stop + 1):
+                members = self.cells[(column, row)]
+                members.discard(entry_id)
+                if not members:
+                    del self.cells[(column, row)]
+
+    def query_window(self, window: Rectangle) -> np.ndarray:
+        box = entry_box(window)
+        candidates = np.concatenate(
+            (
+                self._collect(self._cell_spans(box[None, :])[0].tolist()),
+                np.fromiter(self.overflow, dtype=np.int64, count=len(self.overflow)),
+            )
+        )
+        return np.sort(candidates[overlaps(self.entries.xyxy[candidates], box)])
+
+    def query_point(self, point: Point) -> np.ndarray:
+        return self.query_window(Rectangle.from_corners(point, point))
+
+    def _nearest_linear(self, point: Point, k: int) -> np.ndarray:
+        ids = np.flatnonzero(self.entries.alive)
+        distances = box_distances(self.entries.xyxy[ids], point)
+        return ids[np.lexsort((ids, distances))[:k]]
+
+    def nearest(self, point: Point, k: int = 1) -> np.ndarray:
+        if self.entries.live_count == 0 or k <= 0:
+            return np.empty(0, dtype=np.int64)
+        column = int(np.floor(point.x / self.cell_size))
+        row = int(np.floor(point.y / self.cell_size))
+        start, reach = 0, -1
+        bounds = [int(bound) for bound in self._bounds] if self.cells else []
+        if bounds:
+            start = max(
+                bounds[0] - column,
+                column - bounds[2],
+                bounds[1] - row,
+                row - bounds[3],
+                0,
+            )
+            reach = max(
+                abs(column - bounds[0]),
+                abs(column - bounds[2]),
+                abs(row - bounds[1]),
+                abs(row - bounds[3]),
+            )
+        seen: Set[int] = set()
+        ids = np.fromiter(self.overflow, dtype=np.int64, count=len(self.overflow))
+        distances = box_distances(self.entries.xyxy[ids], point)
+        visited = 0
+        for ring in range(start, reach + 1):
+            cells = _ring_cells(column, row, ring, bounds)
+            visited += len(cells)
+            if visited > self.entries.live_count:
+                return self._nearest_linear(point, k)
+            ring_ids = []
+            for cell in cells:
+                members = self.cells.get(cell)
+                if members:
+                    ring_ids.extend(members - seen)
+                    seen.update(members)
+            if ring_ids:
+                ring_ids = np.array(ring_ids, dtype=np.int64)
+                ids = np.concatenate((ids, ring_ids))
+                distances = np.concatenate(
+                    (distances, box_distances(self.entries.xyxy[ring_ids], point))
+                )
+            if len(ids) >= k:
+                kth = np.partition(distances, k - 1)[k - 1]
+                if kth <= ring * self.cell_size:
+                    break
+        order = np.lexsort((ids, distances))[:k]
+        return ids[order]
+
+    def __len__(self) -> int:
+        return self.entries.live_count
@@ -0,0 +1,286 @@
+from typing import Iterator, List, Optional, Tuple, Union
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.point_array import PointArray, Points, as_point_array
+from data_types.rectangle_array import Rectangles, as_rectangle_array
+from spatial.entries import SpatialEntries, entry_box
+
+DEFAULT_QUERY_CHUNK_SIZE = 1024
+BRUTE_FORCE_ELEMENTS = 1 << 15
+Hits = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _node_ranges(count: int, depth: int) -> Tuple[np.ndarray, np.ndarray]:
+    starts = np.zeros(1, dtype=np.int64)
+    stops = np.full(1, count, dtype=np.int64)
+    levels = [(starts, stops)]
+    for _ in range(depth):
+        middles = (starts + stops) // 2
+        starts = np.stack((starts, middles), axis=1).reshape(-1)
+        stops = np.stack((middles, stops), axis=1).reshape(-1)
+        levels.append((starts, stops))
+    return (
+        np.concatenate([starts for starts, _ in levels]),
+        np.concatenate([stops for _, stops in levels]),
+    )
+
+
+def _box_distances(bounds: np.ndarray, xy: np.ndarray) -> np.ndarray:
+    dx = np.maximum(np.maximum(bounds[:, 0] - xy[:, 0], xy[:, 0] - bounds[:, 2]), 0)
+    dy = np.maximum(np.maximum(bounds[:, 1] - xy[:, 1], xy[:, 1] - bounds[:, 3]), 0)
+    return dx * dx + dy * dy
+
+
+def _ranges(starts: np.ndarray, stops: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    width = int((stops - starts).max()) if len(starts) else 0
+    positions = starts[:, None] + np.arange(width)
+    return positions, positions < stops[:, None]
+
+
+def _single_query(point: Point) -> PointArray:
+    if not isinstance(point, Point):
+        raise ValueError(f"Trying to query KDTree with non Point object {str(point)}")
+    return PointArray(np.array(((point.x, point.y),), dtype=np.float64))
+
+
+class _PackedTree:
+    def __init__(self, ids: np.ndarray, xy: np.ndarray, leaf_size: int) -> None:
+        count = len(ids)
+        depth = 0
+        while count > leaf_size << depth:
+            depth += 1
+        starts, stops = _node_ranges(count, depth)
+        order = np.arange(count)
+        for start, stop in zip(
+            starts[: (1 << depth) - 1].tolist(), stops[: (1 << depth) - 1].tolist()
+        ):
+            segment = order[start:stop]
+            points = xy[segment]
+            axis = int(np.argmax(points.max(axis=0) - points.min(axis=0)))
+            order[start:stop] = segment[
+                np.argpartition(points[:, axis], (stop - start) // 2)
+            ]
+        self.ids = ids[order]
+        self.xy = xy[order]
+        self.depth = depth
+        self.starts = starts
+        self.stops = stops
+        self.bounds = np.empty((len(starts), 4))
+        self.bounds[:, :2] = np.inf
+        self.bounds[:, 2:] = -np.inf
+        first_leaf = (1 << depth) - 1
+        if count:
+            leaf_starts = starts[first_leaf:]
+            self.bounds[first_leaf:, :2] = np.minimum.reduceat(self.xy, leaf_starts)
+            self.bounds[first_leaf:, 2:] = np.maximum.reduceat(self.xy, leaf_starts)
+        for level in range(depth - 1, -1, -1):
+            nodes = np.arange((1 << level) - 1, (1 << (level + 1)) - 1)
+            left, right = self.bounds[2 * nodes + 1], self.bounds[2 * nodes + 2]
+            self.bounds[nodes, :2] = np.minimum(left[:, :2], right[:, :2])
+            self.bounds[nodes, 2:] = np.maximum(left[:, 2:], right[:, 2:])
+
+    def knn_limits(self, queries: np.ndarray, k: int, alive: np.ndarray) -> np.ndarray:
+        level = -1
+        while level < self.depth:
+            nodes = slice((1 << (level + 1)) - 1, (1 << (level + 2)) - 1)
+            if (self.stops[nodes] - self.starts[nodes]).min() < k:
+                break
+            level += 1
+        if level < 0:
+            return np.full(len(queries), np.inf)
+        nodes = np.zeros(len(queries), dtype=np.int64)
+        for _ in range(level):
+            left, right = 2 * nodes + 1, 2 * nodes + 2
+            nodes = np.where(
+                _box_distances(self.bounds[right], queries)
+                < _box_distances(self.bounds[left], queries),
+                right,
+                left,
+            )
+        positions, valid = _ranges(self.starts[nodes], self.stops[nodes])
+        positions = np.where(valid, positions, 0)
+        distances = ((self.xy[positions] - queries[:, None, :]) ** 2).sum(axis=-1)
+        distances[~(valid & alive[self.ids[positions]])] = np.inf
+        return np.partition(distances, k - 1, axis=1)[:, k - 1]
+
+    def within(self, queries: np.ndarray, limits: np.ndarray) -> Hits:
+        rows = np.arange(len(queries))
+        nodes = np.zeros(len(queries), dtype=np.int64)
+        for level in range(self.depth + 1):
+            keep = _box_distances(self.bounds[nodes], queries[rows]) <= limits[rows]
+            rows, nodes = rows[keep], nodes[keep]
+            if level < self.depth:
+                rows = np.repeat(rows, 2)
+                nodes = (2 * nodes[:, None] + np.array((1, 2))).reshape(-1)
+        positions, valid = _ranges(self.starts[nodes], self.stops[nodes])
+        rows = np.broadcast_to(rows[:, None], positions.shape)[valid]
+        positions = positions[valid]
+        distances = ((self.xy[positions] - queries[rows]) ** 2).sum(axis=1)
+        keep = distances <= limits[rows]
+        return rows[keep], self.ids[positions[keep]], distances[keep]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class KDTree:
+    def __init__(
+        self,
+        xy: np.ndarray,
+        leaf_size: int = 16,
+        buffer_size: int = 256,
+        rebuild_fraction: float = 0.25,
+        brute_force_elements: int = BRUTE_FORCE_ELEMENTS,
+    ) -> None:
+        if leaf_size < 1:
+            raise ValueError(f"KDTree leaf size must be at least 1, got {leaf_size}")
+        xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        self.leaf_size = leaf_size
+        self.buffer_size = buffer_size
+        self.rebuild_fraction = rebuild_fraction
+        self.brute_force_elements = brute_force_elements
+        self.entries = SpatialEntries(np.tile(xy, 2))
+        self._rebuild()
+
+    @staticmethod
+    def from_points(points: Points, leaf_size: int = 16) -> "KDTree":
+        return KDTree(as_point_array(points).xy, leaf_size=leaf_size)
+
+    @staticmethod
+    def from_rectangles(rectangles: Rectangles, leaf_size: int = 16) -> "KDTree":
+        xyxy = as_rectangle_array(rectangles).xyxy
+        return KDTree((xyxy[:, :2] + xyxy[:, 2:]) / 2, leaf_size=leaf_size)
+
+    @property
+    def xy(self) -> np.ndarray:
+        return self.entries.xyxy[:, :2]
+
+    def _pack(self, ids: np.ndarray) -> _PackedTree:
+        return _PackedTree(ids, self.xy[ids], self.leaf_size)
+
+    def _rebuild(self) -> None:
+        self._trees = [self._pack(np.flatnonzero(self.entries.alive))]
+        self._pending: List[int] = []
+        self._dead = 0
+
+    def _flush(self) -> None:
+        ids = np.array(self._pending, dtype=np.int64)
+        self._pending = []
+        while self._trees and len(self._trees[-1]) <= len(ids):
+            ids = np.concatenate((self._trees.pop().ids, ids))
+        self._trees.append(self._pack(ids[self.entries.alive[ids]]))
+
+    def insert(self, item: Union[Rectangle, Point]) -> int:
+        box = entry_box(item)
+        center = (box[:2] + box[2:]) / 2
+        entry_id = self.entries.append(np.tile(center, 2))
+        self._pending.append(entry_id)
+        if len(self._pending) >= self.buffer_size:
+            self._flush()
+        return entry_id
+
+    def extend(self, points: Points) -> np.ndarray:
+        entry_ids = self.entries.extend(np.tile(as_point_array(points).xy, 2))
+        self._pending.extend(entry_ids.tolist())
+        if len(self._pending) >= self.buffer_size:
+            self._flush()
+        return entry_ids
+
+    def delete(self, entry_id: int) -> None:
+        self.entries.remove(entry_id)
+        if entry_id in self._pending:
+            self._pending.remove(entry_id)
+        else:
+            self._dead += 1
+        if self._dead > max(self.leaf_size, self.rebuild_fraction * len(self)):
+            self._rebuild()
+
+    def _scan_hits(
+        self, ids: np.ndarray, queries: np.ndarray, k: int, limits: np.ndarray
+    ) -> Hits:
+        xy = self.xy[ids]
+        dx = xy[:, 0] - queries[:, 0:1]
+        dy = xy[:, 1] - queries[:, 1:2]
+        distances = np.add(dx * dx, np.multiply(dy, dy, out=dy), out=dx)
+        if k and len(ids) > k:
+            limits = np.partition(distances, k - 1, axis=1)[:, k - 1]
+        rows, columns = np.nonzero(distances <= limits[:, None])
+        return rows, ids[columns], distances[rows, columns]
+
+    def _hits(
+        self, queries: np.ndarray, k: int = 0, limits: Optional[np.ndarray] = None
+    ) -> Hits:
+        alive = self.entries.alive
+        if k:
+            limits = np.full(len(queries), np.inf)
+        if len(queries) * len(self) <= self.brute_force_elements:
+            found = [self._scan_hits(np.flatnonzero(alive), queries, k, limits)]
+        else:
+            pending = np.array(self._pending, dtype=np.int64)
+            found = [self._scan_hits(pending[alive[pending]], queries, 0, limits)]
+            for tree in self._trees:
+                tree_limits = tree.knn_limits(queries, k, alive) if k else limits
+                rows, ids, distances = tree.within(queries, tree_limits)
+                keep = alive[ids]
+                found.append((rows[keep], ids[keep], distances[keep]))
+        rows, ids, distances = (np.concatenate(column) for column in zip(*found))
+        order = np.lexsort((ids, distances, rows) if k else (ids, rows))
+        return rows[order], ids[order], distances[order]
+
+    @staticmethod
+    def _chunks(
+        queries: np.ndarray, chunk_size: int
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        queries = queries.astype(np.float64, copy=False)
+        for start in range(0, len(queries), chunk_size):
+            yield start, queries[start : start + chunk_size]
+
+    def query(
+        self,
+        points: Points,
+        k: int = 1,
+        chunk_size: int = DEFAULT_QUERY_CHUNK_SIZE,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        if k <= 0:
+            raise ValueError(f"KDTree query needs a positive k, got {k}")
+        queries = as_point_array(points).xy
+        distances = np.full((len(queries), k), np.inf)
+        indices = np.full((len(queries), k), -1, dtype=np.int64)
+        for start, chunk in self._chunks(queries, chunk_size):
+            rows, ids, squared = self._hits(chunk, k=k)
+            ranks = np.arange(len(rows)) - np.searchsorted(rows, rows)
+            keep = ranks < k
+            rows, ranks = rows[keep] + start, ranks[keep]
+            indices[rows, ranks] = ids[keep]
+            distances[rows, ranks] = np.sqrt(squared[keep])
+        return distances, indices
+
+    def query_radius(
+        self,
+        points: Points,
+        radius: Union[int, float, np.ndarray],
+        chunk_size: int = DEFAULT_QUERY_CHUNK_SIZE,
+    ) -> List[np.ndarray]:
+        queries = as_point_array(points).xy
+        limits = np.broadcast_to(
+            np.square(np.asarray(radius, dtype=np.float64)), (len(queries),)
+        )
+        found: List[np.ndarray] = []
+        for start, chunk in self._chunks(queries, chunk_size):
+            rows, ids, _ = self._hits(chunk, limits=limits[start : start + len(chunk)])
+            splits = np.searchsorted(rows, np.arange(1, len(chunk)))
+            found.extend(np.split(ids, splits))
+        return found
+
+    def nearest(self, point: Point, k: int = 1) -> np.ndarray:
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        _, indices = self.query(_single_query(point), k)
+        return indices[0][indices[0] >= 0]
+
+    def within(self, point: Point, radius: Union[int, float]) -> np.ndarray:
+        return self.query_radius(_single_query(point), radius)[0]
+
+    def __len__(self) -> int:
+        return self.entries.live_count
@@ -0,0 +1,151 @@
+from typing import List, Tuple, Union
+import heapq
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.point_array import Points, as_point_array
+from data_types.rectangle_array import Rectangles, as_rectangle_array
+from spatial.entries import SpatialEntries, box_distances, entry_box, overlaps
+
+
+def _children(nodes: np.ndarray, capacity: int, child_count: int) -> np.ndarray:
+    starts = nodes * capacity
+    counts = np.minimum(starts + capacity, child_count) - starts
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + offsets
+
+
+def _str_order(xyxy: np.ndarray, capacity: int) -> np.ndarray:
+    leaves = -(-len(xyxy) // capacity)
+    slices = max(1, int(np.ceil(np.sqrt(leaves))))
+    slice_size = slices * capacity
+    by_x = np.argsort(xyxy[:, 0] + xyxy[:, 2], kind="stable")
+    center_y = xyxy[by_x, 1] + xyxy[by_x, 3]
+    slice_ids = np.arange(len(xyxy)) // slice_size
+    return by_x[np.lexsort((center_y, slice_ids))]
+
+
+def _parent_bounds(bounds: np.ndarray, capacity: int) -> np.ndarray:
+    starts = np.arange(0, len(bounds), capacity)
+    return np.stack(
+        (
+            np.minimum.reduceat(bounds[:, 0], starts),
+            np.minimum.reduceat(bounds[:, 1], starts),
+            np.maximum.reduceat(bounds[:, 2], starts),
+            np.maximum.reduceat(bounds[:, 3], starts),
+        ),
+        axis=1,
+    )
+
+
+class RTree:
+    def __init__(
+        self,
+        xyxy: np.ndarray,
+        node_capacity: int = 16,
+        rebuild_fraction: float = 0.25,
+    ) -> None:
+        if node_capacity < 2:
+            raise ValueError(
+                f"RTree node capacity must be at least 2, got {node_capacity}"
+            )
+        self.node_capacity = node_capacity
+        self.rebuild_fraction = rebuild_fraction
+        self.entries = SpatialEntries(xyxy)
+        self._pack()
+
+    @staticmethod
+    def from_rectangles(rectangles: Rectangles, node_capacity: int = 16) -> "RTree":
+        return RTree(as_rectangle_array(rectangles).xyxy, node_capacity=node_capacity)
+
+    @staticmethod
+    def from_points(points: Points, node_capacity: int = 16) -> "RTree":
+        return RTree(np.tile(as_point_array(points).xy, 2), node_capacity=node_capacity)
+
+    def _pack(self) -> None:
+        live = np.flatnonzero(self.entries.alive)
+        self._packed_ids = live[_str_order(self.entries.xyxy[live], self.node_capacity)]
+        self._levels = [self.entries.xyxy[self._packed_ids]]
+        while len(self._levels[-1]) > 1:
+            self._levels.append(_parent_bounds(self._levels[-1], self.node_capacity))
+        self._pending: List[int] = []
+        self._packed_dead = 0
+
+    def _needs_rebuild(self) -> bool:
+        budget = max(self.node_capacity, self.rebuild_fraction * len(self._packed_ids))
+        return len(self._pending) + self._packed_dead > budget
+
+    def insert(self, item: Union[Rectangle, Point]) -> int:
+        entry_id = self.entries.append(entry_box(item))
+        self._pending.append(entry_id)
+        if self._needs_rebuild():
+            self._pack()
+        return entry_id
+
+    def delete(self, entry_id: int) -> None:
+        self.entries.remove(entry_id)
+        if entry_id in self._pending:
+            self._pending.remove(entry_id)
+        else:
+            self._packed_dead += 1
+        if self._needs_rebuild():
+            self._pack()
+
+    def _packed_window(self, window: np.ndarray) -> np.ndarray:
+        if len(self._packed_ids) == 0:
+            return self._packed_ids
+        nodes = np.arange(len(self._levels[-1]))
+        nodes = nodes[overlaps(self._levels[-1][nodes], window)]
+        for level in range(len(self._levels) - 2, -1, -1):
+            nodes = _children(nodes, self.node_capacity, len(self._levels[level]))
+            nodes = nodes[overlaps(self._levels[level][nodes], window)]
+        return self._packed_ids[nodes]
+
+    def query_window(self, window: Rectangle) -> np.ndarray:
+        box = entry_box(window)
+        found = self._packed_window(box)
+        pending = np.array(self._pending, dtype=np.int64)
+        found = np.concatenate(
+            (found, pending[overlaps(self.entries.xyxy[pending], box)])
+        )
+        return np.sort(found[self.entries.alive[found]])
+
+    def query_point(self, point: Point) -> np.ndarray:
+        return self.query_window(Rectangle.from_corners(point, point))
+
+    def nearest(self, point: Point, k: int = 1) -> np.ndarray:
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        heap = []
+        top = len(self._levels) - 1
+        if len(self._packed_ids) > 0:
+            for node, distance in enumerate(box_distances(self._levels[top], point)):
+                heapq.heappush(heap, (distance, top, node))
+        pending = np.array(self._pending, dtype=np.int64)
+        pending = pending[self.entries.alive[pending]]
+        for entry_id, distance in zip(
+            pending, box_distances(self.entries.xyxy[pending], point)
+        ):
+            heapq.heappush(heap, (distance, -1, int(entry_id)))
+
+        found: List[Tuple[float, int]] = []
+        while heap and (len(found) < k or heap[0][0] <= found[-1][0]):
+            distance, level, node = heapq.heappop(heap)
+            if level == -1:
+                found.append((distance, node))
+                continue
+            if level == 0:
+                entry_id = int(self._packed_ids[node])
+                if self.entries.alive[entry_id]:
+                    found.append((distance, entry_id))
+                continue
+            start = node * self.node_capacity
+            distances = box_distances(
+                self._levels[level - 1][start : start + self.node_capacity], point
+            )
+            for child, child_distance in enumerate(distances.tolist(), start):
+                heapq.heappush(heap, (child_distance, level - 1, child))
+        return np.array([entry_id for _, entry_id in sorted(found)[:k]], dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self.entries.live_count
@@ -0,0 +1,138 @@
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.point_array import PointArray
+from data_types.rectangle_array import RectangleArray
+from spatial.entries import box_distances
+
+
+def random_boxes(generator, count):
+    xy = generator.uniform(0, 1000, size=(count, 2))
+    wh = generator.uniform(1, 40, size=(count, 2))
+    return RectangleArray(np.concatenate((xy, xy + wh), axis=1))
+
+
+def brute_window(xyxy, alive, window):
+    hits = (
+        (xyxy[:, 0] <= window.right)
+        & (xyxy[:, 2] >= window.left)
+        & (xyxy[:, 1] <= window.bottom)
+        & (xyxy[:, 3] >= window.top)
+        & alive
+    )
+    return np.flatnonzero(hits).tolist()
+
+
+def brute_nearest(xyxy, alive, point, k):
+    distances = box_distances(xyxy, point)
+    distances[~alive] = np.inf
+    return np.argsort(distances, kind="stable")[:k].tolist()
+
+
+class SpatialIndexQueryCases:
+    def build_rectangles(self, rectangles):
+        raise NotImplementedError
+
+    def build_points(self, points):
+        raise NotImplementedError
+
+    def setUp(self) -> None:
+        generator = np.random.default_rng(0)
+        self.boxes = random_boxes(generator, 2000)
+        self.index = self.build_rectangles(self.boxes)
+        self.alive = np.ones(len(self.boxes), dtype=bool)
+        self.windows = random_boxes(generator, 25).to_rectangles()
+        self.points = PointArray(generator.uniform(0, 1000, size=(25, 2))).to_points()
+
+    def test_window(self):
+        for window in self.windows:
+            self.assertEqual(
+                self.index.query_window(window).tolist(),
+                brute_window(self.boxes.xyxy, self.alive, window),
+            )
+
+    def test_point(self):
+        for point in self.points:
+            self.assertEqual(
+                self.index.query_point(point).tolist(),
+                brute_window(
+                    self.boxes.xyxy, self.alive, Rectangle.from_corners(point, point)
+                ),
+            )
+
+    def test_nearest(self):
+        for point in self.points:
+            self.assertEqual(
+                self.index.nearest(point, k=5).tolist(),
+                brute_nearest(self.boxes.xyxy, self.alive, point, 5),
+            )
+
+    def test_points(self):
+        points = PointArray(np.random.default_rng(1).uniform(0, 100, size=(500, 2)))
+        index = self.build_points(points)
+        query = Point(50, 50)
+        distances = np.hypot(points.x - 50, points.y - 50)
+        self.assertEqual(
+            index.nearest(query, k=3).tolist(), np.argsort(distances)[:3].tolist()
+        )
+        window = Rectangle.from_xyxy(10, 10, 30, 40)
+        self.assertEqual(
+            index.query_window(window).tolist(),
+            brute_window(np.tile(points.xy, 2), np.ones(500, dtype=bool), window),
+        )
+
+    def test_empty(self):
+        index = self.build_rectangles([])
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.query_point(Point(1, 1)).tolist(), [])
+        self.assertEqual(index.nearest(Point(1, 1), k=2).tolist(), [])
+
+    def runTest(self):
+        self.test_window()
+        self.test_point()
+        self.test_nearest()
+        self.test_points()
+        self.test_empty()
+
+
+class SpatialIndexUpdateCases:
+    def build_rectangles(self, rectangles):
+        raise NotImplementedError
+
+    def test_insert_and_delete(self):
+        generator = np.random.default_rng(2)
+        boxes = random_boxes(generator, 300)
+        index = self.build_rectangles(boxes)
+        xyxy = boxes.xyxy.copy()
+        alive = np.ones(len(xyxy), dtype=bool)
+        for step, rect in enumerate(random_boxes(generator, 200).to_rectangles()):
+            entry_id = index.insert(rect)
+            self.assertEqual(entry_id, len(xyxy))
+            xyxy = np.vstack((xyxy, [[rect.left, rect.top, rect.right, rect.bottom]]))
+            alive = np.append(alive, True)
+            victim = int(generator.integers(0, len(xyxy)))
+            if alive[victim]:
+                index.delete(victim)
+                alive[victim] = False
+            if step % 20 == 0:
+                window = Rectangle.from_xyxy(200, 200, 600, 500)
+                self.assertEqual(
+                    index.query_window(window).tolist(),
+                    brute_window(xyxy, alive, window),
+                )
+                point = Point(500.5, 500.5)
+                self.assertEqual(
+                    index.nearest(point, k=4).tolist(),
+                    brute_nearest(xyxy, alive, point, 4),
+                )
+        self.assertEqual(len(index), int(alive.sum()))
+
+    def test_delete_missing(self):
+        index = self.build_rectangles([Rectangle.from_xyxy(0, 0, 1, 1)])
+        index.delete(0)
+        with self.assertRaises(KeyError):
+            index.delete(0)
+
+    def runTest(self):
+        self.test_insert_and_delete()
+        self.test_delete_missing()
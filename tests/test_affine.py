@@ -0,0 +1,109 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+import numpy as np
+from data_types.affine import Affine
+from data_types.point import Point
+from data_types.point_array import PointArray
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+
+
+class AffineTestCase(TestCase):
+    def setUp(self) -> None:
+        self.rect = Rectangle.from_xyxy(100, 200, 300, 400)
+        self.rectangles = [
+            self.rect,
+            Rectangle.from_xyxy(0, 0, 1920, 1080),
+            Rectangle.from_xyxy(10.5, 20.25, 30, 45),
+        ]
+
+    def test_matches_operators(self):
+        offset = Point(7, -3)
+        transform = Affine.translation(-7, 3).then(Affine.scaling(2, 3))
+        self.assertEqual(transform(self.rect), (self.rect - offset) * Point(2, 3))
+        self.assertEqual(
+            Affine.translation(-7, 3)(Point(1, 2)), Point(1, 2).relative_to(offset)
+        )
+        self.assertEqual(Affine.translation(3, 4)(self.rect).left, 103)
+        self.assertIsInstance(Affine.translation(3, 4)(self.rect).left, int)
+
+    def test_compose_and_invert(self):
+        first = Affine(2, 1, 5, -1, 3, 7)
+        second = Affine.letterbox((1920, 1080), (640, 640))
+        point = Point(12.5, -4)
+        composed, chained = first.then(second)(point), second(first(point))
+        self.assertAlmostEqual(composed.x, chained.x)
+        self.assertAlmostEqual(composed.y, chained.y)
+        roundtrip = first.inverse()(first(point))
+        self.assertAlmostEqual(roundtrip.x, point.x)
+        self.assertAlmostEqual(roundtrip.y, point.y)
+        self.assertEqual(first @ Affine.identity(), first)
+        with self.assertRaises(ValueError):
+            Affine.scaling(0, 1).inverse()
+        with self.assertRaises(ValueError):
+            first @ 2
+
+    def test_presets(self):
+        letterbox = Affine.letterbox((1920, 1080), (640, 640))
+        self.assertEqual(
+            letterbox(Rectangle.from_xyxy(0, 0, 1920, 1080)),
+            Rectangle.from_xyxy(0, 140, 640, 500),
+        )
+        crop = Affine.crop_resize(Rectangle.from_xyxy(100, 200, 500, 400), (200, 100))
+        self.assertEqual(crop(Point(100, 200)), Point(0, 0))
+        self.assertEqual(crop(Point(500, 400)), Point(200, 100))
+        self.assertEqual(
+            Affine.resize((100, 50), (200, 200))(self.rect),
+            Rectangle.from_xyxy(200, 800, 600, 1600),
+        )
+        back = letterbox.inverse()(letterbox(self.rect))
+        for mapped, original in zip(
+            back.to_xyxy().values(), self.rect.to_xyxy().values()
+        ):
+            self.assertAlmostEqual(mapped, original)
+
+    def test_rotation_bounds(self):
+        quarter_turn = Affine(0, -1, 0, 1, 0, 0)
+        self.assertEqual(
+            quarter_turn(self.rect), Rectangle.from_xyxy(-400, 100, -200, 300)
+        )
+        flip = Affine.scaling(-1, 1)
+        self.assertEqual(flip(self.rect), Rectangle.from_xyxy(-300, 200, -100, 400))
+
+    def test_batched(self):
+        array = RectangleArray.from_rectangles(self.rectangles)
+        for transform in (
+            Affine.letterbox((1920, 1080), (640, 640)),
+            Affine(0, -1, 5, 1, 0, -2),
+            Affine.scaling(-0.5, 2),
+        ):
+            self.assertEqual(
+                transform(array).to_rectangles(),
+                [transform(rect) for rect in self.rectangles],
+            )
+            points = [rect.top_left for rect in self.rectangles]
+            self.assertEqual(
+                transform(PointArray.from_points(points)).to_points(),
+                [transform(point) for point in points],
+            )
+        integer = RectangleArray.from_rectangles(self.rectangles[:2])
+        self.assertEqual(Affine.translation(1, 2)(integer).xyxy.dtype, np.int64)
+        with self.assertRaises(ValueError):
+            Affine.identity()("box")
+
+    def runTest(self):
+        self.test_matches_operators()
+        self.test_compose_and_invert()
+        self.test_presets()
+        self.test_rotation_bounds()
+        self.test_batched()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(AffineTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
@@ -0,0 +1,149 @@
+import os
+import sys
+import tempfile
+from unittest import TextTestRunner, TestCase, TestSuite, skipIf
+from unittest.mock import patch
+import numpy as np
+from data_types.point_array import PointArray
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+from serialization import arrow_io
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class MissingPyarrowTestCase(TestCase):
+    def test_import_error(self):
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            with self.assertRaises(ImportError):
+                arrow_io.rectangles_to_arrow([Rectangle.from_xyxy(0, 0, 1, 1)])
+
+    def runTest(self):
+        self.test_import_error()
+
+
+@skipIf(pyarrow is None, "pyarrow is not installed")
+class ArrowInteropTestCase(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        generator = np.random.default_rng(0)
+        xy = generator.uniform(0, 100, size=(100, 2))
+        self.rectangles = RectangleArray(
+            np.concatenate((xy, xy + generator.uniform(1, 20, size=(100, 2))), axis=1)
+        )
+        self.points = PointArray(generator.integers(0, 50, size=(30, 2)))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def test_columns_match_to_xyxy_keys(self):
+        batch = arrow_io.rectangles_to_arrow(self.rectangles)
+        self.assertEqual(
+            batch.schema.names, list(Rectangle.from_xyxy(0, 0, 1, 1).to_xyxy())
+        )
+        self.assertEqual(arrow_io.rectangles_from_arrow(batch), self.rectangles)
+        xywh = arrow_io.rectangles_to_arrow(self.rectangles, layout="xywh")
+        self.assertEqual(xywh.schema.names, ["x", "y", "w", "h"])
+        self.assertEqual(
+            xywh.column("w").to_numpy().tolist(), self.rectangles.width.tolist()
+        )
+        restored = arrow_io.rectangles_from_arrow(
+            pyarrow.Table.from_batches([xywh]), "xywh"
+        )
+        np.testing.assert_allclose(restored.xyxy, self.rectangles.xyxy)
+
+    def test_column_mapping(self):
+        mapping = {"x1": "xmin", "y1": "ymin", "x2": "xmax", "y2": "ymax"}
+        table = pyarrow.table(
+            {
+                "label": ["box"] * len(self.rectangles),
+                **{
+                    mapping[key]: values
+                    for key, values in self.rectangles.to_xyxy().items()
+                },
+            }
+        )
+        self.assertEqual(
+            arrow_io.rectangles_from_arrow(table, columns=mapping), self.rectangles
+        )
+        points = arrow_io.points_to_arrow(
+            self.points, layout="yx", columns={"y": "row"}
+        )
+        self.assertEqual(points.schema.names, ["row", "x"])
+        self.assertEqual(
+            arrow_io.points_from_arrow(points, layout="yx", columns={"y": "row"}),
+            self.points,
+        )
+        with self.assertRaises(ValueError):
+            arrow_io.rectangles_from_arrow(table)
+        with self.assertRaises(ValueError):
+            arrow_io.rectangles_from_arrow(table, columns={"left": "xmin"})
+
+    def test_list_column_is_zero_copy(self):
+        batch = arrow_io.rectangles_to_arrow(self.rectangles, list_column="bbox")
+        restored = arrow_io.rectangles_from_arrow(batch, list_column="bbox")
+        self.assertEqual(restored, self.rectangles)
+        self.assertTrue(
+            np.shares_memory(restored.xyxy, batch.column("bbox").flatten().to_numpy())
+        )
+        sliced = arrow_io.rectangles_from_arrow(batch.slice(10, 5), list_column="bbox")
+        self.assertEqual(sliced, self.rectangles[10:15])
+        with self.assertRaises(ValueError):
+            arrow_io.points_from_arrow(batch, list_column="bbox")
+
+    def test_nulls_rejected(self):
+        table = pyarrow.table({"x": [1.0, None], "y": [2.0, 3.0]})
+        with self.assertRaises(ValueError):
+            arrow_io.points_from_arrow(table)
+
+    def test_parquet_streaming(self):
+        path = self._path("rectangles.parquet")
+        count = arrow_io.write_rectangles_parquet(
+            self.rectangles, path, layout="xywh", chunk_size=32
+        )
+        self.assertEqual(count, 100)
+        chunks = list(
+            arrow_io.read_rectangles_parquet(path, layout="xywh", batch_size=40)
+        )
+        self.assertEqual([len(chunk) for chunk in chunks], [40, 40, 20])
+        np.testing.assert_allclose(
+            np.concatenate([chunk.xyxy for chunk in chunks]), self.rectangles.xyxy
+        )
+        path = self._path("points.parquet")
+        count = arrow_io.write_point_batches_parquet(
+            [self.points[:10], self.points[10:].to_points()], path, list_column="xy"
+        )
+        self.assertEqual(count, 30)
+        chunks = list(arrow_io.read_points_parquet(path, list_column="xy"))
+        self.assertEqual(
+            np.concatenate([c.xy for c in chunks]).tolist(), self.points.xy.tolist()
+        )
+        self.assertEqual(chunks[0].xy.dtype, np.int64)
+        path = self._path("empty.parquet")
+        self.assertEqual(arrow_io.write_points_parquet([], path), 0)
+        self.assertEqual(sum(len(c) for c in arrow_io.read_points_parquet(path)), 0)
+
+    def runTest(self):
+        self.test_columns_match_to_xyxy_keys()
+        self.test_column_mapping()
+        self.test_list_column_is_zero_copy()
+        self.test_nulls_rejected()
+        self.test_parquet_streaming()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(MissingPyarrowTestCase())
+    suite.addTest(ArrowInteropTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
@@ -0,0 +1,157 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+from itertools import combinations, permutations
+import numpy as np
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+from ops.association import (
+    associate,
+    center_distance_cost,
+    cost_matrix,
+    gate,
+    greedy_assignment,
+    hungarian_assignment,
+)
+from ops.iou import pairwise_iou
+
+
+def brute_force_assignment(cost):
+    rows, columns = cost.shape
+    for size in range(min(rows, columns), 0, -1):
+        totals = [
+            cost[list(chosen), list(targets)].sum()
+            for chosen in combinations(range(rows), size)
+            for targets in permutations(range(columns), size)
+        ]
+        finite = [total for total in totals if np.isfinite(total)]
+        if finite:
+            return size, min(finite)
+    return 0, 0.0
+
+
+class CostMatrixTestCase(TestCase):
+    def setUp(self) -> None:
+        self.first = [
+            Rectangle.from_xyxy(0, 0, 10, 10),
+            Rectangle.from_xyxy(20, 0, 30, 4),
+        ]
+        self.second = [
+            Rectangle.from_xyxy(3, 4, 13, 14),
+            Rectangle.from_xyxy(20, 0, 30, 4),
+        ]
+
+    def test_metrics(self):
+        self.assertEqual(
+            cost_matrix(self.first, self.second).tolist(),
+            (1 - pairwise_iou(self.first, self.second)).tolist(),
+        )
+        self.assertEqual(
+            center_distance_cost(self.first, self.second).tolist(),
+            [[5.0, np.hypot(20, 3)], [np.hypot(17, 7), 0.0]],
+        )
+        self.assertEqual(
+            cost_matrix(self.first, self.second, "center_distance").tolist(),
+            center_distance_cost(self.first, self.second).tolist(),
+        )
+        with self.assertRaises(ValueError):
+            cost_matrix(self.first, self.second, "mahalanobis")
+
+    def test_gate(self):
+        gated = gate(np.array([[0.2, 0.8], [np.inf, 0.5]]), 0.5)
+        self.assertEqual(gated.tolist(), [[0.2, np.inf], [np.inf, 0.5]])
+
+    def runTest(self):
+        self.test_metrics()
+        self.test_gate()
+
+
+class AssignmentTestCase(TestCase):
+    def test_greedy(self):
+        cost = np.array([[1.0, 2.0], [1.5, 10.0]])
+        rows, columns = greedy_assignment(cost)
+        self.assertEqual(list(zip(rows.tolist(), columns.tolist())), [(0, 0), (1, 1)])
+        rows, columns = greedy_assignment(np.full((2, 3), np.inf))
+        self.assertEqual((rows.size, columns.size), (0, 0))
+
+    def test_hungarian_is_optimal(self):
+        cost = np.array([[1.0, 2.0], [1.5, 10.0]])
+        rows, columns = hungarian_assignment(cost)
+        self.assertEqual(list(zip(rows.tolist(), columns.tolist())), [(0, 1), (1, 0)])
+        generator = np.random.default_rng(0)
+        for _ in range(100):
+            shape = tuple(generator.integers(1, 6, size=2))
+            cost = generator.uniform(0, 1, size=shape)
+            cost[generator.uniform(size=shape) < 0.4] = np.inf
+            rows, columns = hungarian_assignment(cost)
+            self.assertEqual(len(set(rows.tolist())), rows.size)
+            self.assertEqual(len(set(columns.tolist())), columns.size)
+            size, total = brute_force_assignment(cost)
+            self.assertEqual(rows.size, size)
+            self.assertAlmostEqual(cost[rows, columns].sum(), total)
+
+    def test_invalid_cost(self):
+        with self.assertRaises(ValueError):
+            hungarian_assignment(np.zeros(3))
+        with self.assertRaises(ValueError):
+            greedy_assignment(np.array([[np.nan]]))
+
+    def runTest(self):
+        self.test_greedy()
+        self.test_hungarian_is_optimal()
+        self.test_invalid_cost()
+
+
+class AssociateTestCase(TestCase):
+    def setUp(self) -> None:
+        generator = np.random.default_rng(1)
+        corners = generator.uniform(0, 1000, size=(30, 2))
+        self.tracks = RectangleArray(np.concatenate((corners, corners + 40), axis=1))
+        self.order = generator.permutation(30)
+        self.detections = RectangleArray(
+            self.tracks.xyxy[self.order] + generator.normal(0, 1, (30, 4))
+        )
+
+    def test_recovers_permutation(self):
+        for solver in ("greedy", "hungarian"):
+            for metric, max_cost in (("iou", 0.7), ("center_distance", 10.0)):
+                matches, unmatched_tracks, unmatched_detections = associate(
+                    self.tracks, self.detections, metric, max_cost, solver
+                )
+                self.assertEqual(matches[:, 0].tolist(), list(range(30)))
+                self.assertEqual(
+                    self.order[matches[:, 1]].tolist(), matches[:, 0].tolist()
+                )
+                self.assertEqual(unmatched_tracks.size, 0)
+                self.assertEqual(unmatched_detections.size, 0)
+
+    def test_unmatched(self):
+        matches, unmatched_tracks, unmatched_detections = associate(
+            self.tracks[:5], self.detections[:0], max_cost=0.7
+        )
+        self.assertEqual(matches.shape, (0, 2))
+        self.assertEqual(unmatched_tracks.tolist(), list(range(5)))
+        self.assertEqual(unmatched_detections.size, 0)
+        far = self.tracks[:3] + 5000
+        matches, unmatched_tracks, unmatched_detections = associate(
+            self.tracks[:3], far, max_cost=0.7, solver="greedy"
+        )
+        self.assertEqual(matches.shape, (0, 2))
+        self.assertEqual(unmatched_detections.tolist(), [0, 1, 2])
+        with self.assertRaises(ValueError):
+            associate(self.tracks, self.detections, solver="auction")
+
+    def runTest(self):
+        self.test_recovers_permutation()
+        self.test_unmatched()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(CostMatrixTestCase())
+    suite.addTest(AssignmentTestCase())
+    suite.addTest(AssociateTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
@@ -0,0 +1,219 @@
+import io
+import json
+from unittest import TextTestRunner, TestCase, TestSuite
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from serialization.box_formats import (
+    pack_points,
+    pack_rectangles,
+    points_from_array,
+    points_to_array,
+    read_points_jsonl,
+    read_rectangles_jsonl,
+    rectangles_from_array,
+    rectangles_to_array,
+    unpack_points,
+    unpack_rectangles,
+    write_points_jsonl,
+    write_rectangles_jsonl,
+)
+
+
+class BoxArrayFormatTestCase(TestCase):
+    def setUp(self) -> None:
+        self.rectangles = [
+            Rectangle.from_xyxy(1, 2, 5, 7),
+            Rectangle.from_xyxy(0.5, 1.25, 3.5, 2.0),
+            Rectangle.from_xyxy(-4, -3, -1, 0),
+        ]
+        self.points = [Point(1, 2), Point(3.5, -4), Point(0, 0.25)]
+
+    def test_rectangles_xyxy(self):
+        values = rectangles_to_array(self.rectangles)
+        self.assertEqual(values.shape, (3, 4))
+        self.assertEqual(
+            values.tolist(), [list(rect.to_xyxy().values()) for rect in self.rectangles]
+        )
+        self.assertEqual(rectangles_from_array(values).to_rectangles(), self.rectangles)
+
+    def test_rectangles_xywh(self):
+        values = rectangles_to_array(self.rectangles, layout="xywh")
+        self.assertEqual(
+            values.tolist(), [list(rect.to_xywh().values()) for rect in self.rectangles]
+        )
+        self.assertEqual(
+            rectangles_from_array(values, layout="xywh").to_rectangles(),
+            [Rectangle.from_xywh(*row) for row in values.tolist()],
+        )
+
+    def test_points(self):
+        self.assertEqual(
+            points_from_array(points_to_array(self.points)).to_points(), self.points
+        )
+        yx = points_to_array(self.points, layout="yx")
+        self.assertEqual(yx.tolist(), [[p.y, p.x] for p in self.points])
+        self.assertEqual(points_from_array(yx, layout="yx").to_points(), self.points)
+
+    def test_unknown_layout(self):
+        with self.assertRaises(ValueError):
+            rectangles_to_array(self.rectangles, layout="cxcywh")
+
+    def runTest(self):
+        self.test_rectangles_xyxy()
+        self.test_rectangles_xywh()
+        self.test_points()
+        self.test_unknown_layout()
+
+
+class BoxBinaryFormatTestCase(TestCase):
+    def setUp(self) -> None:
+        self.rectangles = [
+            Rectangle.from_xyxy(1, 2, 5, 7),
+            Rectangle.from_xyxy(0, 0, 3, 4),
+        ]
+
+    def test_float_round_trip(self):
+        buffer = pack_rectangles(self.rectangles)
+        self.assertEqual(len(buffer), 2 * 4 * 8)
+        self.assertEqual(unpack_rectangles(buffer).to_rectangles(), self.rectangles)
+
+    def test_int_round_trip(self):
+        buffer = pack_rectangles(self.rectangles, layout="xywh", dtype=np.int32)
+        self.assertEqual(len(buffer), 2 * 4 * 4)
+        unpacked = unpack_rectangles(buffer, layout="xywh", dtype=np.int32)
+        self.assertEqual(unpacked.xyxy.dtype, np.int64)
+        self.assertEqual(unpacked.to_rectangles(), self.rectangles)
+
+    def test_points(self):
+        points = [Point(1.5, 2), Point(3, 4)]
+        buffer = pack_points(points, layout="yx", dtype=np.float32)
+        self.assertEqual(
+            unpack_points(buffer, layout="yx", dtype=np.float32).to_points(), points
+        )
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            pack_rectangles([Rectangle.from_xyxy(0.5, 0, 1, 1)], dtype=np.int32)
+        with self.assertRaises(ValueError):
+            pack_points([Point(3_000_000_000, 0)], dtype=np.int32)
+        with self.assertRaises(ValueError):
+            pack_points([Point(-1, 0)], dtype=np.uint16)
+        with self.assertRaises(ValueError):
+            unpack_rectangles(b"\x00" * 12)
+
+    def runTest(self):
+        self.test_float_round_trip()
+        self.test_int_round_trip()
+        self.test_points()
+        self.test_invalid()
+
+
+class BoxJsonLinesFormatTestCase(TestCase):
+    def setUp(self) -> None:
+        self.rectangles = [
+            Rectangle.from_xyxy(index, index + 0.5, index * 2, index * 3)
+            for index in range(10)
+        ]
+
+    def test_round_trip(self):
+        stream = io.StringIO()
+        self.assertEqual(
+            write_rectangles_jsonl(self.rectangles, stream, chunk_size=3), 10
+        )
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 10)
+        self.assertEqual(json.loads(lines[1]), self.rectangles[1].to_xyxy())
+        stream.seek(0)
+        chunks = list(read_rectangles_jsonl(stream, chunk_size=4))
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+        self.assertEqual(
+            [rect for chunk in chunks for rect in chunk.to_rectangles()],
+            self.rectangles,
+        )
+
+    def test_xywh(self):
+        stream = io.StringIO()
+        write_rectangles_jsonl(self.rectangles, stream, layout="xywh")
+        self.assertEqual(
+            json.loads(stream.getvalue().splitlines()[2]), self.rectangles[2].to_xywh()
+        )
+        stream.seek(0)
+        (chunk,) = read_rectangles_jsonl(stream, layout="xywh")
+        self.assertEqual(chunk.to_rectangles(), self.rectangles)
+
+    def test_foreign_field_order(self):
+        stream = io.StringIO('{"y": 2, "x": 1}\n\n{"x": 3, "y": 4}\n')
+        (chunk,) = read_points_jsonl(stream)
+        self.assertEqual(chunk.xy.dtype, np.int64)
+        self.assertEqual(chunk.to_points(), [Point(1, 2), Point(3, 4)])
+
+    def test_points(self):
+        points = [Point(1, 2.5), Point(-3e-7, 4)]
+        stream = io.StringIO()
+        write_points_jsonl(points, stream)
+        stream.seek(0)
+        (chunk,) = read_points_jsonl(stream)
+        self.assertEqual(chunk.to_points(), points)
+
+    def test_general_json(self):
+        stream = io.StringIO(
+            '{"label": "car, red", "x": 1, "y": 2}\n'
+            '{"y": 4.5, "x": 3, "extra": {"nested": [1, 2]}}\n'
+        )
+        (chunk,) = read_points_jsonl(stream)
+        self.assertEqual(chunk.xy.dtype, np.float64)
+        self.assertEqual(chunk.to_points(), [Point(1, 2), Point(3, 4.5)])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            list(read_points_jsonl(io.StringIO('{"x": 1}\n')))
+        with self.assertRaises(ValueError):
+            list(read_points_jsonl(io.StringIO('{"x": 1, "z": 2}\n')))
+        with self.assertRaises(ValueError):
+            list(read_points_jsonl(io.StringIO('{"x": 1, "x": 2}\n')))
+        with self.assertRaises(ValueError):
+            list(read_points_jsonl(io.StringIO('{"x": null, "y": 2}\n')))
+        with self.assertRaises(ValueError):
+            list(read_points_jsonl(io.StringIO('{"x": "1", "y": 2}\n')))
+        with self.assertRaises(ValueError):
+            list(read_points_jsonl(io.StringIO('{"x": 1, "y": 2\n')))
+        with self.assertRaises(ValueError):
+            write_points_jsonl([Point(float("inf"), 0)], io.StringIO())
+        with self.assertRaises(ValueError):
+            write_points_jsonl([Point(float("nan"), 0)], io.StringIO())
+
+    def test_out_of_range(self):
+        for line in (
+            '{"x": 99999999999999999999, "y": 2}\n',
+            '{"label": "far", "x": -99999999999999999999, "y": 2}\n',
+            '{"x": NaN, "y": 2}\n',
+            '{"x": 1, "y": Infinity}\n',
+            '{"x": -Infinity, "y": 2.5}\n',
+            '{"x": 1e400, "y": 2}\n',
+            '{"label": "nan", "x": NaN, "y": 2}\n',
+        ):
+            with self.assertRaises(ValueError):
+                list(read_points_jsonl(io.StringIO(line)))
+
+    def runTest(self):
+        self.test_round_trip()
+        self.test_xywh()
+        self.test_foreign_field_order()
+        self.test_points()
+        self.test_general_json()
+        self.test_invalid()
+        self.test_out_of_range()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(BoxArrayFormatTestCase())
+    suite.addTest(BoxBinaryFormatTestCase())
+    suite.addTest(BoxJsonLinesFormatTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
@@ -0,0 +1,105 @@
+import os
+import tempfile
+from unittest import TextTestRunner, TestCase, TestSuite
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+from serialization.box_store import BoxStore
+
+
+class BoxStoreTestCase(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.rectangles = [
+            Rectangle.from_xyxy(index, index * 2, index + 3, index * 2 + 5)
+            for index in range(50)
+        ]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def test_round_trip(self):
+        path = self._path("round_trip.bin")
+        BoxStore.from_rectangles(path, self.rectangles, dtype=np.int32)
+        store = BoxStore(path)
+        self.assertEqual(len(store), 50)
+        self.assertEqual(store.dtype, np.dtype("<i4"))
+        self.assertEqual(store[7], self.rectangles[7])
+        self.assertEqual(store[-1], self.rectangles[-1])
+        self.assertEqual(list(store), self.rectangles)
+
+    def test_columnar_slices(self):
+        path = self._path("columnar_slices.bin")
+        store = BoxStore.from_rectangles(path, self.rectangles)
+        self.assertIsInstance(store.records, np.memmap)
+        sliced = store[10:20]
+        self.assertIsInstance(sliced, RectangleArray)
+        self.assertTrue(np.shares_memory(sliced.xyxy, store.records))
+        self.assertEqual(sliced.to_rectangles(), self.rectangles[10:20])
+        self.assertEqual(
+            store.column("y2").tolist(), [r.bottom for r in self.rectangles]
+        )
+        with self.assertRaises(ValueError):
+            store.column("w")
+
+    def test_append_and_chunks(self):
+        path = self._path("append_and_chunks.bin")
+        store = BoxStore.create(path)
+        self.assertEqual(len(store), 0)
+        self.assertEqual(list(store.chunks()), [])
+        self.assertEqual(store.append(self.rectangles[:30]), 0)
+        self.assertEqual(
+            store.append(RectangleArray.from_rectangles(self.rectangles[30:])), 30
+        )
+        self.assertEqual(len(BoxStore(path)), 50)
+        chunks = list(store.chunks(chunk_size=16))
+        self.assertEqual([len(chunk) for chunk in chunks], [16, 16, 16, 2])
+        self.assertEqual(
+            [rect for chunk in chunks for rect in chunk.to_rectangles()],
+            self.rectangles,
+        )
+
+    def test_points(self):
+        path = self._path("points.bin")
+        points = [Point(1.5, 2), Point(3, 4.25)]
+        store = BoxStore.from_points(path, points, dtype=np.float32)
+        self.assertEqual(store.kind, "points")
+        self.assertEqual(store[1], points[1])
+        self.assertEqual(store[:].to_points(), points)
+        self.assertEqual(store.column("x").tolist(), [1.5, 3])
+
+    def test_invalid(self):
+        path = self._path("invalid.bin")
+        with open(path, "wb") as file:
+            file.write(b"not a box store at all")
+        with self.assertRaises(ValueError):
+            BoxStore(path)
+        BoxStore.from_rectangles(path, self.rectangles[:2])
+        with open(path, "ab") as file:
+            file.write(b"\0" * 5)
+        with self.assertRaises(ValueError):
+            BoxStore(path)
+        with self.assertRaises(ValueError):
+            BoxStore.create(path, kind="polygons")
+
+    def runTest(self):
+        self.test_round_trip()
+        self.test_columnar_slices()
+        self.test_append_and_chunks()
+        self.test_points()
+        self.test_invalid()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(BoxStoreTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
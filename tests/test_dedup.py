@@ -0,0 +1,103 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from ops.dedup import (
+    deduplicate_points,
+    deduplicate_rectangles,
+    unique_points,
+    unique_rectangles,
+)
+
+
+class HashingTestCase(TestCase):
+    def test_point_hash(self):
+        self.assertEqual(hash(Point(1, 2)), hash(Point(1.0, 2.0)))
+        self.assertEqual(len({Point(1, 2), Point(1.0, 2.0), Point(2, 1)}), 2)
+        self.assertEqual(hash(Point(1, 2).freeze()), hash(Point(1, 2)))
+
+    def test_rectangle_hash(self):
+        rect = Rectangle.from_xyxy(1, 2, 3, 4)
+        same = Rectangle.from_xyxy(1.0, 2.0, 3.0, 4.0)
+        self.assertEqual(hash(rect), hash(same))
+        self.assertEqual(hash(rect.freeze()), hash(rect))
+        self.assertEqual({rect: "a"}[same], "a")
+        self.assertEqual(len({rect, same, rect + 1}), 2)
+
+    def runTest(self):
+        self.test_point_hash()
+        self.test_rectangle_hash()
+
+
+class DeduplicationTestCase(TestCase):
+    def setUp(self) -> None:
+        self.points = [
+            Point(1, 2),
+            Point(3, 4),
+            Point(1.0, 2.0),
+            Point(0, 0),
+            Point(3, 4),
+        ]
+        self.rectangles = [
+            Rectangle.from_xyxy(0, 0, 10, 10),
+            Rectangle.from_xyxy(0.01, -0.02, 10.01, 9.99),
+            Rectangle.from_xyxy(5, 5, 6, 6),
+            Rectangle.from_xyxy(0, 0, 10, 10),
+        ]
+
+    def test_exact_points(self):
+        indices, labels = unique_points(self.points)
+        self.assertEqual(indices.tolist(), [0, 1, 3])
+        self.assertEqual(labels.tolist(), [0, 1, 0, 2, 1])
+        self.assertEqual(
+            deduplicate_points(self.points).to_points(),
+            list(dict.fromkeys(self.points)),
+        )
+
+    def test_exact_rectangles(self):
+        indices, labels = unique_rectangles(self.rectangles)
+        self.assertEqual(indices.tolist(), [0, 1, 2])
+        self.assertEqual(labels.tolist(), [0, 1, 2, 0])
+
+    def test_tolerance(self):
+        indices, labels = unique_rectangles(self.rectangles, tolerance=0.1)
+        self.assertEqual(indices.tolist(), [0, 2])
+        self.assertEqual(labels.tolist(), [0, 0, 1, 0])
+        self.assertEqual(
+            deduplicate_rectangles(self.rectangles, tolerance=0.1).to_rectangles(),
+            [self.rectangles[0], self.rectangles[2]],
+        )
+        with self.assertRaises(ValueError):
+            unique_points(self.points, tolerance=-1)
+
+    def test_matches_set_semantics(self):
+        generator = np.random.default_rng(0)
+        values = generator.integers(0, 5, size=(500, 2))
+        points = [Point(x, y) for x, y in values.tolist()]
+        self.assertEqual(
+            deduplicate_points(points).to_points(), list(dict.fromkeys(points))
+        )
+
+    def test_empty(self):
+        indices, labels = unique_points([])
+        self.assertEqual((len(indices), len(labels)), (0, 0))
+        self.assertEqual(len(deduplicate_rectangles([])), 0)
+
+    def runTest(self):
+        self.test_exact_points()
+        self.test_exact_rectangles()
+        self.test_tolerance()
+        self.test_matches_set_semantics()
+        self.test_empty()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(HashingTestCase())
+    suite.addTest(DeduplicationTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
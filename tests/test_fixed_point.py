@@ -0,0 +1,111 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+import numpy as np
+from data_types.fixed_point import FixedPointFormat, round_divide, round_divide_array
+from data_types.point import Point
+from data_types.point_array import PointArray
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+
+
+class RoundDivideTestCase(TestCase):
+    def test_half_to_even(self):
+        cases = [(5, 2), (7, 2), (-5, 2), (-7, 2), (5, -2), (10, 4), (11, 4), (-11, 4)]
+        self.assertEqual(
+            [round_divide(n, d) for n, d in cases], [round(n / d) for n, d in cases]
+        )
+        numerators = np.array([n for n, _ in cases])
+        denominators = np.array([d for _, d in cases])
+        self.assertEqual(
+            round_divide_array(numerators, denominators).tolist(),
+            [round_divide(n, d) for n, d in cases],
+        )
+
+    def test_exact_beyond_float(self):
+        big = 2**60 + 3
+        self.assertEqual(round_divide(big, 2), 2**59 + 2)
+
+    def runTest(self):
+        self.test_half_to_even()
+        self.test_exact_beyond_float()
+
+
+class FixedPointFormatTestCase(TestCase):
+    def setUp(self) -> None:
+        self.format = FixedPointFormat(fraction_bits=4)
+        self.rect = Rectangle.from_xyxy(1.5, 2.25, 10.0625, 7)
+        self.rectangles = [self.rect, Rectangle.from_xyxy(-3.5, 0.03, 2, 4.96875)]
+
+    def test_encode_decode(self):
+        encoded = self.format.encode(self.rect)
+        self.assertEqual(encoded, Rectangle.from_xyxy(24, 36, 161, 112))
+        self.assertIsInstance(encoded.left, int)
+        self.assertEqual(self.format.decode(encoded), self.rect)
+        array = self.format.encode(RectangleArray.from_rectangles(self.rectangles))
+        self.assertEqual(array.xyxy.dtype, np.int64)
+        self.assertEqual(
+            array.to_rectangles(), [self.format.encode(r) for r in self.rectangles]
+        )
+        points = PointArray.from_points([Point(0.5, -0.25)])
+        self.assertEqual(self.format.decode(self.format.encode(points)), points)
+
+    def test_divide(self):
+        encoded = self.format.encode(self.rect)
+        divided = self.format.divide(encoded, 3)
+        self.assertEqual(divided, Rectangle.from_xyxy(8, 12, 54, 37))
+        self.assertEqual(
+            self.format.divide(encoded, Point(2, 4)),
+            Rectangle.from_xyxy(12, 9, 80, 28),
+        )
+        array = self.format.encode(RectangleArray.from_rectangles(self.rectangles))
+        self.assertEqual(
+            self.format.divide(array, Point(3, 5)).to_rectangles(),
+            [self.format.divide(rect, Point(3, 5)) for rect in array.to_rectangles()],
+        )
+        with self.assertRaises(ValueError):
+            self.format.divide(encoded, 2.5)
+        with self.assertRaises(ZeroDivisionError):
+            self.format.divide(encoded, 0)
+
+    def test_multiply_and_area(self):
+        encoded = self.format.encode(self.rect)
+        self.assertEqual(
+            self.format.multiply(encoded, 1.5), self.format.encode(self.rect * 1.5)
+        )
+        self.assertEqual(self.format.area(encoded), 137 * 76)
+        self.assertEqual(
+            self.format.decode_area(self.format.area(encoded)), self.rect.area
+        )
+        array = self.format.encode(RectangleArray.from_rectangles(self.rectangles))
+        self.assertEqual(
+            self.format.area(array).tolist(),
+            [self.format.area(rect) for rect in array.to_rectangles()],
+        )
+        self.assertEqual(
+            self.format.multiply(array, 0.5).to_rectangles(),
+            [self.format.multiply(rect, 0.5) for rect in array.to_rectangles()],
+        )
+
+    def test_exact_equality(self):
+        big = RectangleArray(np.array([[2**60, 0, 2**60 + 1, 1]]))
+        other = RectangleArray(np.array([[2**60 + 1, 0, 2**60 + 1, 1]]))
+        self.assertFalse(big == other)
+        with self.assertRaises(ValueError):
+            FixedPointFormat(fraction_bits=40)
+
+    def runTest(self):
+        self.test_encode_decode()
+        self.test_divide()
+        self.test_multiply_and_area()
+        self.test_exact_equality()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(RoundDivideTestCase())
+    suite.addTest(FixedPointFormatTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
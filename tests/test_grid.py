@@ -0,0 +1,111 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+from spatial.grid import UniformGrid
+from spatial_cases import (
+    SpatialIndexQueryCases,
+    SpatialIndexUpdateCases,
+    brute_nearest,
+    brute_window,
+)
+
+
+class UniformGridQueryTestCase(SpatialIndexQueryCases, TestCase):
+    def build_rectangles(self, rectangles):
+        return UniformGrid.from_rectangles(rectangles)
+
+    def build_points(self, points):
+        return UniformGrid.from_points(points)
+
+
+class UniformGridUpdateTestCase(SpatialIndexUpdateCases, TestCase):
+    def build_rectangles(self, rectangles):
+        return UniformGrid.from_rectangles(rectangles, cell_size=25.0)
+
+
+class UniformGridOverflowTestCase(TestCase):
+    def test_oversized_box(self):
+        generator = np.random.default_rng(4)
+        xy = generator.uniform(0, 3000, size=(100, 2))
+        xyxy = np.concatenate(
+            (np.concatenate((xy, xy + 1), axis=1), [[0, 0, 3000, 3000]])
+        )
+        alive = np.ones(len(xyxy), dtype=bool)
+        grid = UniformGrid.from_rectangles(RectangleArray(xyxy))
+        self.assertEqual(grid.cell_size, 1.0)
+        self.assertEqual(grid.overflow, {100})
+        self.assertLessEqual(len(grid.cells), 400)
+        window = Rectangle.from_xyxy(1000, 1000, 1500, 1500)
+        self.assertEqual(
+            grid.query_window(window).tolist(), brute_window(xyxy, alive, window)
+        )
+        for point in (Point(-5, -5), Point(1200, 2400)):
+            self.assertEqual(
+                grid.nearest(point).tolist(), brute_nearest(xyxy, alive, point, 1)
+            )
+        self.assertEqual(grid.insert(Rectangle.from_xyxy(-50, -50, 50, 50)), 101)
+        self.assertEqual(grid.overflow, {100, 101})
+        grid.delete(100)
+        alive[100] = False
+        xyxy = np.concatenate((xyxy, [[-50, -50, 50, 50]]))
+        alive = np.append(alive, True)
+        self.assertEqual(
+            grid.query_point(Point(0, 0)).tolist(),
+            brute_window(xyxy, alive, Rectangle.from_xyxy(0, 0, 0, 0)),
+        )
+        self.assertEqual(grid.nearest(Point(60, 60)).tolist(), [101])
+
+    def test_only_oversized(self):
+        grid = UniformGrid.from_rectangles(
+            [Rectangle.from_xyxy(0, 0, 100, 100)], cell_size=1.0
+        )
+        self.assertEqual(grid.nearest(Point(200, 0)).tolist(), [0])
+        self.assertEqual(grid.query_point(Point(50, 50)).tolist(), [0])
+
+    def runTest(self):
+        self.test_oversized_box()
+        self.test_only_oversized()
+
+
+class UniformGridFarQueryTestCase(TestCase):
+    def test_far_query(self):
+        generator = np.random.default_rng(5)
+        xy = generator.uniform(0, 50, size=(200, 2))
+        xyxy = np.concatenate((xy, xy + 0.5), axis=1)
+        alive = np.ones(len(xyxy), dtype=bool)
+        grid = UniformGrid.from_rectangles(RectangleArray(xyxy), cell_size=1.0)
+        for point in (Point(1e7, -1e7), Point(25, 1e6), Point(-3e5, 20)):
+            for k in (1, 5):
+                self.assertEqual(
+                    grid.nearest(point, k).tolist(),
+                    brute_nearest(xyxy, alive, point, k),
+                )
+
+    def test_sparse_cells(self):
+        xyxy = np.array([[0, 0, 1, 1], [5000, 5000, 5001, 5001], [0, 5000, 1, 5001]])
+        alive = np.ones(len(xyxy), dtype=bool)
+        grid = UniformGrid.from_rectangles(RectangleArray(xyxy), cell_size=1.0)
+        for point in (Point(2500, 2500), Point(10, 10), Point(4990, 5010)):
+            self.assertEqual(
+                grid.nearest(point, 2).tolist(), brute_nearest(xyxy, alive, point, 2)
+            )
+
+    def runTest(self):
+        self.test_far_query()
+        self.test_sparse_cells()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(UniformGridQueryTestCase())
+    suite.addTest(UniformGridUpdateTestCase())
+    suite.addTest(UniformGridOverflowTestCase())
+    suite.addTest(UniformGridFarQueryTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
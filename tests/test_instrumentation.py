@@ -0,0 +1,73 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+from data_types.point import Point
+from data_types.rectangle import FrozenRectangle, Rectangle
+from data_types.instrumentation import Recorder, enable, instrumented, is_enabled
+
+
+class InstrumentationTestCase(TestCase):
+    def test_counts(self):
+        rect = Rectangle.from_xyxy(0, 0, 4, 4)
+        with instrumented() as recorder:
+            moved = rect + Point(1, 1)
+            moved.to_xyxy()
+            moved.as_int()
+            self.assertTrue(moved == rect + 1)
+        snapshot = recorder.snapshot()
+        self.assertEqual(snapshot["Rectangle.__add__"]["count"], 2)
+        self.assertEqual(snapshot["Rectangle.to_xyxy"]["count"], 1)
+        self.assertEqual(snapshot["Rectangle.as_int"]["count"], 1)
+        self.assertEqual(snapshot["Rectangle.__eq__"]["count"], 1)
+        self.assertEqual(snapshot["Point.as_int"]["count"], 2)
+        self.assertEqual(snapshot["Point.__init__"]["count"], 1 + 2 + 2 + 2)
+        self.assertEqual(snapshot["Rectangle.__init__"]["count"], 3)
+        add = snapshot["Rectangle.__add__"]
+        self.assertEqual(sum(add["histogram_ns"].values()), add["count"])
+        self.assertGreater(add["total_ns"], 0)
+
+    def test_frozen(self):
+        with instrumented() as recorder:
+            FrozenRectangle.from_xyxy(0, 0, 1, 1) * 2
+        snapshot = recorder.snapshot()
+        self.assertEqual(snapshot["FrozenRectangle.__mul__"]["count"], 1)
+        self.assertEqual(snapshot["FrozenRectangle.__init__"]["count"], 2)
+
+    def test_disabled_restores_methods(self):
+        add = Point.__add__
+        init = Rectangle.__init__
+        with instrumented():
+            self.assertTrue(is_enabled())
+            self.assertIsNot(Point.__add__, add)
+        self.assertFalse(is_enabled())
+        self.assertIs(Point.__add__, add)
+        self.assertIs(Rectangle.__init__, init)
+        with self.assertRaises(ValueError):
+            with instrumented():
+                Point(1, 2) + "3"
+        self.assertIs(Point.__add__, add)
+
+    def test_nesting_and_reset(self):
+        recorder = Recorder()
+        with instrumented(recorder):
+            with self.assertRaises(RuntimeError):
+                enable(Recorder())
+            Point(1, 2)
+        self.assertEqual(recorder.snapshot()["Point.__init__"]["count"], 1)
+        recorder.reset()
+        self.assertEqual(recorder.snapshot(), {})
+
+    def runTest(self):
+        self.test_counts()
+        self.test_frozen()
+        self.test_disabled_restores_methods()
+        self.test_nesting_and_reset()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(InstrumentationTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
@@ -0,0 +1,129 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+import numpy as np
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+from data_types.rotated_rectangle_array import RotatedRectangleArray
+from ops.iou import (
+    pairwise_intersection_area,
+    pairwise_union_area,
+    pairwise_iou,
+    pairwise_rotated_iou,
+)
+
+
+def random_rectangles(generator, count, integer):
+    xy = generator.uniform(0, 100, size=(count, 2))
+    wh = generator.uniform(-2, 30, size=(count, 2))
+    xyxy = np.concatenate((xy, xy + wh), axis=1)
+    if integer:
+        xyxy = xyxy.astype(np.int64)
+    return RectangleArray(xyxy).to_rectangles()
+
+
+class PairwiseOverlapTestCase(TestCase):
+    def setUp(self) -> None:
+        generator = np.random.default_rng(0)
+        self.first = random_rectangles(generator, 37, integer=False)
+        self.second = random_rectangles(generator, 23, integer=False)
+        self.first_int = random_rectangles(generator, 19, integer=True)
+        self.second_int = random_rectangles(generator, 11, integer=True)
+
+    def assert_matches_scalar(self, function, method, first, second):
+        matrix = function(first, second, max_tile_elements=50)
+        self.assertEqual(matrix.shape, (len(first), len(second)))
+        expected = [[method(a, b) for b in second] for a in first]
+        self.assertEqual(matrix.tolist(), expected)
+
+    def test_intersection_area(self):
+        self.assert_matches_scalar(
+            pairwise_intersection_area,
+            Rectangle.intersection_area,
+            self.first,
+            self.second,
+        )
+        self.assert_matches_scalar(
+            pairwise_intersection_area,
+            Rectangle.intersection_area,
+            self.first_int,
+            self.second_int,
+        )
+
+    def test_union_area(self):
+        self.assert_matches_scalar(
+            pairwise_union_area, Rectangle.union_area, self.first, self.second
+        )
+        self.assert_matches_scalar(
+            pairwise_union_area, Rectangle.union_area, self.first_int, self.second_int
+        )
+
+    def test_iou(self):
+        self.assert_matches_scalar(pairwise_iou, Rectangle.iou, self.first, self.second)
+        self.assert_matches_scalar(
+            pairwise_iou, Rectangle.iou, self.first_int, self.second_int
+        )
+
+    def test_tiling_is_transparent(self):
+        tiled = pairwise_iou(self.first, self.second, max_tile_elements=1)
+        untiled = pairwise_iou(self.first, self.second)
+        self.assertTrue(np.array_equal(tiled, untiled))
+
+    def test_empty(self):
+        self.assertEqual(pairwise_iou([], self.second).shape, (0, len(self.second)))
+        self.assertEqual(pairwise_iou(self.first, []).shape, (len(self.first), 0))
+
+    def runTest(self):
+        self.test_intersection_area()
+        self.test_union_area()
+        self.test_iou()
+        self.test_tiling_is_transparent()
+        self.test_empty()
+
+
+class PairwiseRotatedIouTestCase(TestCase):
+    def setUp(self) -> None:
+        generator = np.random.default_rng(2)
+        self.first = RotatedRectangleArray(
+            np.concatenate(
+                (
+                    generator.uniform(0, 60, size=(17, 2)),
+                    generator.uniform(1, 20, size=(17, 2)),
+                    generator.uniform(-3, 3, size=(17, 1)),
+                ),
+                axis=1,
+            )
+        )
+        self.second = self.first[::2]
+
+    def test_matches_scalar(self):
+        matrix = pairwise_rotated_iou(self.first, self.second, max_tile_elements=40)
+        expected = [
+            [a.iou(b) for b in self.second.to_rotated_rectangles()]
+            for a in self.first.to_rotated_rectangles()
+        ]
+        np.testing.assert_allclose(matrix, expected, atol=1e-9)
+        np.testing.assert_allclose(matrix[::2].diagonal(), 1.0)
+
+    def test_axis_aligned(self):
+        rectangles = RectangleArray(
+            np.array([[0, 0, 3, 5], [1, 2, 6, 4], [9, 9, 10, 10]])
+        )
+        rotated = RotatedRectangleArray.from_rectangles(rectangles)
+        np.testing.assert_allclose(
+            pairwise_rotated_iou(rotated, rotated), pairwise_iou(rectangles, rectangles)
+        )
+
+    def runTest(self):
+        self.test_matches_scalar()
+        self.test_axis_aligned()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(PairwiseOverlapTestCase())
+    suite.addTest(PairwiseRotatedIouTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
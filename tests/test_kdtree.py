@@ -0,0 +1,177 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.point_array import PointArray
+from data_types.rectangle_array import RectangleArray
+from spatial.kdtree import KDTree
+
+
+def brute_query(xy, alive, queries, k):
+    distances = np.hypot(
+        xy[None, :, 0] - queries[:, None, 0], xy[None, :, 1] - queries[:, None, 1]
+    )
+    distances[:, ~alive] = np.inf
+    order = np.argsort(distances, axis=1, kind="stable")[:, :k]
+    return np.take_along_axis(distances, order, axis=1), order
+
+
+def brute_radius(xy, alive, query, radius):
+    distances = np.hypot(xy[:, 0] - query[0], xy[:, 1] - query[1])
+    return np.flatnonzero((distances <= radius) & alive).tolist()
+
+
+class KDTreeQueryTestCase(TestCase):
+    def setUp(self) -> None:
+        generator = np.random.default_rng(0)
+        self.xy = generator.integers(0, 200, size=(3000, 2)).astype(np.float64)
+        self.alive = np.ones(len(self.xy), dtype=bool)
+        self.tree = KDTree(self.xy, leaf_size=8, brute_force_elements=0)
+        self.queries = generator.uniform(-20, 220, size=(200, 2))
+
+    def test_query(self):
+        for k in (1, 7, 40):
+            distances, indices = self.tree.query(PointArray(self.queries), k=k)
+            expected_distances, expected_indices = brute_query(
+                self.xy, self.alive, self.queries, k
+            )
+            self.assertEqual(indices.tolist(), expected_indices.tolist())
+            np.testing.assert_allclose(distances, expected_distances)
+
+    def test_chunked_query(self):
+        whole = self.tree.query(PointArray(self.queries), k=5)
+        chunked = self.tree.query(PointArray(self.queries), k=5, chunk_size=7)
+        self.assertEqual(whole[1].tolist(), chunked[1].tolist())
+
+    def test_radius(self):
+        radii = np.linspace(0, 15, len(self.queries))
+        found = self.tree.query_radius(PointArray(self.queries), radii)
+        self.assertEqual(len(found), len(self.queries))
+        for query, radius, ids in zip(self.queries, radii, found):
+            self.assertEqual(
+                ids.tolist(), brute_radius(self.xy, self.alive, query, radius)
+            )
+        point = Point(100, 100)
+        self.assertEqual(
+            self.tree.within(point, 5).tolist(),
+            brute_radius(self.xy, self.alive, (100, 100), 5),
+        )
+
+    def test_nearest(self):
+        point = Point(50.5, 60.5)
+        expected = brute_query(self.xy, self.alive, np.array([[50.5, 60.5]]), 4)[1]
+        self.assertEqual(self.tree.nearest(point, k=4).tolist(), expected[0].tolist())
+        with self.assertRaises(ValueError):
+            self.tree.nearest((50, 60))
+
+    def test_rectangle_centers(self):
+        boxes = RectangleArray(
+            np.array([[0, 0, 10, 10], [20, 20, 24, 30], [5, 40, 7, 42]])
+        )
+        tree = KDTree.from_rectangles(boxes)
+        self.assertEqual(tree.nearest(Point(22, 26)).tolist(), [1])
+        self.assertEqual(tree.within(Point(5, 5), 0).tolist(), [0])
+
+    def test_brute_force_path(self):
+        tree = KDTree(self.xy, brute_force_elements=len(self.xy) * len(self.queries))
+        queries = PointArray(self.queries)
+        for k in (1, 7, 40):
+            expected = self.tree.query(queries, k=k)
+            distances, indices = tree.query(queries, k=k)
+            self.assertEqual(indices.tolist(), expected[1].tolist())
+            np.testing.assert_allclose(distances, expected[0])
+        radii = np.linspace(0, 15, len(self.queries))
+        for ids, expected in zip(
+            tree.query_radius(queries, radii), self.tree.query_radius(queries, radii)
+        ):
+            self.assertEqual(ids.tolist(), expected.tolist())
+        point = Point(50.5, 60.5)
+        self.assertEqual(
+            tree.nearest(point, k=4).tolist(), self.tree.nearest(point, k=4).tolist()
+        )
+
+    def test_small_trees(self):
+        empty = KDTree.from_points([])
+        distances, indices = empty.query([Point(1, 1)], k=2)
+        self.assertEqual(indices.tolist(), [[-1, -1]])
+        self.assertEqual(distances.tolist(), [[np.inf, np.inf]])
+        self.assertEqual(empty.nearest(Point(1, 1)).tolist(), [])
+        tree = KDTree.from_points([Point(0, 0), Point(3, 4)])
+        distances, indices = tree.query([Point(0, 0)], k=3)
+        self.assertEqual(indices.tolist(), [[0, 1, -1]])
+        self.assertEqual(distances.tolist(), [[0.0, 5.0, np.inf]])
+        with self.assertRaises(ValueError):
+            tree.query([Point(0, 0)], k=0)
+        with self.assertRaises(ValueError):
+            KDTree(np.zeros((3, 2)), leaf_size=0)
+
+    def runTest(self):
+        self.test_query()
+        self.test_chunked_query()
+        self.test_radius()
+        self.test_nearest()
+        self.test_rectangle_centers()
+        self.test_brute_force_path()
+        self.test_small_trees()
+
+
+class KDTreeUpdateTestCase(TestCase):
+    def test_append_and_delete(self):
+        for brute_force_elements in (0, 1 << 30):
+            self.check_append_and_delete(brute_force_elements)
+
+    def check_append_and_delete(self, brute_force_elements):
+        generator = np.random.default_rng(1)
+        xy = generator.uniform(0, 500, size=(500, 2))
+        tree = KDTree(
+            xy, leaf_size=4, buffer_size=32, brute_force_elements=brute_force_elements
+        )
+        alive = np.ones(len(xy), dtype=bool)
+        queries = generator.uniform(0, 500, size=(20, 2))
+        for step in range(40):
+            added = generator.uniform(0, 500, size=(int(generator.integers(0, 30)), 2))
+            entry_ids = tree.extend(PointArray(added))
+            self.assertEqual(
+                entry_ids.tolist(), list(range(len(xy), len(xy) + len(added)))
+            )
+            entry_id = tree.insert(Rectangle.from_xyxy(10, 20, 30, 60))
+            self.assertEqual(entry_id, len(xy) + len(added))
+            xy = np.vstack((xy, added, [[20, 40]]))
+            alive = np.concatenate((alive, np.ones(len(added) + 1, dtype=bool)))
+            for victim in generator.integers(0, len(xy), size=5).tolist():
+                if alive[victim]:
+                    tree.delete(victim)
+                    alive[victim] = False
+            if step % 5 == 0:
+                _, indices = tree.query(PointArray(queries), k=6)
+                self.assertEqual(
+                    indices.tolist(), brute_query(xy, alive, queries, 6)[1].tolist()
+                )
+                self.assertEqual(
+                    tree.within(Point(250, 250), 40).tolist(),
+                    brute_radius(xy, alive, (250, 250), 40),
+                )
+        self.assertEqual(len(tree), int(alive.sum()))
+
+    def test_delete_missing(self):
+        tree = KDTree.from_points([Point(0, 0)])
+        tree.delete(0)
+        with self.assertRaises(KeyError):
+            tree.delete(0)
+        self.assertEqual(tree.nearest(Point(0, 0)).tolist(), [])
+
+    def runTest(self):
+        self.test_append_and_delete()
+        self.test_delete_missing()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(KDTreeQueryTestCase())
+    suite.addTest(KDTreeUpdateTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
@@ -0,0 +1,50 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+import subprocess
+import sys
+import data_types
+import ops
+from data_types.point import Point
+from data_types.rectangle_array import RectangleArray
+from ops.nms import batched_nms
+
+
+class LazyImportTestCase(TestCase):
+    def test_exports(self):
+        self.assertIs(data_types.Point, Point)
+        self.assertIs(data_types.RectangleArray, RectangleArray)
+        self.assertIs(ops.batched_nms, batched_nms)
+        self.assertIs(data_types.point.Point, Point)
+        self.assertIn("RectangleArray", dir(data_types))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            data_types.Ellipse
+
+    def test_numpy_loaded_on_first_use(self):
+        probe = (
+            "import sys, data_types, ops, spatial, serialization; "
+            "from data_types import Point, Rectangle; "
+            "print('numpy' in sys.modules); "
+            "data_types.RectangleArray; "
+            "print('numpy' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+        ).stdout.split()
+        self.assertEqual(output, ["False", "True"])
+
+    def runTest(self):
+        self.test_exports()
+        self.test_unknown_attribute()
+        self.test_numpy_loaded_on_first_use()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(LazyImportTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
@@ -0,0 +1,176 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+from ops.pipeline import RectanglePipeline
+from service.micro_batcher import LocalClient, MicroBatcher
+
+
+class RecordingProcess:
+    def __init__(self, process) -> None:
+        self.process = process
+        self.batch_sizes = []
+
+    def __call__(self, rectangles: RectangleArray):
+        self.batch_sizes.append(len(rectangles))
+        return self.process(rectangles)
+
+
+class MicroBatcherTestCase(TestCase):
+    def setUp(self) -> None:
+        self.pipeline = RectanglePipeline().translate(Point(1, 2)).scale(2).to_xyxy()
+        self.rectangles = [Rectangle.from_xywh(x, 2 * x, 3, 4) for x in range(20)]
+
+    def test_batches_concurrent_requests(self):
+        process = RecordingProcess(self.pipeline.apply)
+
+        async def scenario():
+            async with MicroBatcher(
+                process, max_batch_size=8, max_delay=0.05
+            ) as batcher:
+                client = LocalClient(batcher)
+                results = await client.process_many(self.rectangles)
+                return results, batcher.metrics.snapshot()
+
+        results, metrics = asyncio.run(scenario())
+        expected = [list(row) for row in self.pipeline.run(self.rectangles)]
+        self.assertEqual([row.tolist() for row in results], expected)
+        self.assertEqual(process.batch_sizes, [8, 8, 4])
+        self.assertEqual(metrics["requests"], 20)
+        self.assertEqual(metrics["boxes"], 20)
+        self.assertEqual(metrics["batches"], 3)
+        self.assertEqual(metrics["latency"]["request"]["count"], 20)
+
+    def test_small_batch_requests(self):
+        pipeline = RectanglePipeline().translate(1)
+        process = RecordingProcess(pipeline.apply)
+
+        async def scenario():
+            async with MicroBatcher(process, max_delay=0.05) as batcher:
+                client = LocalClient(batcher)
+                return await client.process_many(
+                    [
+                        self.rectangles[:3],
+                        self.rectangles[0],
+                        RectangleArray.from_rectangles(self.rectangles[3:5]),
+                    ]
+                )
+
+        many, single, array = asyncio.run(scenario())
+        self.assertEqual(many.to_rectangles(), [r + 1 for r in self.rectangles[:3]])
+        self.assertEqual(single, self.rectangles[0] + 1)
+        self.assertEqual(array.to_rectangles(), [r + 1 for r in self.rectangles[3:5]])
+        self.assertEqual(process.batch_sizes, [6])
+
+    def test_deadline_flushes_partial_batch(self):
+        process = RecordingProcess(self.pipeline.apply)
+
+        async def scenario():
+            async with MicroBatcher(
+                process, max_batch_size=64, max_delay=0.001
+            ) as batcher:
+                first = await batcher.submit(self.rectangles[0])
+                second = await batcher.submit(self.rectangles[1])
+                return first, second
+
+        first, second = asyncio.run(scenario())
+        self.assertEqual(process.batch_sizes, [1, 1])
+        self.assertEqual(
+            first.tolist(), list(next(self.pipeline.run(self.rectangles[:1])))
+        )
+
+    def test_backpressure(self):
+        async def scenario():
+            batcher = MicroBatcher(self.pipeline.apply, max_pending=2, max_delay=0.01)
+            await batcher.start()
+            pending = [
+                asyncio.ensure_future(batcher.submit_nowait(rect))
+                for rect in self.rectangles[:4]
+            ]
+            outcomes = await asyncio.gather(*pending, return_exceptions=True)
+            await batcher.stop()
+            return outcomes, batcher.metrics.snapshot()
+
+        outcomes, metrics = asyncio.run(scenario())
+        rejected = [o for o in outcomes if isinstance(o, asyncio.QueueFull)]
+        self.assertEqual(len(rejected), 2)
+        self.assertEqual(metrics["rejected"], 2)
+        self.assertEqual(metrics["requests"], 2)
+
+    def test_runs_process_in_executor(self):
+        threads = []
+
+        def process(rectangles):
+            threads.append(threading.current_thread().name)
+            return self.pipeline.apply(rectangles)
+
+        async def scenario():
+            with ThreadPoolExecutor(1, thread_name_prefix="batch") as executor:
+                async with MicroBatcher(process, executor=executor) as batcher:
+                    return await batcher.submit(self.rectangles[:2])
+
+        result = asyncio.run(scenario())
+        self.assertEqual(len(result), 2)
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("batch"))
+
+    def test_preserves_request_dtype(self):
+        pipeline = RectanglePipeline().translate(1)
+        process = RecordingProcess(pipeline.apply)
+        floats = RectangleArray(np.array([[0.5, 0.5, 2.5, 3.5]]))
+
+        async def scenario():
+            async with MicroBatcher(process, max_delay=0.05) as batcher:
+                client = LocalClient(batcher)
+                return await client.process_many(
+                    [self.rectangles[:2], floats, self.rectangles[2]]
+                )
+
+        ints, float_result, single = asyncio.run(scenario())
+        self.assertEqual(ints.xyxy.dtype, np.int64)
+        self.assertEqual(ints.to_rectangles(), [r + 1 for r in self.rectangles[:2]])
+        self.assertEqual(float_result.xyxy.dtype, np.float64)
+        self.assertEqual(float_result.xyxy.tolist(), [[1.5, 1.5, 3.5, 4.5]])
+        self.assertEqual(single, self.rectangles[2] + 1)
+        self.assertIsInstance(single.left, int)
+        self.assertEqual(sorted(process.batch_sizes), [1, 3])
+
+    def test_errors(self):
+        def failing(rectangles):
+            raise ValueError("bad batch")
+
+        async def scenario():
+            async with MicroBatcher(failing) as batcher:
+                with self.assertRaises(ValueError):
+                    await batcher.submit(self.rectangles[0])
+                self.assertEqual(batcher.metrics.failed, 1)
+            with self.assertRaises(RuntimeError):
+                await batcher.submit(self.rectangles[0])
+
+        asyncio.run(scenario())
+        with self.assertRaises(ValueError):
+            MicroBatcher(failing, max_batch_size=0)
+
+    def runTest(self):
+        self.test_batches_concurrent_requests()
+        self.test_small_batch_requests()
+        self.test_deadline_flushes_partial_batch()
+        self.test_backpressure()
+        self.test_runs_process_in_executor()
+        self.test_preserves_request_dtype()
+        self.test_errors()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(MicroBatcherTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
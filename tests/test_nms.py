@@ -0,0 +1,191 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+import numpy as np
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+from ops.nms import nms, soft_nms, batched_nms
+
+
+def reference_nms(rects, scores, iou_threshold):
+    order = sorted(range(len(rects)), key=lambda index: -scores[index])
+    keep = []
+    for index in order:
+        if all(rects[index].iou(rects[kept]) <= iou_threshold for kept in keep):
+            keep.append(index)
+    return keep
+
+
+def clustered_rectangles(generator, clusters, per_cluster):
+    centers = generator.uniform(0, 500, size=(clusters, 2))
+    sizes = generator.uniform(10, 60, size=(clusters, 2))
+    jitter = generator.normal(0, 4, size=(clusters, per_cluster, 4))
+    xyxy = np.concatenate((centers - sizes / 2, centers + sizes / 2), axis=1)
+    return RectangleArray((xyxy[:, None, :] + jitter).reshape(-1, 4))
+
+
+class NmsTestCase(TestCase):
+    def setUp(self) -> None:
+        generator = np.random.default_rng(1)
+        self.boxes = clustered_rectangles(generator, 12, 15)
+        self.scores = generator.uniform(0, 1, size=len(self.boxes))
+        self.classes = generator.integers(0, 3, size=len(self.boxes))
+        self.rects = self.boxes.to_rectangles()
+
+    def test_matches_reference(self):
+        for threshold in (0.3, 0.5, 0.7):
+            keep = nms(self.boxes, self.scores, threshold)
+            self.assertEqual(
+                keep.tolist(), reference_nms(self.rects, self.scores, threshold)
+            )
+
+    def test_dense_matches_reference(self):
+        generator = np.random.default_rng(4)
+        boxes = clustered_rectangles(generator, 2, 200)
+        scores = generator.uniform(0, 1, size=len(boxes))
+        rects = boxes.to_rectangles()
+        keep = nms(boxes, scores, 0.5)
+        self.assertEqual(keep.tolist(), reference_nms(rects, scores, 0.5))
+
+    def test_integer_matches_reference(self):
+        boxes = self.boxes.as_int()
+        rects = boxes.to_rectangles()
+        keep = nms(boxes, self.scores, 0.4)
+        self.assertEqual(keep.tolist(), reference_nms(rects, self.scores, 0.4))
+
+    def test_accepts_rectangles(self):
+        self.assertEqual(
+            nms(self.rects, self.scores, 0.5).tolist(),
+            nms(self.boxes, self.scores, 0.5).tolist(),
+        )
+
+    def test_max_output(self):
+        keep = nms(self.boxes, self.scores, 0.5, max_output=5)
+        self.assertEqual(keep.tolist(), nms(self.boxes, self.scores, 0.5)[:5].tolist())
+
+    def test_tall_boxes(self):
+        boxes = RectangleArray(
+            np.array([[0, 0, 1, 1e9], [0, 0, 1, 1], [0, 0, 1, 1], [5, 5, 6, 6]])
+        )
+        scores = np.array([0.9, 0.8, 0.7, 0.6])
+        self.assertEqual(nms(boxes, scores, 0.5).tolist(), [0, 1, 3])
+
+        generator = np.random.default_rng(6)
+        tall = self.boxes.xyxy[:20].copy()
+        tall[:, 3] = tall[:, 1] + generator.uniform(2000, 4000, size=len(tall))
+        boxes = RectangleArray(np.concatenate((self.boxes.xyxy, tall, tall + 1)))
+        scores = generator.uniform(0, 1, size=len(boxes))
+        rects = boxes.to_rectangles()
+        for threshold in (0.3, 0.7):
+            keep = nms(boxes, scores, threshold)
+            self.assertEqual(keep.tolist(), reference_nms(rects, scores, threshold))
+
+    def test_empty(self):
+        self.assertEqual(nms([], [], 0.5).tolist(), [])
+
+    def test_score_mismatch(self):
+        with self.assertRaises(ValueError):
+            nms(self.boxes, self.scores[:-1], 0.5)
+
+    def runTest(self):
+        self.test_matches_reference()
+        self.test_dense_matches_reference()
+        self.test_integer_matches_reference()
+        self.test_accepts_rectangles()
+        self.test_max_output()
+        self.test_tall_boxes()
+        self.test_empty()
+        self.test_score_mismatch()
+
+
+class SoftNmsTestCase(TestCase):
+    def setUp(self) -> None:
+        generator = np.random.default_rng(2)
+        self.boxes = clustered_rectangles(generator, 8, 10)
+        self.scores = generator.uniform(0.1, 1, size=len(self.boxes))
+
+    def test_hard_matches_nms(self):
+        keep, _ = soft_nms(
+            self.boxes,
+            self.scores,
+            iou_threshold=0.5,
+            score_threshold=0.0,
+            method="hard",
+        )
+        self.assertEqual(keep.tolist(), nms(self.boxes, self.scores, 0.5).tolist())
+
+    def test_gaussian_decays_overlaps(self):
+        keep, kept_scores = soft_nms(self.boxes, self.scores, score_threshold=0.0)
+        self.assertEqual(sorted(keep.tolist()), list(range(len(self.boxes))))
+        self.assertEqual(keep[0], np.argmax(self.scores))
+        self.assertTrue(np.all(np.diff(kept_scores) <= 0))
+        self.assertTrue(np.all(kept_scores <= self.scores[keep]))
+
+    def test_linear_threshold(self):
+        keep, kept_scores = soft_nms(
+            self.boxes, self.scores, method="linear", score_threshold=0.2
+        )
+        self.assertTrue(np.all(kept_scores > 0.2))
+        self.assertEqual(len(set(keep.tolist())), len(keep))
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            soft_nms(self.boxes, self.scores, method="cubic")
+
+    def runTest(self):
+        self.test_hard_matches_nms()
+        self.test_gaussian_decays_overlaps()
+        self.test_linear_threshold()
+        self.test_unknown_method()
+
+
+class BatchedNmsTestCase(TestCase):
+    def setUp(self) -> None:
+        generator = np.random.default_rng(3)
+        self.boxes = clustered_rectangles(generator, 10, 12)
+        self.scores = generator.uniform(0, 1, size=len(self.boxes))
+        self.classes = generator.integers(0, 4, size=len(self.boxes))
+
+    def test_per_class(self):
+        keep = batched_nms(self.boxes, self.scores, self.classes, 0.5)
+        expected = []
+        for label in np.unique(self.classes):
+            members = np.flatnonzero(self.classes == label)
+            expected.extend(
+                members[nms(self.boxes[members], self.scores[members], 0.5)]
+            )
+        expected.sort(key=lambda index: -self.scores[index])
+        self.assertEqual(keep.tolist(), expected)
+
+    def test_dense_per_class(self):
+        generator = np.random.default_rng(5)
+        boxes = clustered_rectangles(generator, 2, 200)
+        scores = generator.uniform(0, 1, size=len(boxes))
+        classes = generator.integers(0, 2, size=len(boxes))
+        keep = batched_nms(boxes, scores, classes, 0.5)
+        for label in (0, 1):
+            members = np.flatnonzero(classes == label)
+            expected = members[nms(boxes[members], scores[members], 0.5)]
+            self.assertEqual(keep[classes[keep] == label].tolist(), expected.tolist())
+
+    def test_classes_do_not_suppress_each_other(self):
+        box = Rectangle.from_xyxy(0, 0, 10, 10)
+        keep = batched_nms([box, box], [0.9, 0.8], [0, 1], 0.5)
+        self.assertEqual(keep.tolist(), [0, 1])
+        self.assertEqual(nms([box, box], [0.9, 0.8], 0.5).tolist(), [0])
+
+    def runTest(self):
+        self.test_per_class()
+        self.test_dense_per_class()
+        self.test_classes_do_not_suppress_each_other()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(NmsTestCase())
+    suite.addTest(SoftNmsTestCase())
+    suite.addTest(BatchedNmsTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
@@ -0,0 +1,98 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from data_types.rectangle_array import RectangleArray
+from ops.iou import pairwise_iou
+from ops.parallel import parallel_map, parallel_pairwise_iou, parallel_to_xywh
+
+
+def _areas(rows: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    return RectangleArray(rows).area * scale[0]
+
+
+class CountingExecutor(ProcessPoolExecutor):
+    def __init__(self, max_workers: int) -> None:
+        super().__init__(max_workers=max_workers)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+class ParallelMapTestCase(TestCase):
+    def setUp(self) -> None:
+        generator = np.random.default_rng(3)
+        corners = generator.uniform(0, 100, size=(203, 2))
+        sizes = generator.uniform(1, 20, size=(203, 2))
+        self.first = RectangleArray(np.concatenate((corners, corners + sizes), axis=1))
+        self.second = self.first[::7]
+
+    def test_pairwise_iou(self):
+        expected = pairwise_iou(self.first, self.second)
+        self.assertTrue(
+            np.array_equal(
+                parallel_pairwise_iou(self.first, self.second, workers=2), expected
+            )
+        )
+        self.assertTrue(
+            np.array_equal(
+                parallel_pairwise_iou(self.first, self.second, workers=1), expected
+            )
+        )
+
+    def test_supplied_executor(self):
+        expected = pairwise_iou(self.first, self.second)
+        with CountingExecutor(max_workers=2) as executor:
+            for _ in range(2):
+                self.assertTrue(
+                    np.array_equal(
+                        parallel_pairwise_iou(
+                            self.first, self.second, workers=2, executor=executor
+                        ),
+                        expected,
+                    )
+                )
+            submitted = executor.submitted
+            self.assertGreater(submitted, 0)
+            parallel_to_xywh(self.first, workers=2, executor=executor)
+            self.assertGreater(executor.submitted, submitted)
+
+    def test_to_xywh(self):
+        rects = self.first.as_int()
+        xywh = parallel_to_xywh(rects, workers=3)
+        self.assertEqual(xywh.dtype, np.int64)
+        self.assertEqual(
+            xywh.tolist(),
+            [list(rect.to_xywh().values()) for rect in rects.to_rectangles()],
+        )
+
+    def test_map_in_order(self):
+        areas = parallel_map(_areas, self.first.xyxy, np.array([2.0]), workers=2)
+        self.assertTrue(np.array_equal(areas, self.first.area * 2.0))
+
+    def test_edge_cases(self):
+        empty = RectangleArray(np.empty((0, 4)))
+        self.assertEqual(
+            parallel_pairwise_iou(empty, self.second, workers=2).shape, (0, 29)
+        )
+        with self.assertRaises(ValueError):
+            parallel_to_xywh(self.first, workers=0)
+
+    def runTest(self):
+        self.test_pairwise_iou()
+        self.test_supplied_executor()
+        self.test_to_xywh()
+        self.test_map_in_order()
+        self.test_edge_cases()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(ParallelMapTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
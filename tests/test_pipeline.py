@@ -0,0 +1,85 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+import numpy as np
+from data_types.point import Point
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+from ops.pipeline import RectanglePipeline
+
+
+class RectanglePipelineTestCase(TestCase):
+    def setUp(self) -> None:
+        self.rectangles = [
+            Rectangle.from_xyxy(index, index * 0.5, index + 7, index * 1.5 + 3)
+            for index in range(100)
+        ]
+        self.offset = Point(3, -2.5)
+        self.pipeline = (
+            RectanglePipeline()
+            .subtract(self.offset)
+            .scale(1.7)
+            .divide(Point(2, 3))
+            .as_int()
+        )
+        self.expected = [
+            (((rect - self.offset) * 1.7) / Point(2, 3)).as_int()
+            for rect in self.rectangles
+        ]
+
+    def test_run(self):
+        result = self.pipeline.run(self.rectangles)
+        self.assertFalse(isinstance(result, list))
+        self.assertEqual(list(result), self.expected)
+
+    def test_outputs(self):
+        self.assertEqual(
+            list(self.pipeline.to_xyxy().run(self.rectangles)),
+            [tuple(rect.to_xyxy().values()) for rect in self.expected],
+        )
+        self.assertEqual(
+            list(self.pipeline.to_xywh().run(self.rectangles)),
+            [tuple(rect.to_xywh().values()) for rect in self.expected],
+        )
+
+    def test_chunked(self):
+        chunks = list(self.pipeline.run_chunked(iter(self.rectangles), chunk_size=32))
+        self.assertEqual([len(chunk) for chunk in chunks], [32, 32, 32, 4])
+        self.assertEqual(chunks[0].xyxy.dtype, np.int64)
+        self.assertEqual(
+            [rect for chunk in chunks for rect in chunk.to_rectangles()], self.expected
+        )
+        array = RectangleArray.from_rectangles(self.rectangles)
+        (xywh,) = self.pipeline.to_xywh().run_chunked(array)
+        self.assertEqual(
+            xywh.tolist(), [list(rect.to_xywh().values()) for rect in self.expected]
+        )
+
+    def test_float_stages(self):
+        pipeline = RectanglePipeline().translate(0.1).as_float().divide(3)
+        array = RectangleArray.from_rectangles(self.rectangles)
+        self.assertEqual(
+            pipeline.apply(array).to_rectangles(), list(pipeline.run(self.rectangles))
+        )
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            RectanglePipeline().scale("2")
+        with self.assertRaises(ValueError):
+            RectanglePipeline(output="cxcywh")
+
+    def runTest(self):
+        self.test_run()
+        self.test_outputs()
+        self.test_chunked()
+        self.test_float_stages()
+        self.test_invalid()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(RectanglePipelineTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
@@ -1,5 +1,7 @@
+from copy import copy, deepcopy
+from pickle import dumps, loads
 from unittest import TextTestRunner, TestCase, TestSuite
-from data_types.point import Point
+from data_types.point import FrozenPoint, Point
 
 
 class PointInitializationTestCase(TestCase):
@@ -35,11 +37,18 @@ class PointInitializationTestCase(TestCase):
         self.assertEqual(point.x, x)
         self.assertEqual(point.y, y)
 
+    def test_slots(self):
+        point = Point(1, 2)
+        self.assertFalse(hasattr(point, "__dict__"))
+        with self.assertRaises(AttributeError):
+            point.z = 3
+
     def runTest(self):
         self.test_int_initialization()
         self.test_float_initialization()
         self.test_from_xy()
         self.test_from_yx()
+        self.test_slots()
 
 
 class PointExportingTestCase(TestCase):
@@ -128,11 +137,43 @@ class PointOpsTestCase(TestCase):
         self.test_eq()
 
 
+class FrozenPointTestCase(TestCase):
+    def test_immutable(self):
+        point = Point(1, 2).freeze()
+        self.assertIsInstance(point, FrozenPoint)
+        self.assertEqual(point, Point(1, 2))
+        with self.assertRaises(AttributeError):
+            point.x = 3
+        with self.assertRaises(AttributeError):
+            del point.y
+        self.assertIs(point.freeze(), point)
+
+    def test_thaw(self):
+        point = FrozenPoint(1.5, 2).thaw()
+        self.assertNotIsInstance(point, FrozenPoint)
+        point.x = 3
+        self.assertEqual(point, Point(3, 2))
+
+    def test_round_trips(self):
+        point = FrozenPoint(1.5, 2)
+        for restored in (loads(dumps(point)), copy(point), deepcopy(point)):
+            self.assertIsInstance(restored, FrozenPoint)
+            self.assertEqual(restored, point)
+            with self.assertRaises(AttributeError):
+                restored.x = 0
+
+    def runTest(self):
+        self.test_immutable()
+        self.test_thaw()
+        self.test_round_trips()
+
+
 def suite():
     suite = TestSuite()
     suite.addTest(PointInitializationTestCase())
     suite.addTest(PointExportingTestCase())
     suite.addTest(PointOpsTestCase())
+    suite.addTest(FrozenPointTestCase())
     return suite
 
 
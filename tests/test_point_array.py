@@ -0,0 +1,169 @@
+from typing import OrderedDict
+from unittest import TextTestRunner, TestCase, TestSuite
+import numpy as np
+from data_types.point import Point
+from data_types.point_array import PointArray
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+
+
+class PointArrayInitializationTestCase(TestCase):
+    def setUp(self) -> None:
+        self.points = [Point(1, 2), Point(3, 4), Point(5, 6)]
+
+    def test_from_points(self):
+        array = PointArray.from_points(self.points)
+        self.assertEqual(array.xy.shape, (3, 2))
+        self.assertEqual(array.xy.dtype, np.int64)
+        self.assertTrue(array.xy.flags["C_CONTIGUOUS"])
+        self.assertEqual(array.to_points(), self.points)
+
+    def test_float_round_trip(self):
+        points = [Point(0.5, 1.5), Point(2.25, 3.0)]
+        array = PointArray.from_points(points)
+        self.assertEqual(array.xy.dtype, np.float64)
+        self.assertEqual(array.to_points(), points)
+
+    def test_from_xy(self):
+        array = PointArray.from_xy(np.array([1, 3, 5]), np.array([2, 4, 6]))
+        self.assertEqual(array.to_points(), self.points)
+
+    def test_from_yx(self):
+        array = PointArray.from_yx(np.array([2, 4, 6]), np.array([1, 3, 5]))
+        self.assertEqual(array.to_points(), self.points)
+
+    def test_empty(self):
+        array = PointArray.from_points([])
+        self.assertEqual(array.xy.shape, (0, 2))
+
+    def runTest(self):
+        self.test_from_points()
+        self.test_float_round_trip()
+        self.test_from_xy()
+        self.test_from_yx()
+        self.test_empty()
+
+
+class PointArrayExportingTestCase(TestCase):
+    def setUp(self) -> None:
+        self.points = [Point(1.5, 2), Point(3, 4.25)]
+        self.array = PointArray.from_points(self.points)
+
+    def test_to_xy(self):
+        xy = self.array.to_xy()
+        self.assertIsInstance(xy, OrderedDict)
+        self.assertEqual(list(xy.keys()), ["x", "y"])
+        self.assertEqual(xy["x"].tolist(), [p.x for p in self.points])
+
+    def test_to_yx(self):
+        yx = self.array.to_yx()
+        self.assertEqual(list(yx.keys()), ["y", "x"])
+        self.assertEqual(yx["y"].tolist(), [p.y for p in self.points])
+
+    def test_as_int(self):
+        self.assertEqual(
+            self.array.as_int().to_points(), [p.as_int() for p in self.points]
+        )
+        self.assertEqual(self.array.as_int().xy.dtype, np.int64)
+
+    def test_as_float(self):
+        self.assertEqual(self.array.as_int().as_float().xy.dtype, np.float64)
+
+    def test_views(self):
+        sliced = self.array[1:]
+        self.assertTrue(np.shares_memory(sliced.xy, self.array.xy))
+        self.assertTrue(np.shares_memory(self.array.x, self.array.xy))
+        self.assertEqual(self.array[0], self.points[0])
+
+    def test_rectangle_corners(self):
+        rects = RectangleArray.from_rectangles([Rectangle.from_xyxy(1, 2, 3, 4)])
+        self.assertEqual(rects.top_left.to_points(), [Point(1, 2)])
+        self.assertEqual(rects.bottom_right.to_points(), [Point(3, 4)])
+        self.assertTrue(np.shares_memory(rects.top_left.xy, rects.xyxy))
+
+    def runTest(self):
+        self.test_to_xy()
+        self.test_to_yx()
+        self.test_as_int()
+        self.test_as_float()
+        self.test_views()
+        self.test_rectangle_corners()
+
+
+class PointArrayOpsTestCase(TestCase):
+    def setUp(self) -> None:
+        self.points = [Point(1, 2), Point(3, 4), Point(5.5, 6)]
+        self.others = [Point(7, 8), Point(2, 1), Point(4, 0.5)]
+        self.array = PointArray.from_points(self.points)
+        self.other_array = PointArray.from_points(self.others)
+        self.point = Point(7, 8)
+
+    def test_add(self):
+        self.assertEqual((self.array + 4).to_points(), [p + 4 for p in self.points])
+        self.assertEqual(
+            (self.array + self.point).to_points(), [p + self.point for p in self.points]
+        )
+        self.assertEqual(
+            (self.array + self.other_array).to_points(),
+            [p + o for p, o in zip(self.points, self.others)],
+        )
+
+    def test_sub(self):
+        self.assertEqual((self.array - 4).to_points(), [p - 4 for p in self.points])
+        self.assertEqual(
+            (self.array - self.other_array).to_points(),
+            [p - o for p, o in zip(self.points, self.others)],
+        )
+
+    def test_mul(self):
+        self.assertEqual((self.array * 4).to_points(), [p * 4 for p in self.points])
+        self.assertEqual(
+            (self.array * self.point).to_points(), [p * self.point for p in self.points]
+        )
+
+    def test_div(self):
+        self.assertEqual((self.array / 4).to_points(), [p / 4 for p in self.points])
+        self.assertEqual(
+            (self.array / self.other_array).to_points(),
+            [p / o for p, o in zip(self.points, self.others)],
+        )
+
+    def test_relative_to(self):
+        self.assertEqual(
+            self.array.relative_to(self.point).to_points(),
+            [p.relative_to(self.point) for p in self.points],
+        )
+
+    def test_rectangle_offsets(self):
+        rects = [Rectangle.from_xyxy(0, 0, 2, 2), Rectangle.from_xyxy(1, 1, 3, 3)]
+        offsets = PointArray.from_points(self.points[:2])
+        moved = RectangleArray.from_rectangles(rects) + offsets
+        self.assertEqual(
+            moved.to_rectangles(), [r + p for r, p in zip(rects, self.points)]
+        )
+
+    def test_bad_operand(self):
+        with self.assertRaises(ValueError):
+            self.array * "4"
+
+    def runTest(self):
+        self.test_add()
+        self.test_sub()
+        self.test_mul()
+        self.test_div()
+        self.test_relative_to()
+        self.test_rectangle_offsets()
+        self.test_bad_operand()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(PointArrayInitializationTestCase())
+    suite.addTest(PointArrayExportingTestCase())
+    suite.addTest(PointArrayOpsTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
@@ -0,0 +1,165 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+import numpy as np
+from data_types.point import Point
+from data_types.point_array import PointArray
+from data_types.polygon import Polygon
+from data_types.polygon_array import PolygonArray
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+
+
+class PolygonTestCase(TestCase):
+    def setUp(self) -> None:
+        self.square = Polygon.from_xy([(0, 0), (4, 0), (4, 4), (0, 4)])
+        self.triangle = Polygon.from_xy([(0, 0), (4, 0), (0, 4)])
+        self.concave = Polygon.from_xy([(0, 0), (6, 0), (6, 6), (3, 2), (0, 6)])
+
+    def test_area(self):
+        self.assertEqual(self.square.area, 16)
+        self.assertEqual(self.triangle.signed_area, 8)
+        self.assertEqual(Polygon(self.triangle.points[::-1]).signed_area, -8)
+        self.assertEqual(self.concave.area, 24)
+        self.assertEqual(Polygon.from_xy([(0, 0), (1, 1)]).area, 0)
+
+    def test_rectangle_conversions(self):
+        rect = Rectangle.from_xyxy(1, 2, 5, 7)
+        polygon = Polygon.from_rectangle(rect)
+        self.assertEqual(polygon.area, rect.area)
+        self.assertEqual(polygon.bounding_rectangle(), rect)
+        self.assertEqual(
+            self.concave.bounding_rectangle(), Rectangle.from_xyxy(0, 0, 6, 6)
+        )
+        with self.assertRaises(ValueError):
+            Polygon([]).bounding_rectangle()
+
+    def test_contains(self):
+        self.assertTrue(self.square.contains(Point(2, 2)))
+        self.assertTrue(self.square.contains(Point(4, 2)))
+        self.assertTrue(self.square.contains(Point(0, 0)))
+        self.assertFalse(self.square.contains(Point(5, 2)))
+        self.assertTrue(self.concave.contains(Point(1, 4)))
+        self.assertFalse(self.concave.contains(Point(3, 4)))
+        with self.assertRaises(ValueError):
+            self.square.contains((1, 1))
+
+    def test_intersection(self):
+        shifted = Polygon.from_xy([(2, 2), (6, 2), (6, 6), (2, 6)])
+        self.assertEqual(self.square.intersection(shifted).area, 4)
+        self.assertAlmostEqual(self.square.iou(shifted), 4 / 28)
+        self.assertEqual(self.square.intersection(self.triangle).area, 8)
+        self.assertEqual(
+            self.square.intersection(Polygon(shifted.points[::-1])).area, 4
+        )
+        far = Polygon.from_xy([(10, 10), (11, 10), (11, 11)])
+        self.assertEqual(self.square.intersection(far).area, 0)
+        self.assertEqual(self.square.iou(far), 0.0)
+        a = Rectangle.from_xyxy(0, 0, 3, 5)
+        b = Rectangle.from_xyxy(1, 2, 6, 4)
+        self.assertAlmostEqual(
+            Polygon.from_rectangle(a).iou(Polygon.from_rectangle(b)), a.iou(b)
+        )
+
+    def test_concave_intersection(self):
+        shape = Polygon.from_xy([(0, 0), (4, 0), (4, 1), (1, 1), (1, 4), (0, 4)])
+        square = Polygon.from_xy([(0, 0), (2, 0), (2, 2), (0, 2)])
+        self.assertFalse(shape.is_convex)
+        self.assertTrue(square.is_convex)
+        self.assertEqual(sum(triangle.area for triangle in shape.triangles()), 7)
+        self.assertAlmostEqual(shape.iou(shape), 1.0)
+        self.assertAlmostEqual(shape.iou(Polygon(shape.points[::-1])), 1.0)
+        self.assertEqual(square.iou(shape), 3 / 8)
+        self.assertEqual(shape.iou(square), 3 / 8)
+        self.assertEqual(square.intersection(shape).area, 3)
+        self.assertEqual(shape.intersection(square).area, 3)
+        shifted = Polygon([point + Point(1, 1) for point in shape])
+        self.assertEqual(shape.intersection_area(shifted), 0)
+        shifted = Polygon([point + Point(0.5, 0.5) for point in shape])
+        self.assertEqual(shape.intersection_area(shifted), 3.25)
+        self.assertEqual(shifted.intersection_area(shape), 3.25)
+        self.assertEqual(self.concave.intersection_area(shape), 7)
+        with self.assertRaises(ValueError):
+            shape.intersection(shifted)
+
+    def test_equality(self):
+        self.assertEqual(self.square, Polygon.from_xy([(0, 0), (4, 0), (4, 4), (0, 4)]))
+        self.assertNotEqual(self.square, self.triangle)
+        self.assertEqual(len({self.square, Polygon(list(self.square))}), 1)
+        self.assertEqual(len(self.square), 4)
+
+    def runTest(self):
+        self.test_area()
+        self.test_rectangle_conversions()
+        self.test_contains()
+        self.test_intersection()
+        self.test_concave_intersection()
+        self.test_equality()
+
+
+class PolygonArrayTestCase(TestCase):
+    def setUp(self) -> None:
+        self.polygons = [
+            Polygon.from_xy([(0, 0), (4, 0), (4, 4), (0, 4)]),
+            Polygon.from_xy([(0, 0), (6, 0), (6, 6), (3, 2), (0, 6)]),
+            Polygon.from_xy([(1.5, 0), (3, 3), (0, 3)]),
+        ]
+        self.array = PolygonArray.from_polygons(self.polygons)
+
+    def test_round_trip(self):
+        self.assertEqual(self.array.to_polygons(), self.polygons)
+        self.assertEqual(self.array.counts.tolist(), [4, 5, 3])
+        self.assertEqual(self.array[1], self.polygons[1])
+        self.assertEqual(self.array[-1], self.polygons[-1])
+        self.assertEqual(
+            self.array[[2, 0]].to_polygons(), [self.polygons[2], self.polygons[0]]
+        )
+        self.assertEqual(self.array[1:], PolygonArray.from_polygons(self.polygons[1:]))
+        with self.assertRaises(ValueError):
+            PolygonArray([(0, 0), (1, 1)], [0, 2])
+        with self.assertRaises(ValueError):
+            PolygonArray([(0, 0), (1, 1), (1, 0)], [0, 2])
+
+    def test_area_and_bounds(self):
+        self.assertEqual(
+            self.array.area.tolist(), [polygon.area for polygon in self.polygons]
+        )
+        self.assertEqual(
+            self.array.bounding_rectangles().to_rectangles(),
+            [polygon.bounding_rectangle() for polygon in self.polygons],
+        )
+        rectangles = RectangleArray(np.array([[0, 0, 2, 3], [1, 1, 4, 5]]))
+        from_rectangles = PolygonArray.from_rectangles(rectangles)
+        self.assertEqual(from_rectangles.area.tolist(), rectangles.area.tolist())
+        self.assertEqual(from_rectangles.bounding_rectangles(), rectangles)
+
+    def test_contains(self):
+        points = [Point(4, 2), Point(3, 4), Point(1.5, 2)]
+        self.assertEqual(
+            self.array.contains(PointArray.from_points(points)).tolist(),
+            [polygon.contains(point) for polygon, point in zip(self.polygons, points)],
+        )
+        generator = np.random.default_rng(0)
+        for x, y in generator.uniform(-1, 7, size=(50, 2)).tolist():
+            point = Point(x, y)
+            self.assertEqual(
+                self.array.contains(point).tolist(),
+                [polygon.contains(point) for polygon in self.polygons],
+            )
+        with self.assertRaises(ValueError):
+            self.array.contains(PointArray.from_points(points[:2]))
+
+    def runTest(self):
+        self.test_round_trip()
+        self.test_area_and_bounds()
+        self.test_contains()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(PolygonTestCase())
+    suite.addTest(PolygonArrayTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
@@ -1,7 +1,9 @@
+from copy import copy, deepcopy
+from pickle import dumps, loads
 from typing import OrderedDict
 from unittest import TextTestRunner, TestCase, TestSuite
-from data_types.geometry.point import Point
-from data_types.geometry.rectangle import Rectangle
+from data_types.point import FrozenPoint, Point
+from data_types.rectangle import FrozenRectangle, Rectangle
 
 
 class RectanglePropertiesTestCase(TestCase):
@@ -89,12 +91,19 @@ class RectangleInitializationTestCase(TestCase):
         self.assertEqual(rect.bottom_right.x, x2)
         self.assertEqual(rect.bottom_right.y, y2)
 
+    def test_slots(self):
+        rect = Rectangle.from_xyxy(1, 2, 3, 4)
+        self.assertFalse(hasattr(rect, "__dict__"))
+        with self.assertRaises(AttributeError):
+            rect.label = "box"
+
     def runTest(self):
         self.test_int_initialization()
         self.test_float_initialization()
         self.test_from_corners()
         self.test_from_xywh()
         self.test_from_xyxy()
+        self.test_slots()
 
 
 class RectangleExportingTestCase(TestCase):
@@ -266,12 +275,179 @@ class RectangleOpsTestCase(TestCase):
         self.test_eq()
 
 
+class RectangleOverlapTestCase(TestCase):
+    def setUp(self) -> None:
+        self.rect1 = Rectangle.from_xyxy(0, 0, 4, 4)
+        self.rect2 = Rectangle.from_xyxy(2, 2, 6, 6)
+        self.rect3 = Rectangle.from_xyxy(10, 10, 12, 12)
+
+    def test_intersection_area(self):
+        self.assertEqual(self.rect1.intersection_area(self.rect2), 4)
+        self.assertEqual(self.rect1.intersection_area(self.rect3), 0)
+
+    def test_union_area(self):
+        self.assertEqual(self.rect1.union_area(self.rect2), 28)
+        self.assertEqual(self.rect1.union_area(self.rect3), 20)
+
+    def test_iou(self):
+        self.assertEqual(self.rect1.iou(self.rect2), 4 / 28)
+        self.assertEqual(self.rect1.iou(self.rect1), 1.0)
+        self.assertEqual(self.rect1.iou(self.rect3), 0.0)
+
+    def test_iou_degenerate(self):
+        empty = Rectangle.from_xyxy(1, 1, 1, 1)
+        self.assertEqual(empty.iou(empty), 0.0)
+
+    def runTest(self):
+        self.test_intersection_area()
+        self.test_union_area()
+        self.test_iou()
+        self.test_iou_degenerate()
+
+
+class RectangleClippingTestCase(TestCase):
+    def setUp(self) -> None:
+        self.rect = Rectangle.from_xyxy(0, 0, 4, 4)
+        self.inside = Rectangle.from_xyxy(1, 1, 2, 3)
+        self.crossing = Rectangle.from_xyxy(2, -1, 6, 3)
+        self.touching = Rectangle.from_xyxy(4, 1, 5, 2)
+        self.outside = Rectangle.from_xyxy(10, 10, 12, 12)
+
+    def test_intersection(self):
+        self.assertEqual(
+            self.rect.intersection(self.crossing), Rectangle.from_xyxy(2, 0, 4, 3)
+        )
+        self.assertEqual(self.rect.intersection(self.inside), self.inside)
+        touching = self.rect.intersection(self.touching)
+        self.assertEqual(touching, Rectangle.from_xyxy(4, 1, 4, 2))
+        self.assertFalse(touching.is_empty)
+        self.assertTrue(self.rect.intersection(self.outside).is_empty)
+        with self.assertRaises(ValueError):
+            self.rect.intersection(Point(1, 1))
+
+    def test_union_bounds(self):
+        self.assertEqual(
+            self.rect.union_bounds(self.outside), Rectangle.from_xyxy(0, 0, 12, 12)
+        )
+        empty = self.rect.intersection(self.outside)
+        self.assertEqual(empty.union_bounds(self.inside), self.inside)
+        self.assertEqual(self.inside.union_bounds(empty), self.inside)
+
+    def test_clip_to(self):
+        self.assertEqual(
+            self.crossing.clip_to(self.rect), Rectangle.from_xyxy(2, 0, 4, 3)
+        )
+        self.assertTrue(self.outside.clip_to(self.rect).is_empty)
+
+    def test_contains(self):
+        self.assertTrue(self.rect.contains(Point(4, 0)))
+        self.assertFalse(self.rect.contains(Point(4.5, 0)))
+        self.assertTrue(self.rect.contains(self.inside))
+        self.assertTrue(self.rect.contains(self.rect))
+        self.assertFalse(self.rect.contains(self.crossing))
+        empty = self.rect.intersection(self.outside)
+        self.assertFalse(self.rect.contains(Rectangle.from_xyxy(3, 3, 2, 2)))
+        self.assertFalse(empty.contains(Point(11, 11)))
+        with self.assertRaises(ValueError):
+            self.rect.contains(1)
+
+    def runTest(self):
+        self.test_intersection()
+        self.test_union_bounds()
+        self.test_clip_to()
+        self.test_contains()
+
+
+class FrozenRectangleTestCase(TestCase):
+    def setUp(self) -> None:
+        self.rect = Rectangle.from_xyxy(1, 2, 5, 8)
+        self.frozen = self.rect.freeze()
+
+    def test_cached_properties(self):
+        self.assertIsInstance(self.frozen, FrozenRectangle)
+        self.assertEqual(self.frozen, self.rect)
+        self.assertEqual(
+            (self.frozen.left, self.frozen.top, self.frozen.right, self.frozen.bottom),
+            (1, 2, 5, 8),
+        )
+        self.assertEqual((self.frozen.width, self.frozen.height), (4, 6))
+        self.assertEqual(self.frozen.area, self.rect.area)
+        self.assertEqual(self.frozen.center, Point(3, 5))
+        self.assertEqual(self.rect.center, Point(3, 5))
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.frozen.top_left = Point(0, 0)
+        with self.assertRaises(AttributeError):
+            self.frozen.area = 0
+        with self.assertRaises(AttributeError):
+            self.frozen.bottom_right.x = 0
+        corner = Point(0, 0)
+        frozen = FrozenRectangle(corner, Point(2, 2))
+        corner.x = 1
+        self.assertEqual(frozen.left, 0)
+        self.assertEqual(frozen.width, 2)
+
+    def test_constructors(self):
+        self.assertIsInstance(FrozenRectangle.from_xyxy(1, 2, 5, 8), FrozenRectangle)
+        self.assertEqual(FrozenRectangle.from_xyxy(1, 2, 5, 8), self.rect)
+        self.assertEqual(FrozenRectangle.from_xywh(1, 2, 4, 6), self.rect)
+        self.assertIsInstance(
+            FrozenRectangle.from_corners(Point(1, 2), Point(5, 8)), FrozenRectangle
+        )
+
+    def test_ops_stay_frozen(self):
+        for result in (
+            self.frozen + 1,
+            self.frozen - Point(1, 1),
+            self.frozen * 2,
+            self.frozen / 2,
+            self.frozen.as_float(),
+            self.frozen.as_int(),
+        ):
+            self.assertIsInstance(result, FrozenRectangle)
+        self.assertEqual(self.frozen * 2, self.rect * 2)
+        self.assertEqual((self.frozen / 2).area, (self.rect / 2).area)
+
+    def test_thaw(self):
+        rect = self.frozen.thaw()
+        self.assertNotIsInstance(rect, FrozenRectangle)
+        rect.top_left.x = 0
+        self.assertEqual(rect.width, 5)
+        self.assertEqual(self.frozen.width, 4)
+
+    def test_round_trips(self):
+        for restored in (
+            loads(dumps(self.frozen)),
+            copy(self.frozen),
+            deepcopy(self.frozen),
+        ):
+            self.assertIsInstance(restored, FrozenRectangle)
+            self.assertIsInstance(restored.top_left, FrozenPoint)
+            self.assertEqual(restored, self.frozen)
+            self.assertEqual(restored.area, self.frozen.area)
+            self.assertEqual(restored.center, self.frozen.center)
+            with self.assertRaises(AttributeError):
+                restored.area = 0
+
+    def runTest(self):
+        self.test_cached_properties()
+        self.test_immutable()
+        self.test_constructors()
+        self.test_ops_stay_frozen()
+        self.test_thaw()
+        self.test_round_trips()
+
+
 def suite():
     suite = TestSuite()
     suite.addTest(RectangleInitializationTestCase())
     suite.addTest(RectanglePropertiesTestCase())
     suite.addTest(RectangleExportingTestCase())
     suite.addTest(RectangleOpsTestCase())
+    suite.addTest(RectangleOverlapTestCase())
+    suite.addTest(RectangleClippingTestCase())
+    suite.addTest(FrozenRectangleTestCase())
     return suite
 
 
@@ -0,0 +1,308 @@
+from typing import OrderedDict
+from unittest import TextTestRunner, TestCase, TestSuite
+import numpy as np
+from data_types.point import Point
+from data_types.point_array import PointArray
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+
+
+class RectangleArrayInitializationTestCase(TestCase):
+    def setUp(self) -> None:
+        self.rects = [
+            Rectangle.from_xyxy(1, 2, 3, 4),
+            Rectangle.from_xyxy(5, 6, 9, 12),
+            Rectangle.from_xywh(0, 0, 10, 20),
+        ]
+
+    def test_from_rectangles(self):
+        array = RectangleArray.from_rectangles(self.rects)
+        self.assertEqual(array.xyxy.shape, (3, 4))
+        self.assertEqual(array.xyxy.dtype, np.int64)
+        self.assertEqual(array.to_rectangles(), self.rects)
+
+    def test_float_round_trip(self):
+        rects = [Rectangle.from_xyxy(0.5, 1.25, 3.75, 4.0)]
+        array = RectangleArray.from_rectangles(rects)
+        self.assertEqual(array.xyxy.dtype, np.float64)
+        back = array.to_rectangles()
+        self.assertEqual(back, rects)
+        self.assertIsInstance(back[0].top_left.x, float)
+
+    def test_int_round_trip_types(self):
+        back = RectangleArray.from_rectangles(self.rects).to_rectangles()
+        self.assertIsInstance(back[0].top_left.x, int)
+        self.assertIsInstance(back[0].bottom_right.y, int)
+
+    def test_empty(self):
+        array = RectangleArray.from_rectangles([])
+        self.assertEqual(len(array), 0)
+        self.assertEqual(array.xyxy.shape, (0, 4))
+        self.assertEqual(array.to_rectangles(), [])
+
+    def test_from_xyxy(self):
+        array = RectangleArray.from_xyxy(
+            np.array([1, 5]), np.array([2, 6]), np.array([3, 9]), np.array([4, 12])
+        )
+        self.assertEqual(array.to_rectangles(), self.rects[:2])
+
+    def test_from_xywh(self):
+        array = RectangleArray.from_xywh(
+            np.array([1, 0]), np.array([2, 0]), np.array([2, 10]), np.array([2, 20])
+        )
+        self.assertEqual(array.to_rectangles(), [self.rects[0], self.rects[2]])
+
+    def test_bad_shape(self):
+        with self.assertRaises(ValueError):
+            RectangleArray(np.zeros((3, 3)))
+
+    def runTest(self):
+        self.test_from_rectangles()
+        self.test_float_round_trip()
+        self.test_int_round_trip_types()
+        self.test_empty()
+        self.test_from_xyxy()
+        self.test_from_xywh()
+        self.test_bad_shape()
+
+
+class RectangleArrayPropertiesTestCase(TestCase):
+    def setUp(self) -> None:
+        self.rects = [
+            Rectangle.from_xyxy(1, 2, 3, 4),
+            Rectangle.from_xyxy(5.5, 6, 9, 12.25),
+            Rectangle.from_xywh(0, 0, 10, 20),
+        ]
+        self.array = RectangleArray.from_rectangles(self.rects)
+
+    def test_width(self):
+        self.assertEqual(self.array.width.tolist(), [r.width for r in self.rects])
+
+    def test_height(self):
+        self.assertEqual(self.array.height.tolist(), [r.height for r in self.rects])
+
+    def test_area(self):
+        self.assertEqual(self.array.area.tolist(), [r.area for r in self.rects])
+
+    def test_sides(self):
+        self.assertEqual(self.array.top.tolist(), [r.top for r in self.rects])
+        self.assertEqual(self.array.bottom.tolist(), [r.bottom for r in self.rects])
+        self.assertEqual(self.array.left.tolist(), [r.left for r in self.rects])
+        self.assertEqual(self.array.right.tolist(), [r.right for r in self.rects])
+
+    def runTest(self):
+        self.test_width()
+        self.test_height()
+        self.test_area()
+        self.test_sides()
+
+
+class RectangleArrayExportingTestCase(TestCase):
+    def setUp(self) -> None:
+        self.rects = [
+            Rectangle.from_xyxy(1.0, 2.0, 3, 4),
+            Rectangle.from_xyxy(5.7, 6.2, 9.9, 12.5),
+        ]
+        self.array = RectangleArray.from_rectangles(self.rects)
+
+    def test_to_xyxy(self):
+        xyxy = self.array.to_xyxy()
+        self.assertIsInstance(xyxy, OrderedDict)
+        self.assertEqual(list(xyxy.keys()), ["x1", "y1", "x2", "y2"])
+        for index, rect in enumerate(self.rects):
+            expected = rect.to_xyxy()
+            for key in expected:
+                self.assertEqual(xyxy[key][index], expected[key])
+
+    def test_to_xywh(self):
+        xywh = self.array.to_xywh()
+        self.assertIsInstance(xywh, OrderedDict)
+        self.assertEqual(list(xywh.keys()), ["x", "y", "w", "h"])
+        for index, rect in enumerate(self.rects):
+            expected = rect.to_xywh()
+            for key in expected:
+                self.assertEqual(xywh[key][index], expected[key])
+
+    def test_as_int(self):
+        int_array = self.array.as_int()
+        self.assertEqual(int_array.xyxy.dtype, np.int64)
+        self.assertEqual(
+            int_array.to_rectangles(), [rect.as_int() for rect in self.rects]
+        )
+
+    def test_as_float(self):
+        float_array = self.array.as_int().as_float()
+        self.assertEqual(float_array.xyxy.dtype, np.float64)
+        self.assertEqual(
+            float_array.to_rectangles(),
+            [rect.as_int().as_float() for rect in self.rects],
+        )
+
+    def test_getitem(self):
+        self.assertEqual(self.array[1], self.rects[1])
+        sliced = self.array[1:]
+        self.assertIsInstance(sliced, RectangleArray)
+        self.assertTrue(np.shares_memory(sliced.xyxy, self.array.xyxy))
+
+    def runTest(self):
+        self.test_to_xyxy()
+        self.test_to_xywh()
+        self.test_as_int()
+        self.test_as_float()
+        self.test_getitem()
+
+
+class RectangleArrayOpsTestCase(TestCase):
+    def setUp(self) -> None:
+        self.rects = [
+            Rectangle.from_xyxy(1, 2, 5, 6),
+            Rectangle.from_xyxy(3, 4, 7, 8),
+            Rectangle.from_xyxy(0.5, 1.5, 2.5, 3.5),
+        ]
+        self.array = RectangleArray.from_rectangles(self.rects)
+        self.point = Point(7, 8)
+
+    def assert_matches_scalar(self, batch, scalar):
+        self.assertEqual(batch.to_rectangles(), scalar)
+
+    def test_add(self):
+        self.assert_matches_scalar(self.array + 4, [r + 4 for r in self.rects])
+        self.assert_matches_scalar(
+            self.array + self.point, [r + self.point for r in self.rects]
+        )
+
+    def test_sub(self):
+        self.assert_matches_scalar(self.array - 4, [r - 4 for r in self.rects])
+        self.assert_matches_scalar(
+            self.array - self.point, [r - self.point for r in self.rects]
+        )
+
+    def test_mul(self):
+        self.assert_matches_scalar(self.array * 4, [r * 4 for r in self.rects])
+        self.assert_matches_scalar(
+            self.array * self.point, [r * self.point for r in self.rects]
+        )
+
+    def test_div(self):
+        self.assert_matches_scalar(self.array / 4, [r / 4 for r in self.rects])
+        self.assert_matches_scalar(
+            self.array / self.point, [r / self.point for r in self.rects]
+        )
+
+    def test_bad_operand(self):
+        with self.assertRaises(ValueError):
+            self.array + "4"
+
+    def test_eq(self):
+        self.assertTrue(self.array.as_int() == self.array.as_int().as_float())
+        self.assertFalse(self.array == self.array + 1)
+
+    def runTest(self):
+        self.test_add()
+        self.test_sub()
+        self.test_mul()
+        self.test_div()
+        self.test_bad_operand()
+        self.test_eq()
+
+
+class RectangleArrayClippingTestCase(TestCase):
+    def setUp(self) -> None:
+        self.rectangles = [
+            Rectangle.from_xyxy(0, 0, 4, 4),
+            Rectangle.from_xyxy(2, -1, 6, 3),
+            Rectangle.from_xyxy(4, 1, 5, 2),
+            Rectangle.from_xyxy(10, 10, 12, 12),
+            Rectangle.from_xyxy(3, 3, 2, 2),
+        ]
+        self.array = RectangleArray.from_rectangles(self.rectangles)
+        self.bounds = Rectangle.from_xyxy(0, 0, 4, 4)
+
+    def test_intersection(self):
+        self.assertEqual(
+            self.array.intersection(self.bounds).to_rectangles(),
+            [rect.intersection(self.bounds) for rect in self.rectangles],
+        )
+        others = self.array[::-1]
+        self.assertEqual(
+            self.array.intersection(others).to_rectangles(),
+            [a.intersection(b) for a, b in zip(self.rectangles, others)],
+        )
+        self.assertEqual(
+            self.array.clip_to(self.bounds).is_empty.tolist(),
+            [rect.clip_to(self.bounds).is_empty for rect in self.rectangles],
+        )
+
+    def test_union_bounds(self):
+        others = self.array[::-1]
+        self.assertEqual(
+            self.array.union_bounds(others).to_rectangles(),
+            [a.union_bounds(b) for a, b in zip(self.rectangles, others)],
+        )
+        self.assertEqual(
+            self.array.union_bounds(self.rectangles[-1]).to_rectangles(),
+            [rect.union_bounds(self.rectangles[-1]) for rect in self.rectangles],
+        )
+        self.assertEqual(self.array.bounds(), Rectangle.from_xyxy(0, -1, 12, 12))
+        with self.assertRaises(ValueError):
+            self.array[4:].bounds()
+        first = Rectangle.from_xyxy(5, 5, 1, 1)
+        second = Rectangle.from_xyxy(3, 3, 2, 9)
+        self.assertEqual(
+            RectangleArray.from_rectangles([first]).union_bounds(second)[0],
+            first.union_bounds(second),
+        )
+        self.assertEqual(first.union_bounds(second), first)
+
+    def test_group_bounds(self):
+        labels, bounds = self.array.group_bounds(np.array([7, 3, 7, 3, 3]))
+        self.assertEqual(labels.tolist(), [3, 7])
+        self.assertEqual(
+            bounds.to_rectangles(),
+            [Rectangle.from_xyxy(2, -1, 12, 12), Rectangle.from_xyxy(0, 0, 5, 4)],
+        )
+        labels, bounds = self.array[4:].group_bounds(np.array([1]))
+        self.assertEqual((len(labels), len(bounds)), (0, 0))
+
+    def test_contains(self):
+        points = [Point(4, 0), Point(5, 1), Point(4, 1.5), Point(11, 12), Point(2, 2)]
+        self.assertEqual(
+            self.array.contains(Point(4, 1)).tolist(),
+            [rect.contains(Point(4, 1)) for rect in self.rectangles],
+        )
+        self.assertEqual(
+            self.array.contains(PointArray.from_points(points)).tolist(),
+            [rect.contains(point) for rect, point in zip(self.rectangles, points)],
+        )
+        others = self.array[::-1]
+        self.assertEqual(
+            others.contains(self.array).tolist(),
+            [b.contains(a) for a, b in zip(self.rectangles, others)],
+        )
+        self.assertEqual(
+            self.array.contains(Rectangle.from_xyxy(4, 1, 4, 2)).tolist(),
+            [True, True, True, False, False],
+        )
+        with self.assertRaises(ValueError):
+            self.array.contains(1)
+
+    def runTest(self):
+        self.test_intersection()
+        self.test_union_bounds()
+        self.test_group_bounds()
+        self.test_contains()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(RectangleArrayInitializationTestCase())
+    suite.addTest(RectangleArrayPropertiesTestCase())
+    suite.addTest(RectangleArrayExportingTestCase())
+    suite.addTest(RectangleArrayOpsTestCase())
+    suite.addTest(RectangleArrayClippingTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
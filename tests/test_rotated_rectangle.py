@@ -0,0 +1,163 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+import math
+import numpy as np
+from data_types.point import Point
+from data_types.point_array import PointArray
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+from data_types.rotated_rectangle import RotatedRectangle
+from data_types.rotated_rectangle_array import RotatedRectangleArray
+
+
+def random_rotated(generator, count):
+    return RotatedRectangleArray(
+        np.concatenate(
+            (
+                generator.uniform(0, 40, size=(count, 2)),
+                generator.uniform(1, 20, size=(count, 2)),
+                generator.uniform(-math.pi, math.pi, size=(count, 1)),
+            ),
+            axis=1,
+        )
+    )
+
+
+class RotatedRectangleTestCase(TestCase):
+    def setUp(self) -> None:
+        self.diamond = RotatedRectangle.from_cxcywha(0, 0, 2, 2, math.pi / 4)
+
+    def test_geometry(self):
+        self.assertEqual(self.diamond.area, 4)
+        bounds = self.diamond.bounding_rectangle()
+        self.assertAlmostEqual(bounds.left, -math.sqrt(2))
+        self.assertAlmostEqual(bounds.bottom, math.sqrt(2))
+        self.assertAlmostEqual(self.diamond.to_polygon().area, 4)
+        self.assertEqual(
+            list(self.diamond.to_cxcywha().values()), [0, 0, 2, 2, math.pi / 4]
+        )
+
+    def test_rectangle_conversions(self):
+        rect = Rectangle.from_xyxy(1, 2, 5, 8)
+        rotated = RotatedRectangle.from_rectangle(rect)
+        self.assertEqual(rotated, RotatedRectangle(Point(3.0, 5.0), 4, 6, 0.0))
+        self.assertEqual(rotated.bounding_rectangle(), rect)
+
+    def test_contains(self):
+        self.assertTrue(self.diamond.contains(Point(0, 1.4)))
+        self.assertFalse(self.diamond.contains(Point(0.9, 0.9)))
+        with self.assertRaises(ValueError):
+            self.diamond.contains(Rectangle.from_xyxy(0, 0, 1, 1))
+
+    def test_iou(self):
+        square = RotatedRectangle.from_cxcywha(0, 0, 2, 2, 0)
+        self.assertAlmostEqual(square.iou(self.diamond), math.sqrt(0.5))
+        self.assertAlmostEqual(self.diamond.iou(self.diamond), 1)
+        a = Rectangle.from_xyxy(0, 0, 3, 5)
+        b = Rectangle.from_xyxy(1, 2, 6, 4)
+        self.assertAlmostEqual(
+            RotatedRectangle.from_rectangle(a).iou(RotatedRectangle.from_rectangle(b)),
+            a.iou(b),
+        )
+        with self.assertRaises(ValueError):
+            square.iou(a)
+
+    def test_iou_parallel_edges(self):
+        for cx, cy, w, h, angle in (
+            (5.2915, 0.739, 1.0995, 1.2216, 0.1333),
+            (
+                0.21636509855024078,
+                9.61031280239611,
+                0.7774579120961576,
+                0.6858427466366476,
+                0.6615456164784669,
+            ),
+        ):
+            first = RotatedRectangle.from_cxcywha(cx, cy, w, h, angle)
+            second = RotatedRectangle.from_cxcywha(cx, cy, h, w, angle + math.pi / 2)
+            self.assertAlmostEqual(first.iou(second), 1)
+            self.assertAlmostEqual(second.iou(first), 1)
+
+    def runTest(self):
+        self.test_geometry()
+        self.test_rectangle_conversions()
+        self.test_contains()
+        self.test_iou()
+        self.test_iou_parallel_edges()
+
+
+class RotatedRectangleArrayTestCase(TestCase):
+    def setUp(self) -> None:
+        generator = np.random.default_rng(0)
+        self.first = random_rotated(generator, 200)
+        self.second = random_rotated(generator, 200)
+        self.second.cxcywha[:20] = self.first.cxcywha[:20]
+        self.points = PointArray(generator.uniform(0, 40, size=(200, 2)))
+
+    def test_round_trip(self):
+        rectangles = self.first.to_rotated_rectangles()
+        self.assertEqual(
+            RotatedRectangleArray.from_rotated_rectangles(rectangles), self.first
+        )
+        self.assertEqual(self.first[3], rectangles[3])
+        self.assertEqual(self.first[5:7].to_rotated_rectangles(), rectangles[5:7])
+        self.assertEqual(self.first.area.tolist(), [r.area for r in rectangles])
+
+    def test_conversions(self):
+        rectangles = self.first.to_rotated_rectangles()
+        corners = self.first.corners()
+        for row, rect in zip(corners.tolist(), rectangles):
+            for (x, y), point in zip(row, rect.corners()):
+                self.assertAlmostEqual(x, point.x)
+                self.assertAlmostEqual(y, point.y)
+        np.testing.assert_allclose(
+            self.first.to_polygons().area, self.first.area, rtol=1e-12
+        )
+        np.testing.assert_allclose(
+            self.first.bounding_rectangles().xyxy,
+            RectangleArray.from_rectangles(
+                [rect.bounding_rectangle() for rect in rectangles]
+            ).xyxy,
+        )
+        axis_aligned = RectangleArray(np.array([[0, 0, 4, 2], [1, 1, 2, 5]]))
+        rotated = RotatedRectangleArray.from_rectangles(axis_aligned)
+        self.assertEqual(rotated.bounding_rectangles(), axis_aligned.as_float())
+
+    def test_contains(self):
+        rectangles = self.first.to_rotated_rectangles()
+        self.assertEqual(
+            self.first.contains(self.points).tolist(),
+            [rect.contains(point) for rect, point in zip(rectangles, self.points)],
+        )
+        self.assertEqual(
+            self.first.contains(Point(20, 20)).tolist(),
+            [rect.contains(Point(20, 20)) for rect in rectangles],
+        )
+
+    def test_iou(self):
+        iou = self.first.iou(self.second)
+        expected = [
+            a.iou(b) for a, b in zip(self.first.to_rotated_rectangles(), self.second)
+        ]
+        np.testing.assert_allclose(iou, expected, atol=1e-9)
+        np.testing.assert_allclose(iou[:20], 1.0)
+        self.assertGreater((iou[20:] > 0).sum(), 0)
+        with self.assertRaises(ValueError):
+            self.first.iou(self.second[:10])
+
+    def runTest(self):
+        self.test_round_trip()
+        self.test_conversions()
+        self.test_contains()
+        self.test_iou()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(RotatedRectangleTestCase())
+    suite.addTest(RotatedRectangleArrayTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
@@ -0,0 +1,28 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+from spatial.rtree import RTree
+from spatial_cases import SpatialIndexQueryCases, SpatialIndexUpdateCases
+
+
+class RTreeQueryTestCase(SpatialIndexQueryCases, TestCase):
+    def build_rectangles(self, rectangles):
+        return RTree.from_rectangles(rectangles, node_capacity=8)
+
+    def build_points(self, points):
+        return RTree.from_points(points)
+
+
+class RTreeUpdateTestCase(SpatialIndexUpdateCases, TestCase):
+    def build_rectangles(self, rectangles):
+        return RTree.from_rectangles(rectangles, node_capacity=4)
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(RTreeQueryTestCase())
+    suite.addTest(RTreeUpdateTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
@@ -0,0 +1,133 @@
+from unittest import TextTestRunner, TestCase, TestSuite
+import math
+import numpy as np
+from data_types.rectangle import Rectangle
+from data_types.rectangle_array import RectangleArray
+from ops.statistics import RectangleStatistics, RunningMoments
+
+
+def random_rectangles(generator, count):
+    xy = generator.uniform(-50, 500, size=(count, 2))
+    wh = generator.uniform(-5, 200, size=(count, 2))
+    wh[:5] = (10, 0)
+    return RectangleArray(np.concatenate((xy, xy + wh), axis=1))
+
+
+class RunningMomentsTestCase(TestCase):
+    def test_update_and_merge(self):
+        values = np.random.default_rng(0).normal(3, 2, size=101)
+        scalar = RunningMoments()
+        for value in values.tolist():
+            scalar.update(value)
+        left, right = RunningMoments(), RunningMoments()
+        left.update_array(values[:40])
+        right.update_array(values[40:])
+        left.merge(right)
+        for moments in (scalar, left):
+            self.assertEqual(moments.count, 101)
+            self.assertAlmostEqual(moments.mean, values.mean())
+            self.assertAlmostEqual(moments.variance, values.var())
+        empty = RunningMoments()
+        empty.merge(RunningMoments())
+        self.assertEqual((empty.count, empty.std), (0, 0.0))
+
+    def runTest(self):
+        self.test_update_and_merge()
+
+
+class RectangleStatisticsTestCase(TestCase):
+    def setUp(self) -> None:
+        self.rectangles = random_rectangles(np.random.default_rng(1), 500)
+
+    def assert_snapshots_equal(self, first, second):
+        for name in ("count", "empty", "area_counts", "aspect_counts", "extent"):
+            self.assertEqual(first[name], second[name])
+        for name in (
+            "mean_width",
+            "std_width",
+            "mean_height",
+            "std_height",
+            "mean_area",
+        ):
+            self.assertAlmostEqual(first[name], second[name])
+
+    def test_matches_direct_computation(self):
+        statistics = RectangleStatistics.from_rectangles(self.rectangles, chunk_size=64)
+        snapshot = statistics.snapshot()
+        kept = self.rectangles[~self.rectangles.is_empty]
+        self.assertEqual(snapshot["empty"], int(self.rectangles.is_empty.sum()))
+        self.assertEqual(snapshot["count"], len(kept))
+        self.assertAlmostEqual(snapshot["mean_width"], kept.width.mean())
+        self.assertAlmostEqual(snapshot["std_height"], kept.height.std())
+        self.assertAlmostEqual(snapshot["mean_area"], kept.area.mean())
+        self.assertEqual(snapshot["extent"], kept.bounds())
+        self.assertEqual(sum(snapshot["area_counts"]), len(kept))
+        edges = (-np.inf,) + snapshot["area_edges"] + (np.inf,)
+        expected = [
+            int(((kept.area >= low) & (kept.area < high)).sum())
+            for low, high in zip(edges[:-1], edges[1:])
+        ]
+        self.assertEqual(list(snapshot["area_counts"]), expected)
+        with np.errstate(divide="ignore"):
+            aspect = kept.width / kept.height
+        self.assertEqual(
+            snapshot["aspect_counts"][-1],
+            int((aspect >= snapshot["aspect_edges"][-1]).sum()),
+        )
+        self.assertGreaterEqual(snapshot["aspect_counts"][-1], 5)
+
+    def test_scalar_and_batched_paths_agree(self):
+        scalar = RectangleStatistics()
+        for rect in self.rectangles:
+            scalar.update(rect)
+        batched = RectangleStatistics.from_rectangles(self.rectangles.to_rectangles())
+        self.assert_snapshots_equal(scalar.snapshot(), batched.snapshot())
+        with self.assertRaises(ValueError):
+            scalar.update(self.rectangles)
+
+    def test_merge(self):
+        whole = RectangleStatistics.from_rectangles(self.rectangles)
+        parts = [
+            RectangleStatistics.from_rectangles(self.rectangles[start : start + 128])
+            for start in range(0, len(self.rectangles), 128)
+        ]
+        merged = RectangleStatistics()
+        for part in parts:
+            merged.merge(part)
+        self.assert_snapshots_equal(whole.snapshot(), merged.snapshot())
+        with self.assertRaises(ValueError):
+            merged.merge(RectangleStatistics(area_edges=(1, 10)))
+
+    def test_empty_and_edges(self):
+        snapshot = RectangleStatistics().snapshot()
+        self.assertEqual((snapshot["count"], snapshot["extent"]), (0, None))
+        statistics = RectangleStatistics(area_edges=(10, 100), aspect_edges=(1,))
+        statistics.update(Rectangle.from_xyxy(0, 0, 5, 5))
+        statistics.update(Rectangle.from_xyxy(0, 0, 20, 1))
+        statistics.update(Rectangle.from_xyxy(0, 0, 1, -1))
+        snapshot = statistics.snapshot()
+        self.assertEqual(snapshot["area_counts"], (0, 2, 0))
+        self.assertEqual(snapshot["aspect_counts"], (0, 2))
+        self.assertEqual(snapshot["empty"], 1)
+        self.assertEqual(snapshot["extent"], Rectangle.from_xyxy(0, 0, 20, 5))
+        self.assertTrue(math.isclose(snapshot["mean_area"], 22.5))
+        with self.assertRaises(ValueError):
+            RectangleStatistics(area_edges=(10, 1))
+
+    def runTest(self):
+        self.test_matches_direct_computation()
+        self.test_scalar_and_batched_paths_agree()
+        self.test_merge()
+        self.test_empty_and_edges()
+
+
+def suite():
+    suite = TestSuite()
+    suite.addTest(RunningMomentsTestCase())
+    suite.addTest(RectangleStatisticsTestCase())
+    return suite
+
+
+if __name__ == "__main__":
+    runner = TextTestRunner()
+    runner.run(suite())
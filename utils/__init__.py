@@ -0,0 +1,12 @@
+from utils.lazy_import import lazy_exports
+
+_EXPORTS = {
+    "add_prefix_to_dict_keys": ".dict_utils",
+    "add_suffix_to_dict_keys": ".dict_utils",
+    "as_coordinate_array": ".array_utils",
+    "is_int_array": ".array_utils",
+    "lazy_exports": ".lazy_import",
+}
+
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
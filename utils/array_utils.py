@@ -0,0 +1,24 @@
+from typing import Any
+import numpy as np
+
+INT_DTYPE = np.dtype(np.int64)
+FLOAT_DTYPE = np.dtype(np.float64)
+
+
+def as_coordinate_array(values: Any, columns: int) -> np.ndarray:
+    array = np.asarray(values)
+    if array.size == 0:
+        array = array.reshape(0, columns)
+    if array.ndim != 2 or array.shape[1] != columns:
+        raise ValueError(
+            f"Expected coordinates of shape (N,{columns}), got shape {array.shape}"
+        )
+    if array.dtype.kind in "biu":
+        array = array.astype(INT_DTYPE, copy=False)
+    elif array.dtype != FLOAT_DTYPE:
+        array = array.astype(FLOAT_DTYPE)
+    return array
+
+
+def is_int_array(array: np.ndarray) -> bool:
+    return array.dtype.kind in "biu"
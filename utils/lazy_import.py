@@ -0,0 +1,22 @@
+import importlib
+import sys
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> tuple:
+    namespace = sys.modules[package].__dict__
+    submodules = {module.lstrip(".") for module in exports.values()}
+
+    def __getattr__(name: str) -> object:
+        if name in exports:
+            value = getattr(importlib.import_module(exports[name], package), name)
+        elif name in submodules:
+            value = importlib.import_module(f".{name}", package)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports) | submodules)
+
+    return __getattr__, __dir__